@@ -30,6 +30,9 @@ instance_id,bin_capacity,bins_array,method,time_taken
 from typing import List
 
 from src.helpers.bin_packing_helper import BinPackingAbstractClass
+from src.helpers.bin_packing_branch_bound_helper import bin_packing_branch_and_bound
+from src.helpers.bin_packing_heuristics_helper import pack_decreasing
+from src.helpers.subset_sum_helper import exact_fill_combinations
 
 
 class BinPacking(BinPackingAbstractClass):
@@ -41,20 +44,26 @@ class BinPacking(BinPackingAbstractClass):
     of the CSV file just focus on the logic
     """
 
+    # "bfd" (Best-Fit-Decreasing) or "ffd" (First-Fit-Decreasing) for binpacking_simple
+    simple_heuristic = "bfd"
+
     def binpacking_backtracing(
         self, bin_capacity: int, clauses: List[int]
     ) -> List[List[int]]:
-        pass
+        # exact branch and bound, one bin per returned list, FFD-started incumbent once its budget runs out
+        return bin_packing_branch_and_bound(bin_capacity, clauses, self.max_search_nodes, self.search_time_limit)
 
     def binpacking_bruteforce(
         self, bin_capacity: int, clauses: List[int]
     ) -> List[List[int]]:
-        pass
+        # every combination of items that fills a bin exactly, e.g. [8, 2] and [7, 3] for capacity 10
+        return exact_fill_combinations(bin_capacity, clauses)
 
     def binpacking_simple(
         self, bin_capacity: int, clauses: List[int]
     ) -> List[List[int]]:
-        pass
+        # O(n log n) heuristic, not always optimal, the results add its gap to the L2 lower bound
+        return pack_decreasing(bin_capacity, clauses, self.simple_heuristic)
 
     def binpacking_bestcase(
         self, bin_capacity: int, clauses: List[int]
@@ -61,6 +61,8 @@ import itertools
 from typing import List, Tuple
 
 from src.helpers.hamilton_cycle_helper import HamiltonCycleAbstractClass
+from src.helpers.hamilton_backtracking_helper import hamilton_backtrack_search
+from src.helpers.held_karp_helper import hamilton_held_karp
 
 
 class HamiltonCycleColoring(HamiltonCycleAbstractClass):
@@ -77,7 +79,7 @@ class HamiltonCycleColoring(HamiltonCycleAbstractClass):
         self, vertices: set, edges: List[Tuple[int]]
     ) -> Tuple[bool, List[int], bool, List[int], int]:        
         # return (path_exists, path, cycle_exists, cycle, largest)
-        pass
+        return hamilton_backtrack_search(vertices, edges)
 
     def hamilton_bruteforce(
         self, vertices: set, edges: List[Tuple[int]]
@@ -92,4 +94,5 @@ class HamiltonCycleColoring(HamiltonCycleAbstractClass):
     def hamilton_bestcase(
         self, vertices: set, edges: List[Tuple[int]]
     ) -> Tuple[bool, List[int], bool, List[int], int]:
-        pass
+        # exact Held-Karp subset DP, O(2^n * n) instead of trying all n! orders
+        return hamilton_held_karp(vertices, edges)
@@ -0,0 +1,94 @@
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+# every uint64 word holds the truth value of a formula under 64 consecutive assignments
+WORD_BITS = 64
+LOW_VARS = 6
+# upper bound on the bytes of one literal-mask tensor, chunks of assignments are sized to fit
+BATCH_TENSOR_BYTES = 32 * 2**20
+
+
+def _assignment_words(first_chunk: int, n_chunks: int, n_vars: int) -> np.ndarray:
+    """
+    (n_chunks, n_vars) words, bit j of word [c, v] is the value of variable v + 1 under assignment
+    (first_chunk + c) * 64 + j, where bit v of an assignment number is the value of variable v + 1.
+    """
+    words = np.zeros((n_chunks, n_vars), dtype=np.uint64)
+    j = np.arange(WORD_BITS, dtype=np.uint64)
+    for v in range(min(n_vars, LOW_VARS)):
+        # the low variables follow the same pattern in every chunk
+        words[:, v] = np.bitwise_or.reduce(((j >> np.uint64(v)) & np.uint64(1)) << j)
+    chunks = np.arange(first_chunk, first_chunk + n_chunks, dtype=np.uint64)
+    for v in range(LOW_VARS, n_vars):
+        high = (chunks >> np.uint64(v - LOW_VARS)) & np.uint64(1)
+        words[:, v] = np.where(high == 1, ~np.uint64(0), np.uint64(0))
+    return words
+
+
+def pad_clauses(clause_lists: Sequence[Sequence[Sequence[int]]]) -> np.ndarray:
+    """
+    (instances, clauses, literals) int64 tensor, zero where an instance has fewer clauses or a clause
+    fewer literals.
+    """
+    n_clauses = max((len(clauses) for clauses in clause_lists), default=0)
+    width = max((len(clause) for clauses in clause_lists for clause in clauses), default=0)
+    literals = np.zeros((len(clause_lists), n_clauses, width), dtype=np.int64)
+    for i, clauses in enumerate(clause_lists):
+        for c, clause in enumerate(clauses):
+            literals[i, c, :len(clause)] = clause
+    return literals
+
+
+def batch_brute_force(n_vars: int, clause_lists: Sequence[Sequence[Sequence[int]]]) -> List[Tuple[bool, Dict[int, int]]]:
+    """
+    Brute force over all 2^n_vars assignments of many formulas with the same variable count at once.
+    Literal masks are ORed over each clause and ANDed over each formula, 64 assignments per word,
+    and formulas drop out of the remaining chunks as soon as one assignment satisfies them.
+    Returns (ok, {var: 0/1}) per formula with the lowest satisfying assignment number.
+    """
+    literals = pad_clauses(clause_lists)
+    n_formulas = len(clause_lists)
+    results: List[Tuple[bool, Dict[int, int]]] = [(False, {})] * n_formulas
+    if n_formulas == 0:
+        return results
+    if literals.shape[1] == 0:
+        # no clauses at all, the first assignment already satisfies every formula
+        return [(True, {v + 1: 0 for v in range(n_vars)}) for _ in range(n_formulas)]
+
+    variables = np.abs(literals) - 1
+    positive = literals > 0
+    padding = literals == 0
+    # clauses that exist in the formula, padded clauses never falsify it
+    real_clause = ~padding.all(axis=2)
+
+    total = 1 << n_vars
+    n_chunks = max(1, total // WORD_BITS)
+    valid_bits = np.uint64((1 << total) - 1) if total < WORD_BITS else ~np.uint64(0)
+
+    open_formulas = np.arange(n_formulas)
+    per_chunk_bytes = max(1, literals[0].size * 8)
+    chunk = 0
+    while chunk < n_chunks and open_formulas.size:
+        step = max(1, min(n_chunks - chunk, BATCH_TENSOR_BYTES // (per_chunk_bytes * open_formulas.size)))
+        words = _assignment_words(chunk, step, max(n_vars, 1))
+        var = variables[open_formulas]
+        # (chunks, formulas, clauses, literals) truth masks of every literal
+        values = words[:, np.maximum(var, 0)]
+        masks = np.where(positive[open_formulas], values, ~values)
+        masks[:, padding[open_formulas]] = 0
+        clause_masks = np.bitwise_or.reduce(masks, axis=3)
+        clause_masks[:, ~real_clause[open_formulas]] = ~np.uint64(0)
+        satisfied = np.bitwise_and.reduce(clause_masks, axis=2) & valid_bits
+
+        hit = satisfied != 0
+        solved = hit.any(axis=0)
+        first_chunk = hit.argmax(axis=0)
+        for formula_at in np.flatnonzero(solved):
+            word = int(satisfied[first_chunk[formula_at], formula_at])
+            number = (chunk + int(first_chunk[formula_at])) * WORD_BITS + (word & -word).bit_length() - 1
+            assignment = {v + 1: (number >> v) & 1 for v in range(n_vars)}
+            results[open_formulas[formula_at]] = (True, assignment)
+        open_formulas = open_formulas[~solved]
+        chunk += step
+    return results
@@ -0,0 +1,97 @@
+import contextlib
+import gc
+import math
+import os
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+# extra CSV columns written in benchmark timing mode, the time column itself holds the median
+BENCHMARK_COLUMNS = ["time_min", "time_iqr", "repeats"]
+
+# a single timed sample shorter than this is dominated by timer resolution, calls are batched up
+MIN_SAMPLE_SECONDS = 2e-4
+
+
+class BenchmarkTiming(NamedTuple):
+    median: float
+    minimum: float
+    iqr: float
+    repeats: int
+    loops: int
+
+    def columns(self) -> List[Any]:
+        return [self.minimum, self.iqr, self.repeats]
+
+
+class BenchmarkOptions(NamedTuple):
+    """
+    "benchmark" entry of the "Execution" block, every field optional.
+    """
+    warmup: int = 1
+    rel_error: float = 0.02
+    min_repeats: int = 5
+    max_repeats: int = 1000
+    max_seconds: float = 2.0
+
+    @classmethod
+    def from_options(cls, options: Optional[Dict[str, Any]]) -> Optional["BenchmarkOptions"]:
+        if options is None:
+            return None
+        return cls(**options)
+
+
+def _relative_error(samples: List[float]) -> float:
+    # standard error of the median of roughly normal samples, relative to the median
+    median = float(np.median(samples))
+    if median <= 0:
+        return 0.0
+    return 1.2533 * float(np.std(samples, ddof=1)) / math.sqrt(len(samples)) / median
+
+
+def measure(fn: Callable, *args, options: BenchmarkOptions = BenchmarkOptions()) -> BenchmarkTiming:
+    """
+    Times fn(*args) after options.warmup untimed calls, repeating until the median is known to
+    options.rel_error, or the repeat or time budget runs out. Calls shorter than MIN_SAMPLE_SECONDS
+    are batched into loops per sample. The garbage collector is off inside timed sections and the
+    repeated calls print nothing.
+    """
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        return _measure(fn, args, options)
+
+
+def _measure(fn: Callable, args, options: BenchmarkOptions) -> BenchmarkTiming:
+    for _ in range(options.warmup):
+        fn(*args)
+
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        deadline = time.perf_counter() + options.max_seconds
+        t0 = time.perf_counter()
+        fn(*args)
+        first = time.perf_counter() - t0
+        loops = max(1, math.ceil(MIN_SAMPLE_SECONDS / first)) if first > 0 else 1000
+        # a call long enough to be timed on its own is already the first sample
+        samples: List[float] = [first] if loops == 1 else []
+        while True:
+            if samples:
+                n = len(samples)
+                if n >= options.max_repeats:
+                    break
+                if n >= 2 and time.perf_counter() >= deadline:
+                    break
+                if n >= options.min_repeats and _relative_error(samples) <= options.rel_error:
+                    break
+            t0 = time.perf_counter()
+            for _ in range(loops):
+                fn(*args)
+            samples.append((time.perf_counter() - t0) / loops)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    q1, median, q3 = np.percentile(samples, [25, 50, 75])
+    return BenchmarkTiming(float(median), float(min(samples)), float(q3 - q1), len(samples), loops)
@@ -0,0 +1,92 @@
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+
+def check_items(bin_capacity: int, items: Sequence[int]):
+    if bin_capacity <= 0:
+        raise ValueError(f"Bin capacity must be positive, got {bin_capacity}")
+    if len(items) and (max(items) > bin_capacity or min(items) < 0):
+        raise ValueError(f"Every item has to fit in a bin of capacity {bin_capacity}")
+
+
+def lower_bound_l1(bin_capacity: int, items: Sequence[int]) -> int:
+    """
+    Continuous bound: total size over capacity, rounded up.
+    """
+    return -(-int(np.sum(items, dtype=np.int64)) // bin_capacity)
+
+
+def lower_bound_l2(bin_capacity: int, items: Sequence[int]) -> int:
+    """
+    Martello-Toth L2 bound. For every threshold K <= C/2, items bigger than C - K need a bin each,
+    items in (C/2, C - K] need a bin each, and items in [K, C/2] only fit in what those bins leave.
+    """
+    sizes = np.sort(np.asarray(items, dtype=np.int64))
+    if sizes.size == 0:
+        return 0
+    prefix = np.concatenate(([0], np.cumsum(sizes)))
+    half = bin_capacity // 2
+
+    thresholds = np.unique(np.concatenate(([0], sizes[sizes <= half])))
+    # index boundaries in the ascending order: [K, C/2] then (C/2, C - K] then (C - K, C]
+    start_small = np.searchsorted(sizes, thresholds, side="left")
+    start_big = np.searchsorted(sizes, half, side="right")
+    start_huge = np.searchsorted(sizes, bin_capacity - thresholds, side="right")
+
+    n_huge = sizes.size - start_huge
+    n_big = start_huge - start_big
+    big_sum = prefix[start_huge] - prefix[start_big]
+    small_sum = prefix[start_big] - prefix[start_small]
+    overflow = small_sum - (n_big * bin_capacity - big_sum)
+    extra = np.maximum(0, -(-overflow // bin_capacity))
+    return int(max(np.max(n_huge + n_big + extra), lower_bound_l1(bin_capacity, sizes)))
+
+
+def martello_toth_reduction(bin_capacity: int, items: Sequence[int]) -> Tuple[List[List[int]], List[int]]:
+    """
+    Martello-Toth reduction: returns (bins, rest) where an optimal packing of rest plus the fixed
+    bins is an optimal packing of items. Takes the largest free item j with the largest free item k
+    that fits next to it whenever no set of other free items fills the room next to j more than k
+    does, any packing can then swap that set for k. Repeats until no bin is fixed.
+    """
+    free = sorted((int(item) for item in items if item > 0), reverse=True)
+    zeros = [0] * (len(items) - len(free))
+    bins: List[List[int]] = []
+    changed = True
+    while changed:
+        changed = False
+        at = 0
+        while at < len(free):
+            room = bin_capacity - free[at]
+            others = free[:at] + free[at + 1:]
+            fitting = [item for item in others if item <= room]
+            if not fitting:
+                bins.append([free.pop(at)])
+                changed = True
+                continue
+            # bit s of reachable is set when some set of fitting items sums to s
+            reachable = 1
+            mask = (1 << (room + 1)) - 1
+            for item in fitting:
+                reachable = (reachable | reachable << item) & mask
+            if reachable.bit_length() - 1 == fitting[0]:
+                largest = free.pop(at)
+                free.remove(fitting[0])
+                bins.append([largest, fitting[0]])
+                changed = True
+                continue
+            at += 1
+    if bins:
+        bins[0] += zeros
+    else:
+        free += zeros
+    return bins, free
+
+
+def lower_bound_l3(bin_capacity: int, items: Sequence[int]) -> int:
+    """
+    The bins fixed by martello_toth_reduction plus the L2 bound of what it leaves, never below L2.
+    """
+    bins, rest = martello_toth_reduction(bin_capacity, items)
+    return max(len(bins) + lower_bound_l2(bin_capacity, rest), lower_bound_l2(bin_capacity, items))
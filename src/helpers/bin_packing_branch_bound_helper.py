@@ -0,0 +1,192 @@
+import sys
+import time
+from bisect import bisect_left
+from collections import Counter
+from typing import List, Optional, Sequence
+
+from src.helpers.bin_packing_bounds_helper import (
+    check_items, lower_bound_l1, lower_bound_l2, martello_toth_reduction
+)
+from src.helpers.bin_packing_heuristics_helper import first_fit_decreasing
+
+# nodes the search expands before it settles for its incumbent
+MAX_NODES = 20_000
+
+
+class Packing(list):
+    """
+    Bins of a packing, proven_optimal is False when the search ran out of budget before it could
+    rule out a packing with fewer bins.
+    """
+
+    def __init__(self, bins=(), proven_optimal: bool = True):
+        super().__init__(bins)
+        self.proven_optimal = proven_optimal
+
+
+class _BudgetExhausted(Exception):
+    pass
+
+
+class BinPackingBranchAndBound:
+    """
+    Exact minimum-bin packing that closes one bin at a time (bin completion).
+    The Martello-Toth reduction fixes the bins it can prove optimal first, the search packs the rest.
+    Each bin is opened by the largest item left, so two equivalent empty bins are never opened,
+    and is filled with one of the maximal sets of smaller items that still fit. Starts from the
+    First-Fit-Decreasing packing and stops as soon as it meets max(L1, L2). After max_nodes nodes
+    or time_limit seconds it returns the best packing found so far.
+    """
+
+    def __init__(self, bin_capacity: int, items: Sequence[int],
+                 max_nodes: int = MAX_NODES, time_limit: Optional[float] = None):
+        check_items(bin_capacity, items)
+        self.capacity = int(bin_capacity)
+        self.fixed, rest = martello_toth_reduction(self.capacity, items)
+        # the search only sees the items the reduction left
+        self.items = rest
+        self.total = sum(self.items)
+        self.lower_bound = lower_bound_l2(self.capacity, self.items)
+        self.best = first_fit_decreasing(self.capacity, self.items)
+        self.max_nodes = max_nodes
+        self.time_limit = time_limit
+        self.deadline = None
+        self.nodes = 0
+        self.proven_optimal = len(self.best) == self.lower_bound
+
+    def _waste_budget(self) -> int:
+        # free space a packing with one bin less than the incumbent can afford
+        return (len(self.best) - 1) * self.capacity - self.total
+
+    def _completions(self, largest: int, rest: List[int], max_waste: int) -> List[List[int]]:
+        """
+        Maximal sets of items from rest that fit next to largest, fullest first.
+        """
+        room = self.capacity - largest
+        counts = Counter(rest)
+        values = sorted((v for v in counts if v <= room), reverse=True)
+        if not values:
+            return [[]] if room <= max_waste else []
+
+        # dominance: an exact fit, or a bin that can only ever hold one more item
+        if room in counts:
+            return [[room]]
+        if len(rest) < 2 or rest[-1] + rest[-2] > room:
+            return [[values[0]]] if room - values[0] <= max_waste else []
+
+        # suffix[j] is the most the values from j on can add, used to drop sets that waste too much
+        suffix = [0] * (len(values) + 1)
+        for j in range(len(values) - 1, -1, -1):
+            suffix[j] = suffix[j + 1] + values[j] * counts[values[j]]
+
+        found = []
+        chosen: List[int] = []
+
+        def extend(j: int, left: int, skipped_below: int):
+            # values that no longer fit cannot be taken and cannot break maximality either
+            while j < len(values) and values[j] > left:
+                j += 1
+            # even taking everything that is left cannot waste little enough, or cannot squeeze
+            # the free space under an item that was skipped
+            floor = left - suffix[j]
+            if floor > max_waste or floor >= skipped_below:
+                return
+            if j == len(values):
+                # maximal: nothing that was left out still fits
+                if left < skipped_below:
+                    found.append(list(chosen))
+                return
+            value = values[j]
+            fit = min(counts[value], left // value)
+            for take in range(fit, -1, -1):
+                chosen.extend([value] * take)
+                if take == counts[value] or skipped_below < value:
+                    extend(j + 1, left - take * value, skipped_below)
+                else:
+                    extend(j + 1, left - take * value, value)
+                if take:
+                    del chosen[-take:]
+
+        extend(0, room, room + 1)
+        keys = sorted(counts)
+        found = [c for c in found if not self._dominated(c, room - sum(c), counts, keys)]
+        found.sort(key=sum, reverse=True)
+        return found
+
+    def _dominated(self, completion: List[int], left: int, counts: Counter, keys: List[int]) -> bool:
+        """
+        A completion is dominated when swapping one of its items, or a pair of them, for a single
+        bigger unused item still fits: any packing built on it can make that swap and lose nothing.
+        """
+        used = Counter(completion)
+
+        def smallest_unused_at_least(size: int) -> int:
+            for at in range(bisect_left(keys, size), len(keys)):
+                if counts[keys[at]] > used[keys[at]]:
+                    return keys[at]
+            return None
+
+        for i, b in enumerate(completion):
+            bigger = smallest_unused_at_least(b + 1)
+            if bigger is not None and bigger <= left + b:
+                return True
+            for other in completion[i + 1:]:
+                pair = b + other
+                bigger = smallest_unused_at_least(pair)
+                if bigger is not None and bigger <= left + pair:
+                    return True
+        return False
+
+    def _search(self, remaining: List[int], bins: List[List[int]], waste: int):
+        self.nodes += 1
+        if self.nodes > self.max_nodes or (
+                self.deadline is not None and self.nodes % 256 == 0 and time.perf_counter() > self.deadline):
+            raise _BudgetExhausted
+        if not remaining:
+            if len(bins) < len(self.best):
+                self.best = [list(b) for b in bins]
+            return
+        if len(bins) + lower_bound_l1(self.capacity, remaining) >= len(self.best):
+            return
+        if len(bins) + lower_bound_l2(self.capacity, remaining) >= len(self.best):
+            return
+
+        largest, rest = remaining[0], remaining[1:]
+        for completion in self._completions(largest, rest, self._waste_budget() - waste):
+            bin_waste = self.capacity - largest - sum(completion)
+            # the incumbent may have improved since the completions were listed
+            if waste + bin_waste > self._waste_budget():
+                continue
+            used = Counter(completion)
+            left = []
+            for item in rest:
+                if used[item]:
+                    used[item] -= 1
+                else:
+                    left.append(item)
+            bins.append([largest] + completion)
+            self._search(left, bins, waste + bin_waste)
+            bins.pop()
+            if len(self.best) == self.lower_bound:
+                return
+
+    def solve(self) -> Packing:
+        if not self.proven_optimal:
+            if self.time_limit is not None:
+                self.deadline = time.perf_counter() + self.time_limit
+            limit = sys.getrecursionlimit()
+            sys.setrecursionlimit(max(limit, len(self.items) + 100))
+            try:
+                self._search(self.items, [], 0)
+                self.proven_optimal = True
+            except _BudgetExhausted:
+                self.proven_optimal = len(self.best) == self.lower_bound
+            finally:
+                sys.setrecursionlimit(limit)
+        return Packing([list(b) for b in self.fixed] + self.best, self.proven_optimal)
+
+
+def bin_packing_branch_and_bound(bin_capacity: int, items: Sequence[int], max_nodes: int = MAX_NODES,
+                                 time_limit: Optional[float] = None) -> Packing:
+    return BinPackingBranchAndBound(bin_capacity, items, max_nodes, time_limit).solve()
+
@@ -1,61 +1,96 @@
-from abc import ABC, abstractmethod
-import os
-from src.helpers.dmaics_parser import parse_multi_instance_bin_packing
-from src.helpers.constants import RESULTS_FOLDER, CONFIGURATION_FILE_PATH
-from typing import List, Tuple, Dict, Any
-import json
-import csv
-import time
+from abc import abstractmethod
+from src.helpers.dmaics_parser import iter_multi_instance_bin_packing, parse_multi_instance_bin_packing
+from src.helpers.bin_packing_bounds_helper import lower_bound_l2
+from src.helpers.bin_packing_branch_bound_helper import MAX_NODES
+from src.helpers.instance_features_helper import bin_packing_features
+from src.helpers.solver_harness_helper import METHOD_LABELS, SolverHarnessAbstractClass
+from src.helpers.constants import RESULTS_FOLDER
+from typing import List, Dict, Any, Iterable
+import hashlib
+import numpy as np
 from src.helpers.project_selection_enum import ProjectSelection, SubProblemSelection
 
+# Auto packs bigger instances with Best-Fit-Decreasing instead of the exact branch and bound
+AUTO_EXACT_MAX_ITEMS = 200
 
-class BinPackingAbstractClass(ABC):
+# extra columns of the Simple results, written after the time: how far the heuristic can be off
+GAP_COLUMNS = ["l2_lower_bound", "gap"]
+# extra column of the Backtracking results: False when the search budget ran out first
+SEARCH_COLUMNS = ["proven_optimal"]
+
+
+class BinPackingAbstractClass(SolverHarnessAbstractClass):
+
+    result_header = ["instance_id", "bin_capacity", "bins_array", "method", "time_taken"]
+    solver_methods = {
+        SubProblemSelection.brute_force: "binpacking_bruteforce",
+        SubProblemSelection.btracking: "binpacking_backtracing",
+        SubProblemSelection.simple: "binpacking_simple",
+        SubProblemSelection.best_case: "binpacking_bestcase",
+    }
 
     def __init__(self, 
                     cnf_file_input_path: str,
                     result_file_name:str = "sat_solver_results",
                     results_folder_path: str = RESULTS_FOLDER):
-        self.cnf_file_input_path = cnf_file_input_path
-        self.results_folder_path = results_folder_path
-        self.result_file_name = result_file_name
-        self.config_path = CONFIGURATION_FILE_PATH
-        self.solution_instances = self.parse_input_file()
-        print(f"Parsed {len(self.solution_instances)} instances from {self.cnf_file_input_path}")
-        self.sub_problems = self.set_config()
-
-    def set_config(self):
-        if not os.path.exists(self.config_path):
-            raise Exception("Please make sure the configuration file exists!!!")
-        with open(self.config_path, mode = 'r' , encoding= 'utf-8') as conf_buffer:
-            data = json.load(conf_buffer)
-        data = data["Project Configuration"]
-        selection = data["Selection"]
-        sub_problem = data["Sub Problem"]
-        sub_probs = []
-        for sub_prob in sub_problem:
-            if sub_prob["value"] == SubProblemSelection.brute_force.value:
-                sub_probs.append(SubProblemSelection.brute_force)
-            elif sub_prob["value"] == SubProblemSelection.btracking.value:
-                sub_probs.append(SubProblemSelection.btracking)
-            elif sub_prob["value"] == SubProblemSelection.simple.value:
-                sub_probs.append(SubProblemSelection.simple)
-            elif sub_prob["value"] == SubProblemSelection.best_case.value:
-                sub_probs.append(SubProblemSelection.best_case)
-        return sub_probs
-        
+        super().__init__(cnf_file_input_path, result_file_name, results_folder_path)
+        search = self.execution.get("branch_and_bound", {})
+        self.max_search_nodes = search.get("max_nodes", MAX_NODES)
+        self.search_time_limit = search.get("time_limit")
+
     def parse_input_file(self):
-        return parse_multi_instance_bin_packing(self.cnf_file_input_path)
-    
-    def save_results(self, run_results: List[Any], sub_problem):
-        # Write to CSV
-        dir_name, file_name = os.path.split(self.cnf_file_input_path)
-        file_name_only, ext = os.path.splitext(file_name)
-        temp_result = os.path.join(self.results_folder_path, f"{sub_problem}_{file_name_only}_{self.result_file_name}.csv")
-        with open(temp_result, "w", newline="") as f:
-            w = csv.writer(f)
-            w.writerow(["instance_id", "bin_capacity", "bins_array", "method", "time_taken"])
-            w.writerows(run_results)
-        print(f"\nResults written to {temp_result}")
+        return list(enumerate(parse_multi_instance_bin_packing(self.cnf_file_input_path)))
+
+    def iter_input_file(self):
+        return enumerate(iter_multi_instance_bin_packing(self.cnf_file_input_path))
+
+    def instance_key(self, instance) -> bytes:
+        """
+        Canonical hash of an instance: its capacity and the sorted multiset of its items.
+        """
+        inst_id, clause = instance
+        items = np.sort(np.asarray(clause[1:], dtype=np.int64))
+        digest = hashlib.blake2b(np.int64(clause[0]).tobytes(), digest_size=16)
+        digest.update(items.tobytes())
+        return digest.digest()
+
+    def solve_instance(self, method, instance):
+        inst_id, clause = instance
+        # the parsed instances are views into one shared array, every call gets its own list of
+        # items so a solver that sorts them in place cannot change the input of later calls
+        return method(int(clause[0]), clause[1:].tolist())
+
+    def instance_features(self, instance) -> Dict[str, Any]:
+        inst_id, clause = instance
+        return bin_packing_features(int(clause[0]), clause[1:])
+
+    def route(self, features: Dict[str, Any]) -> str:
+        # the exact search stops as soon as its FFD start meets the L2 bound
+        if features["n_items"] <= AUTO_EXACT_MAX_ITEMS:
+            return "binpacking_backtracing"
+        return "binpacking_simple"
+
+    def csv_header(self, sub_problem: str) -> List[str]:
+        header = super().csv_header(sub_problem)
+        if sub_problem == SubProblemSelection.simple.name:
+            header[len(self.result_header):len(self.result_header)] = GAP_COLUMNS
+        elif sub_problem == SubProblemSelection.btracking.name:
+            header[len(self.result_header):len(self.result_header)] = SEARCH_COLUMNS
+        return header
+
+    def format_rows(self, instance, result, label: str, elapsed: float) -> Iterable[List[Any]]:
+        # one row per bin
+        inst_id, clause = instance
+        bin_capacity = int(clause[0])
+        extra = []
+        if label == METHOD_LABELS[SubProblemSelection.simple]:
+            lower_bound = lower_bound_l2(bin_capacity, clause[1:])
+            extra = [lower_bound, len(result) - lower_bound]
+        elif label == METHOD_LABELS[SubProblemSelection.btracking]:
+            # solvers that do not return a Packing leave it empty
+            extra = [getattr(result, "proven_optimal", "")]
+        for bin_items in result:
+            yield [inst_id, bin_capacity, bin_items, label, elapsed] + extra
     
     @abstractmethod
     def binpacking_backtracing(self, bin_capacity:int, clauses:List[int]) -> List[List[int]]:
@@ -72,75 +107,3 @@ class BinPackingAbstractClass(ABC):
     @abstractmethod
     def binpacking_bestcase(self, bin_capacity:int, clauses:List[int]) -> List[List[int]]:
         pass
-
-    def run(self):
-        results = []
-        
-        for inst_id, clause in enumerate(self.solution_instances):
-            bin_capacity = clause[0]
-            clauses = clause[1:]
-            if SubProblemSelection.brute_force in self.sub_problems:
-                t0 = time.perf_counter()
-                temp_results = self.binpacking_bruteforce(bin_capacity, clauses)
-                bt_time = time.perf_counter() - t0
-                for result in temp_results:
-                    results.append([inst_id, bin_capacity, result,"BruteForce", bt_time])
-        
-        if SubProblemSelection.brute_force in self.sub_problems:
-            self.save_results(results, SubProblemSelection.brute_force.name)
-            results = []
-
-        for inst_id, clause in enumerate(self.solution_instances):
-            bin_capacity = clause[0]
-            clauses = clause[1:]
-            if SubProblemSelection.btracking in self.sub_problems:
-                t0 = time.perf_counter()
-                temp_results = self.binpacking_backtracing(bin_capacity, clauses)
-                bt_time = time.perf_counter() - t0
-                for result in temp_results:
-                    results.append([inst_id, bin_capacity, result,"BackTracking", bt_time])
-        
-        if SubProblemSelection.btracking in self.sub_problems:
-            self.save_results(results, SubProblemSelection.btracking.name)
-            results = []
-
-        for inst_id, clause in enumerate(self.solution_instances):
-            bin_capacity = clause[0]
-            clauses = clause[1:]
-            if SubProblemSelection.simple in self.sub_problems:
-                t0 = time.perf_counter()
-                temp_results = self.binpacking_simple(bin_capacity, clauses)
-                bt_time = time.perf_counter() - t0
-                for result in temp_results:
-                    results.append([inst_id, bin_capacity, result,"Simple", bt_time])
-
-        
-        if SubProblemSelection.simple in self.sub_problems:
-            self.save_results(results, SubProblemSelection.simple.name)
-            results = []
-        
-
-        for inst_id, clause in enumerate(self.solution_instances):
-            bin_capacity = clause[0]
-            clauses = clause[1:]
-            if SubProblemSelection.best_case in self.sub_problems:
-                t0 = time.perf_counter()
-                temp_results = self.binpacking_bestcase(bin_capacity, clauses)
-                bt_time = time.perf_counter() - t0
-                for result in temp_results:
-                    results.append([inst_id, bin_capacity, result,"BestCase", bt_time])
-        
-        if SubProblemSelection.best_case in self.sub_problems:
-            self.save_results(results, SubProblemSelection.best_case.name)
-            results = []
-
-
-
-        
-
-
-    
-    
-
-
-    
\ No newline at end of file
@@ -0,0 +1,180 @@
+import gc
+from bisect import bisect_left, insort
+from contextlib import contextmanager
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from src.helpers.bin_packing_bounds_helper import check_items
+
+# first_fit_decreasing scans every open bin once per distinct item size up to this many
+# (distinct sizes x items), beyond it one tree walk per item is cheaper
+FFD_RUN_WORK = 2 * 10 ** 9
+
+
+@contextmanager
+def _gc_paused():
+    # a packing is up to a million small lists, the cyclic collector would rescan them over and over
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def _decreasing(items: Sequence[int]) -> List[int]:
+    return np.sort(np.asarray(items, dtype=np.int64))[::-1].tolist()
+
+
+def first_fit_decreasing(bin_capacity: int, items: Sequence[int]) -> List[List[int]]:
+    """
+    Places every item, largest first, in the first open bin that still has room for it.
+    Items of one size are placed together with numpy when there are few distinct sizes,
+    otherwise one at a time with a segment tree.
+    """
+    sizes = np.asarray(items, dtype=np.int64)
+    values, counts = np.unique(sizes, return_counts=True)
+    if len(values) * len(sizes) <= FFD_RUN_WORK:
+        return _first_fit_runs(bin_capacity, values[::-1].tolist(), counts[::-1].tolist())
+    return _first_fit_tree(bin_capacity, np.repeat(values, counts)[::-1])
+
+
+@_gc_paused()
+def _first_fit_runs(bin_capacity: int, values: List[int], counts: List[int]) -> List[List[int]]:
+    """
+    First fit over runs of equal items, values decreasing. Bins before the first one with room
+    for a value stay too full for the rest of its run, so a run fills the open bins that fit it
+    in index order, free // value items each, and spills into new bins of capacity // value items.
+    """
+    free = np.empty(0, dtype=np.int64)
+    # bin of every placed item and its size, in placement order
+    placed_bins: List[np.ndarray] = []
+    placed_sizes: List[np.ndarray] = []
+    for value, count in zip(values, counts):
+        placed_sizes.append(np.full(count, value, dtype=np.int64))
+        if value == 0:
+            # zero-size items fit in the first bin
+            if not free.size:
+                free = np.array([bin_capacity], dtype=np.int64)
+            placed_bins.append(np.zeros(count, dtype=np.int64))
+            continue
+        fitting = np.flatnonzero(free >= value)
+        if fitting.size:
+            takes = free[fitting] // value
+            total = np.cumsum(takes)
+            stop = int(np.searchsorted(total, count))
+            if stop < fitting.size:
+                fitting, takes = fitting[:stop + 1], takes[:stop + 1]
+                takes[stop] -= total[stop] - count
+            free[fitting] -= takes * value
+            placed_bins.append(np.repeat(fitting, takes))
+            count -= int(takes.sum())
+        if count:
+            per_bin = bin_capacity // value
+            opened = -(-count // per_bin)
+            takes = np.full(opened, per_bin, dtype=np.int64)
+            takes[-1] = count - per_bin * (opened - 1)
+            placed_bins.append(np.repeat(np.arange(free.size, free.size + opened), takes))
+            free = np.concatenate((free, bin_capacity - takes * value))
+    if not placed_bins:
+        return []
+    bin_of = np.concatenate(placed_bins)
+    # a stable sort by bin keeps every bin's items in placement order, largest first
+    packed = np.concatenate(placed_sizes)[np.argsort(bin_of, kind="stable")].tolist()
+    ends = np.cumsum(np.bincount(bin_of, minlength=free.size)).tolist()
+    return [packed[start:end] for start, end in zip([0] + ends[:-1], ends)]
+
+
+@_gc_paused()
+def _first_fit_tree(bin_capacity: int, order: np.ndarray) -> List[List[int]]:
+    """
+    First fit one item at a time, a max segment tree over the bins' free space finds the first
+    bin with room in O(log n). Items over half the capacity never share a bin, each opens its own
+    before the loop and only the smaller ones walk the tree.
+    """
+    big = int(np.count_nonzero(2 * order > bin_capacity))
+    size = 1
+    while size < max(len(order), 1):
+        size *= 2
+    # leaves are bins in opening order, unopened bins count as full capacity
+    leaves = np.full(size, bin_capacity, dtype=np.int64)
+    leaves[:big] = bin_capacity - order[:big]
+    levels = [leaves]
+    while len(levels[-1]) > 1:
+        levels.append(np.maximum(levels[-1][0::2], levels[-1][1::2]))
+    # node 1 is the root, node i has children 2i and 2i + 1
+    tree = [0] + np.concatenate(levels[::-1]).tolist()
+    bins = [[item] for item in order[:big].tolist()]
+    for item in order[big:].tolist():
+        node = 1
+        while node < size:
+            node *= 2
+            if tree[node] < item:
+                node += 1
+        index = node - size
+        if index == len(bins):
+            bins.append([item])
+        else:
+            bins[index].append(item)
+        tree[node] -= item
+        node //= 2
+        while node:
+            left, right = tree[2 * node], tree[2 * node + 1]
+            best = left if left > right else right
+            if tree[node] == best:
+                # nothing above changes either
+                break
+            tree[node] = best
+            node //= 2
+    return bins
+
+
+@_gc_paused()
+def best_fit_decreasing(bin_capacity: int, items: Sequence[int]) -> List[List[int]]:
+    """
+    Places every item, largest first, in the open bin it leaves with the least free space.
+    Open bins are kept in buckets keyed on their free space, with the distinct free space values in
+    a sorted list, so the tightest bin is one bisect away.
+    """
+    bins: List[List[int]] = []
+    buckets: Dict[int, List[int]] = {}
+    free_sizes: List[int] = []
+    for item in _decreasing(items):
+        at = bisect_left(free_sizes, item)
+        if at < len(free_sizes):
+            free = free_sizes[at]
+            bucket = buckets[free]
+            index = bucket.pop()
+            if not bucket:
+                del buckets[free]
+                del free_sizes[at]
+            bins[index].append(item)
+        else:
+            free = bin_capacity
+            index = len(bins)
+            bins.append([item])
+        free -= item
+        if free in buckets:
+            buckets[free].append(index)
+        else:
+            buckets[free] = [index]
+            insort(free_sizes, free)
+    return bins
+
+
+HEURISTICS = {
+    "ffd": first_fit_decreasing,
+    "bfd": best_fit_decreasing,
+}
+
+
+def pack_decreasing(bin_capacity: int, items: Sequence[int], heuristic: str = "bfd") -> List[List[int]]:
+    """
+    Checks the items and packs them with one of HEURISTICS.
+    """
+    if heuristic not in HEURISTICS:
+        raise ValueError(f"Unknown heuristic {heuristic}, expected one of {sorted(HEURISTICS)}")
+    check_items(bin_capacity, items)
+    return HEURISTICS[heuristic](bin_capacity, items)
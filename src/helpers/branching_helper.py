@@ -0,0 +1,205 @@
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from src.helpers.drat_helper import DratWriter
+
+HEURISTICS = ("index", "moms", "jeroslow_wang", "dlis", "most_constrained")
+
+# MOMS weighs the occurrences of both polarities in the shortest clauses as sum * 2^k + product
+MOMS_K = 10
+
+
+class BranchingSearch:
+    """
+    Chronological backtracking that picks the next variable and the value to try first with a
+    branching heuristic:
+      index             lowest unassigned variable, 0 first
+      moms              most occurrences in the shortest open clauses
+      jeroslow_wang     largest sum of 2^-len over the open clauses of a literal
+      dlis              literal in the most open clauses
+      most_constrained  variable of a shortest open clause, ties by open occurrences
+    Open clauses are the ones no literal satisfies yet. The occurrence lists of every literal are
+    built once, assigning a variable then only touches its own clauses, so the per-literal counts
+    and weights and the clauses bucketed by free literal count stay current at constant cost per
+    clause literal. Values are ordered by which polarity occurs more in the open clauses.
+
+    With a proof writer every node with both values refuted logs the clause blocking its decisions.
+    It is RUP: a child refuted by a conflict has its falsified clause unit under the parent's
+    decisions, a refuted inner child has its own blocking clause, so leaves log nothing. Logged
+    children are deleted with their parent, and the root logs the empty clause.
+    """
+
+    def __init__(self, n_vars: int, clauses: Sequence[Sequence[int]], heuristic: str = "moms",
+                 proof: Optional[DratWriter] = None):
+        if heuristic not in HEURISTICS:
+            raise ValueError(f"Unknown branching heuristic {heuristic!r}, expected one of {HEURISTICS}")
+        self.heuristic = heuristic
+        self.proof = proof
+        self.n_vars = max([n_vars] + [abs(literal) for clause in clauses for literal in clause])
+        self.has_empty_clause = False
+        self.clauses: List[List[int]] = []
+        for clause in clauses:
+            literals = set(clause)
+            if any(-literal in literals for literal in literals):
+                # always satisfied
+                continue
+            if not literals:
+                self.has_empty_clause = True
+            self.clauses.append(sorted(literals))
+
+        size = 2 * self.n_vars + 1
+        # indexed by literal, negative literals index from the end
+        self.occurrences: List[List[int]] = [[] for _ in range(size)]
+        for index, clause in enumerate(self.clauses):
+            for literal in clause:
+                self.occurrences[literal].append(index)
+        self.weight = [2.0 ** -len(clause) for clause in self.clauses]
+        self.open_count = [len(occurrence) for occurrence in self.occurrences]
+        self.jw = [sum(self.weight[index] for index in occurrence) for occurrence in self.occurrences]
+
+        self.value: List[Optional[int]] = [None] * (self.n_vars + 1)
+        self.true_count = [0] * len(self.clauses)
+        self.free = [len(clause) for clause in self.clauses]
+        # open clauses by number of unassigned literals
+        self.by_free: List[Set[int]] = [set() for _ in range(max(self.free, default=0) + 1)]
+        for index, free in enumerate(self.free):
+            self.by_free[free].add(index)
+        self.n_open = len(self.clauses)
+        self.nodes = 0
+
+    def _close(self, index: int):
+        self.n_open -= 1
+        self.by_free[self.free[index]].discard(index)
+        for literal in self.clauses[index]:
+            self.open_count[literal] -= 1
+            self.jw[literal] -= self.weight[index]
+
+    def _reopen(self, index: int):
+        self.n_open += 1
+        self.by_free[self.free[index]].add(index)
+        for literal in self.clauses[index]:
+            self.open_count[literal] += 1
+            self.jw[literal] += self.weight[index]
+
+    def assign(self, var: int, value: int):
+        self.value[var] = value
+        literal = var if value else -var
+        for index in self.occurrences[literal]:
+            self.true_count[index] += 1
+            if self.true_count[index] == 1:
+                self._close(index)
+            self.free[index] -= 1
+        for index in self.occurrences[-literal]:
+            if self.true_count[index] == 0:
+                self.by_free[self.free[index]].discard(index)
+                self.by_free[self.free[index] - 1].add(index)
+            self.free[index] -= 1
+
+    def unassign(self, var: int):
+        literal = var if self.value[var] else -var
+        self.value[var] = None
+        for index in self.occurrences[-literal]:
+            self.free[index] += 1
+            if self.true_count[index] == 0:
+                self.by_free[self.free[index] - 1].discard(index)
+                self.by_free[self.free[index]].add(index)
+        for index in self.occurrences[literal]:
+            self.free[index] += 1
+            self.true_count[index] -= 1
+            if self.true_count[index] == 0:
+                self._reopen(index)
+
+    def _polarity(self, var: int, scores: List[float]) -> Tuple[int, int]:
+        return var, 1 if scores[var] >= scores[-var] else 0
+
+    def _unassigned(self) -> List[int]:
+        return [var for var in range(1, self.n_vars + 1) if self.value[var] is None]
+
+    def pick(self) -> Tuple[int, int]:
+        """
+        (variable, first value) to branch on, only called while clauses are open.
+        """
+        if self.heuristic == "index":
+            return self._unassigned()[0], 0
+        if self.heuristic == "dlis":
+            literal = max((literal for var in self._unassigned() for literal in (var, -var)),
+                          key=lambda literal: self.open_count[literal])
+            return abs(literal), int(literal > 0)
+        if self.heuristic == "jeroslow_wang":
+            var = max(self._unassigned(), key=lambda var: self.jw[var] + self.jw[-var])
+            return self._polarity(var, self.jw)
+
+        shortest = next(bucket for bucket in self.by_free[1:] if bucket)
+        if self.heuristic == "most_constrained":
+            candidates = {abs(literal) for index in shortest for literal in self.clauses[index]
+                          if self.value[abs(literal)] is None}
+            var = max(candidates, key=lambda var: (self.open_count[var] + self.open_count[-var], -var))
+            return self._polarity(var, self.open_count)
+
+        # moms
+        counts: Dict[int, int] = {}
+        for index in shortest:
+            for literal in self.clauses[index]:
+                if self.value[abs(literal)] is None:
+                    counts[literal] = counts.get(literal, 0) + 1
+        var = max({abs(literal) for literal in counts}, key=lambda var: (
+            (counts.get(var, 0) + counts.get(-var, 0)) * 2 ** MOMS_K + counts.get(var, 0) * counts.get(-var, 0), -var))
+        return var, 1 if counts.get(var, 0) >= counts.get(-var, 0) else 0
+
+    def solve(self) -> Tuple[bool, Dict[int, int]]:
+        """
+        Returns (ok, {var: 0/1}) like the other SAT methods, with an empty assignment when
+        unsatisfiable. Variables left unassigned when every clause is satisfied are 0.
+        """
+        proof = self.proof
+        if self.has_empty_clause:
+            if proof is not None:
+                proof.add([])
+            return False, {}
+        # (variable, value tried first, whether the other value was tried as well)
+        trail: List[Tuple[int, int, bool]] = []
+        if proof is not None:
+            code = {literal: proof.encode([literal]) for var in range(1, self.n_vars + 1) for literal in (var, -var)}
+            # encoded negation of the decisions on the trail, one prefix per depth
+            blocking: List[bytes] = [b""]
+            # encoded lemma of the first refuted child of every flipped decision, None for a leaf
+            first_refuted: List[Optional[bytes]] = []
+        while True:
+            if not self.by_free[0]:
+                if self.n_open == 0:
+                    return True, {var: self.value[var] or 0 for var in range(1, self.n_vars + 1)}
+                var, value = self.pick()
+                self.nodes += 1
+                self.assign(var, value)
+                trail.append((var, value, False))
+                if proof is not None:
+                    blocking.append(blocking[-1] + code[-var if value else var])
+                continue
+            # an open clause has no free literal left, undo up to the latest untried value
+            if proof is not None:
+                blocking.pop()
+                refuted = None
+            while trail:
+                var, value, flipped = trail.pop()
+                self.unassign(var)
+                if not flipped:
+                    self.nodes += 1
+                    self.assign(var, 1 - value)
+                    trail.append((var, 1 - value, True))
+                    if proof is not None:
+                        first_refuted.append(refuted)
+                        blocking.append(blocking[-1] + code[var if value else -var])
+                    break
+                if proof is not None:
+                    parent = blocking.pop()
+                    proof.add_encoded(parent)
+                    for child in (first_refuted.pop(), refuted):
+                        if child is not None:
+                            proof.delete_encoded(child)
+                    refuted = parent
+            else:
+                return False, {}
+
+
+def solve_with_branching(n_vars: int, clauses: Sequence[Sequence[int]], heuristic: str,
+                         proof: Optional[DratWriter] = None) -> Tuple[bool, Dict[int, int]]:
+    return BranchingSearch(n_vars, clauses, heuristic, proof).solve()
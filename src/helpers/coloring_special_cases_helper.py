@@ -0,0 +1,58 @@
+from collections import deque
+from typing import List, Tuple
+
+
+def _adjacency(n_vertices: int, edges: List[Tuple[int]]) -> List[List[int]]:
+    adj: List[List[int]] = [[] for _ in range(n_vertices)]
+    for u, v in edges:
+        adj[u].append(v)
+        adj[v].append(u)
+    return adj
+
+
+def greedy_coloring(n_vertices: int, edges: List[Tuple[int]], k: int) -> Tuple[bool, List[int]]:
+    """
+    Gives every vertex the smallest color its colored neighbours leave free. Never needs more than
+    max degree + 1 colors, so it decides every instance with k above the max degree.
+    A self-loop makes any coloring invalid.
+    """
+    if any(u == v for u, v in edges):
+        return False, []
+    adj = _adjacency(n_vertices, edges)
+    coloring = [-1] * n_vertices
+    for v in range(n_vertices):
+        taken = {coloring[w] for w in adj[v]}
+        color = 0
+        while color in taken:
+            color += 1
+        if color >= k:
+            return False, []
+        coloring[v] = color
+    return True, coloring
+
+
+def coloring_up_to_two(n_vertices: int, edges: List[Tuple[int]], k: int) -> Tuple[bool, List[int]]:
+    """
+    k <= 2 in linear time: one color needs an edgeless graph, two colors a bipartite one.
+    """
+    if k <= 0:
+        return n_vertices == 0, []
+    if k == 1:
+        return (True, [0] * n_vertices) if not edges else (False, [])
+    adj = _adjacency(n_vertices, edges)
+    coloring = [-1] * n_vertices
+    for root in range(n_vertices):
+        if coloring[root] != -1:
+            continue
+        coloring[root] = 0
+        queue = deque([root])
+        while queue:
+            v = queue.popleft()
+            for w in adj[v]:
+                if coloring[w] == -1:
+                    coloring[w] = 1 - coloring[v]
+                    queue.append(w)
+                elif coloring[w] == coloring[v]:
+                    # odd cycle
+                    return False, []
+    return True, coloring
@@ -0,0 +1,309 @@
+import argparse
+import csv
+import itertools
+import os
+import secrets
+import subprocess
+import sys
+import threading
+import time
+import traceback
+import uuid
+from collections import deque
+from multiprocessing.managers import BaseManager
+from typing import Any, Deque, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+# repository root, local workers are started from here so that `src` imports
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# how long an idle worker waits before asking for work again while other shards are still out
+IDLE_POLL_SECONDS = 0.2
+
+
+class DistributedOptions(NamedTuple):
+    """
+    "distributed" entry of the "Execution" block, every field optional. Port 0 picks a free port.
+    Without an authkey a random one is made up and printed for remote workers.
+    """
+    host: str = "127.0.0.1"
+    port: int = 0
+    authkey: Optional[str] = None
+    local_workers: int = 2
+    shard_size: int = 16
+    heartbeat_seconds: float = 1.0
+    timeout_seconds: float = 5.0
+
+    @classmethod
+    def from_options(cls, options: Optional[Dict[str, Any]]) -> "DistributedOptions":
+        return cls(**(options or {}))
+
+
+class Shard(NamedTuple):
+    shard_id: int
+    sub_problem: str
+    method_name: str
+    label: str
+    # position of the shard in its results file
+    index: int
+    instances: List[Any]
+
+
+class _ResultsFile:
+    """
+    Results CSV of one sub problem. Shards come back in any order and are written in input order.
+    """
+
+    def __init__(self, path: str, header: List[str]):
+        self.path = path
+        self.file = open(path, "w", newline="")
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(header)
+        self.next_index = 0
+        self.waiting: Dict[int, List[List[Any]]] = {}
+        # known once every shard of the sub problem has been handed out
+        self.total: Optional[int] = None
+
+    def add(self, index: int, rows: List[List[Any]]):
+        self.waiting[index] = rows
+        while self.next_index in self.waiting:
+            self.writer.writerows(self.waiting.pop(self.next_index))
+            self.next_index += 1
+        self.file.flush()
+
+    @property
+    def complete(self) -> bool:
+        return self.total is not None and self.next_index == self.total
+
+    def close(self):
+        self.file.close()
+        print(f"\nResults written to {self.path}")
+
+
+class WorkCoordinator:
+    """
+    Hands out shards of instances to workers and merges their rows into the usual results files.
+    Shards are cut lazily from the harness' streaming parser, one pass per selected sub problem.
+    Workers heartbeat while they solve; one that stays silent for timeout_seconds is taken for dead
+    and its shards go back to the front of the queue. A shard finished twice keeps the first rows.
+    Every method runs on a manager server thread, so all state sits behind one lock.
+    """
+
+    def __init__(self, harness, options: DistributedOptions):
+        self.harness = harness
+        self.options = options
+        self.lock = threading.Lock()
+        self.shards = self._cut_shards()
+        self.cut_all = False
+        self.requeued: Deque[Shard] = deque()
+        # shard id -> (worker id, shard)
+        self.leases: Dict[int, Tuple[str, Shard]] = {}
+        self.finished_shards: Set[int] = set()
+        self.last_seen: Dict[str, float] = {}
+        self.dead: Set[str] = set()
+        self.results: Dict[str, _ResultsFile] = {}
+        # traceback of a solver error on some worker, ends the run
+        self.error: Optional[str] = None
+
+    def _cut_shards(self) -> Iterator[Shard]:
+        shard_ids = itertools.count()
+        for sub_problem, method_name, label in self.harness.selected_methods():
+            results = _ResultsFile(self.harness.result_path(sub_problem.name), self.harness.csv_header(sub_problem.name))
+            self.results[sub_problem.name] = results
+            instances = iter(self.harness.iter_input_file())
+            for index in itertools.count():
+                chunk = list(itertools.islice(instances, self.options.shard_size))
+                if not chunk:
+                    break
+                yield Shard(next(shard_ids), sub_problem.name, method_name, label, index, chunk)
+            results.total = index
+            self._close_complete()
+
+    def _close_complete(self):
+        for sub_problem, results in list(self.results.items()):
+            if results.complete:
+                results.close()
+                del self.results[sub_problem]
+
+    def register(self, worker_id: str):
+        """
+        Returns the harness copy the worker solves with and how often it has to heartbeat.
+        """
+        with self.lock:
+            self.last_seen[worker_id] = time.monotonic()
+            print(f"Worker {worker_id} joined")
+        return self.harness.worker_copy(), self.options.heartbeat_seconds
+
+    def heartbeat(self, worker_id: str):
+        with self.lock:
+            self.last_seen[worker_id] = time.monotonic()
+            # a worker taken for dead came back, its old shards were already handed out again
+            self.dead.discard(worker_id)
+
+    def lease(self, worker_id: str) -> Optional[Shard]:
+        """
+        Next shard for the worker, None while every remaining shard is out with other workers.
+        """
+        with self.lock:
+            self.last_seen[worker_id] = time.monotonic()
+            self.dead.discard(worker_id)
+            while self.requeued:
+                shard = self.requeued.popleft()
+                if shard.shard_id not in self.finished_shards:
+                    self.leases[shard.shard_id] = (worker_id, shard)
+                    return shard
+            if not self.cut_all:
+                shard = next(self.shards, None)
+                if shard is not None:
+                    self.leases[shard.shard_id] = (worker_id, shard)
+                    return shard
+                self.cut_all = True
+            return None
+
+    def done(self) -> bool:
+        with self.lock:
+            return self.cut_all and not self.leases and not self.requeued
+
+    def complete(self, worker_id: str, shard_id: int, rows: List[List[Any]]):
+        with self.lock:
+            if shard_id in self.finished_shards:
+                return
+            self.finished_shards.add(shard_id)
+            _, shard = self.leases.pop(shard_id, (None, None))
+            if shard is None:
+                # reassigned and still queued, the queue skips it
+                shard = next(queued for queued in self.requeued if queued.shard_id == shard_id)
+                self.requeued.remove(shard)
+            self.results[shard.sub_problem].add(shard.index, rows)
+            self._close_complete()
+
+    def fail(self, worker_id: str, shard_id: int, error: str):
+        with self.lock:
+            self.error = f"Worker {worker_id} failed on shard {shard_id}:\n{error}"
+
+    def reap(self) -> int:
+        """
+        Requeues the shards of workers that missed their heartbeats, returns the live worker count.
+        """
+        with self.lock:
+            now = time.monotonic()
+            for worker_id, seen in self.last_seen.items():
+                if worker_id in self.dead or now - seen <= self.options.timeout_seconds:
+                    continue
+                self.dead.add(worker_id)
+                lost = [shard for owner, shard in self.leases.values() if owner == worker_id]
+                for shard in lost:
+                    del self.leases[shard.shard_id]
+                    self.requeued.appendleft(shard)
+                print(f"Worker {worker_id} missed its heartbeats, {len(lost)} shards handed out again")
+            return len(self.last_seen) - len(self.dead)
+
+
+class _CoordinatorManager(BaseManager):
+    pass
+
+
+# workers only name the shared coordinator, the server side registers the object behind it
+_CoordinatorManager.register("coordinator")
+
+
+def _serve(coordinator: WorkCoordinator, options: DistributedOptions, authkey: bytes):
+    class ServerManager(BaseManager):
+        pass
+
+    ServerManager.register("coordinator", callable=lambda: coordinator)
+    server = ServerManager(address=(options.host, options.port), authkey=authkey).get_server()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def start_local_worker(address: Tuple[str, int], authkey: bytes) -> subprocess.Popen:
+    # the same command a remote node runs, so one box tests the whole path
+    return subprocess.Popen(
+        [sys.executable, "-m", "src.helpers.distributed_helper", f"{address[0]}:{address[1]}",
+         "--authkey", authkey.decode()],
+        cwd=PROJECT_ROOT,
+    )
+
+
+def run_distributed(harness, options: Optional[Dict[str, Any]]):
+    """
+    Serves the harness' instances to local and remote workers until every results file is written.
+    """
+    options = DistributedOptions.from_options(options)
+    authkey = (options.authkey or secrets.token_hex(16)).encode()
+    coordinator = WorkCoordinator(harness, options)
+    server = _serve(coordinator, options, authkey)
+    address = server.address
+    print(f"Coordinator listening on {address[0]}:{address[1]}, remote workers run: "
+          f"python -m src.helpers.distributed_helper {address[0]}:{address[1]} --authkey {authkey.decode()}")
+    local = [start_local_worker(address, authkey) for _ in range(options.local_workers)]
+    try:
+        while not coordinator.done():
+            time.sleep(options.heartbeat_seconds)
+            if coordinator.error is not None:
+                raise RuntimeError(coordinator.error)
+            live = coordinator.reap()
+            if local and live == 0 and all(worker.poll() is not None for worker in local):
+                raise RuntimeError("Every worker is gone and shards are still unsolved")
+    finally:
+        # serve_forever makes its stop event once it runs
+        if hasattr(server, "stop_event"):
+            server.stop_event.set()
+        for worker in local:
+            if worker.poll() is None:
+                worker.terminate()
+            worker.wait()
+
+
+def _send_heartbeats(coordinator, worker_id: str, interval: float, stop: threading.Event):
+    while not stop.wait(interval):
+        coordinator.heartbeat(worker_id)
+
+
+def run_worker(address: Tuple[str, int], authkey: bytes, worker_id: Optional[str] = None):
+    """
+    Solves shards from the coordinator at address until it has none left.
+    """
+    worker_id = worker_id or f"{os.uname().nodename}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+    manager = _CoordinatorManager(address=address, authkey=authkey)
+    manager.connect()
+    coordinator = manager.coordinator()
+    harness, heartbeat_seconds = coordinator.register(worker_id)
+    stop = threading.Event()
+    threading.Thread(target=_send_heartbeats, args=(coordinator, worker_id, heartbeat_seconds, stop), daemon=True).start()
+    try:
+        while True:
+            shard = coordinator.lease(worker_id)
+            if shard is None:
+                if coordinator.done():
+                    return
+                time.sleep(IDLE_POLL_SECONDS)
+                continue
+            rows: List[List[Any]] = []
+            try:
+                for instance in shard.instances:
+                    result, timing, extra = harness.solve_selected(shard.method_name, instance)
+                    rows.extend(harness.result_rows(instance, result, shard.label, timing, extra))
+            except Exception:
+                coordinator.fail(worker_id, shard.shard_id, traceback.format_exc())
+                raise
+            coordinator.complete(worker_id, shard.shard_id, rows)
+    except (ConnectionError, EOFError):
+        # the coordinator finished or went away
+        return
+    finally:
+        stop.set()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Solver worker for a distributed run")
+    parser.add_argument("address", help="host:port the coordinator printed")
+    parser.add_argument("--authkey", required=True)
+    parser.add_argument("--worker-id", default=None)
+    args = parser.parse_args()
+    host, port = args.address.rsplit(":", 1)
+    run_worker((host, int(port)), args.authkey.encode(), args.worker_id)
+
+
+if __name__ == "__main__":
+    main()
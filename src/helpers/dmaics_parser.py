@@ -1,49 +1,100 @@
 import os
-from typing import List, Tuple, Any
+from typing import Any, Dict, Iterator, List, Tuple
 
-def parse_multi_instance_dimacs(path: str) -> Tuple[str, int, List[List[int]]]:
+import numpy as np
+
+def _nonblank_lines(path: str) -> Iterator[str]:
+    with open(path) as f:
+        for ln in f:
+            ln = ln.strip()
+            if ln:
+                yield ln
+
+
+def iter_multi_instance_dimacs(path: str) -> Iterator[Tuple[str, int, List[List[int]]]]:
     """
-    Parses a DIMACS-like file containing multiple CNF instances.
-    Returns a list of (instance_id, n_vars, clauses) tuples.
+    Streams the (instance_id, n_vars, clauses) tuples of a multi-instance DIMACS-like file,
+    one instance at a time, without reading the whole file first.
     """
 
     if not os.path.exists(path = path):
         raise Exception(f"File path: {path} does not exists!!")
 
-    instances = []
-    with open(path) as f:
-        lines = [ln.strip() for ln in f if ln.strip()]
-    
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        if line.startswith("c "):
-            # Example: c 3 2 ?
-            parts = line.split()
-            instance_id = parts[1] if len(parts) > 1 else str(len(instances) + 1)
-            i += 1
-            if i >= len(lines):
+    lines = _nonblank_lines(path)
+    count = 0
+    line = next(lines, None)
+    while line is not None:
+        if not line.startswith("c "):
+            line = next(lines, None)
+            continue
+        # Example: c 3 2 ?
+        parts = line.split()
+        instance_id = parts[1] if len(parts) > 1 else str(count + 1)
+        header = next(lines, None)
+        if header is None:
+            break
+        # Expect next line: p cnf n_vars n_clauses
+        if not header.startswith("p cnf"):
+            raise ValueError(f"Expected 'p cnf' after {line}")
+        _, _, n_vars_str, n_clauses_str = header.split()
+        n_vars = int(n_vars_str)
+        n_clauses = int(n_clauses_str)
+        clauses = []
+        line = next(lines, None)
+        # Read next n_clauses lines (allow commas)
+        for _ in range(n_clauses):
+            if line is None or line.startswith("c "):
+                break
+            clause = [int(x) for x in line.replace(",", " ").split() if x != "0"]
+            if clause:
+                clauses.append(clause)
+            line = next(lines, None)
+        count += 1
+        yield (instance_id, n_vars, clauses)
+
+
+def parse_multi_instance_dimacs(path: str) -> List[Tuple[str, int, List[List[int]]]]:
+    """
+    Parses a DIMACS-like file containing multiple CNF instances.
+    Returns a list of (instance_id, n_vars, clauses) tuples.
+    """
+    return list(iter_multi_instance_dimacs(path))
+
+
+def iter_multi_instance_graph(path: str) -> Iterator[Tuple[str, int, int, List[Tuple[int, int]]]]:
+    """
+    Streams the (instance_id, k, n_vertices, edges) tuples of a multi-instance graph file.
+    Each instance starts with `c` and `p cnf` lines.
+    """
+    lines = _nonblank_lines(path)
+    count = 0
+    line = next(lines, None)
+    while line is not None:
+        if not line.startswith("c "):
+            line = next(lines, None)
+            continue
+        parts = line.split()
+        instance_id = parts[1] if len(parts) > 1 else str(count + 1)
+        k = int(parts[2]) if len(parts) > 2 else 3
+        header = next(lines, None)
+        if header is None or not header.startswith("p cnf"):
+            raise ValueError(f"Expected 'p cnf' after line: {line}")
+        _, _, n_vertices_str, n_edges_str = header.split()
+        n_vertices = int(n_vertices_str)
+        n_edges = int(n_edges_str)
+        edges = []
+        line = next(lines, None)
+        # Read next n_edges lines (edge pairs)
+        for _ in range(n_edges):
+            if line is None or line.startswith("c "):
                 break
-            # Expect next line: p cnf n_vars n_clauses
-            if not lines[i].startswith("p cnf"):
-                raise ValueError(f"Expected 'p cnf' after {line}")
-            _, _, n_vars_str, n_clauses_str = lines[i].split()
-            n_vars = int(n_vars_str)
-            n_clauses = int(n_clauses_str)
-            i += 1
-            clauses = []
-            # Read next n_clauses lines (allow commas)
-            for _ in range(n_clauses):
-                if i >= len(lines) or lines[i].startswith("c "):
-                    break
-                clause = [int(x) for x in lines[i].replace(",", " ").split() if x != "0"]
-                if clause:
-                    clauses.append(clause)
-                i += 1
-            instances.append((instance_id, n_vars, clauses))
-        else:
-            i += 1
-    return instances
+            parts = line.replace(",", " ").split()
+            if len(parts) >= 2:
+                u, v = int(parts[0]), int(parts[1])
+                edges.append((u - 1, v - 1))  # use 0-based indexing
+            line = next(lines, None)
+        count += 1
+        yield (instance_id, k, n_vertices, edges)
 
 
 def parse_multi_instance_graph(path: str):
@@ -51,58 +102,47 @@ def parse_multi_instance_graph(path: str):
     Parse file into list of (instance_id, k, n_vertices, edges)
     Each instance starts with `c` and `p edge` lines.
     """
-    instances = []
-    with open(path) as f:
-        lines = [ln.strip() for ln in f if ln.strip()]
-
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        if line.startswith("c "):
-            parts = line.split()
-            instance_id = parts[1] if len(parts) > 1 else str(len(instances) + 1)
-            k = int(parts[2]) if len(parts) > 2 else 3
-            i += 1
-            if i >= len(lines) or not lines[i].startswith("p cnf"):
-                raise ValueError(f"Expected 'p cnf' after line: {line}")
-            _, _, n_vertices_str, n_edges_str = lines[i].split()
-            n_vertices = int(n_vertices_str)
-            n_edges = int(n_edges_str)
-            i += 1
-            edges = []
-            # Read next n_edges lines (edge pairs)
-            for _ in range(n_edges):
-                if i >= len(lines) or lines[i].startswith("c "):
-                    break
-                parts = lines[i].replace(",", " ").split()
-                if len(parts) >= 2:
-                    u, v = int(parts[0]), int(parts[1])
-                    edges.append((u - 1, v - 1))  # use 0-based indexing
-                i += 1
-            instances.append((instance_id, k, n_vertices, edges))
-        else:
-            i += 1
-
-    return instances
-    
+    return list(iter_multi_instance_graph(path))
+
+
+def iter_multi_instance_bin_packing(path: str) -> Iterator[np.ndarray]:
+    """
+    Streams the per-instance int64 arrays [bin_capacity, item, item, ...] one line at a time.
+    Same format as parse_multi_instance_bin_packing, which is faster when the whole file is wanted.
+    """
+    for line in _nonblank_lines(path):
+        yield np.array(line.split(), dtype=np.int64)
+
     
-def parse_multi_instance_bin_packing(path: str):
+def parse_multi_instance_bin_packing(path: str) -> List[np.ndarray]:
     """
-    Parse file into list of (instance_id, n_items, item_sizes, bin_capacity)
-    Each instance starts with `c` and `p edge` lines.
+    Parse file into a list of per-instance int64 arrays [bin_capacity, item, item, ...]
+    One instance per non-empty line, numbers separated by any amount of whitespace.
+    The whole file is parsed into one array and every instance is a zero-copy view into it.
     """
-    instances = []
-    with open(path) as f:
-        lines = [ln.strip() for ln in f if ln.strip()]
+    with open(path, "rb") as f:
+        data = f.read()
+
+    values = np.fromstring(data, dtype=np.int64, sep=" ")
+
+    # count the numbers on every line to cut the flat array back into instances
+    chars = np.frombuffer(data, dtype=np.uint8)
+    blank = np.isin(chars, np.frombuffer(b" \t\r\n\v\f", dtype=np.uint8))
+    starts = ~blank
+    starts[1:] &= blank[:-1]
+    line_of_char = np.cumsum(chars == ord("\n"))
+    per_line = np.bincount(line_of_char[starts], minlength=1)
+    per_line = per_line[per_line > 0]
+    if per_line.sum() != values.size:
+        raise ValueError(f"Could not parse every number in {path}")
 
-    i = 0
-    for temp_line in lines:
-        line = [int(line) for line in temp_line.split(" ")]
-        instances.append(line)
-    return instances
+    offsets = np.concatenate(([0], np.cumsum(per_line)))
+    return [values[offsets[i]:offsets[i + 1]] for i in range(per_line.size)]
     
-def parse_cnf_instances_hamilton(filename):
-    instances = []
+def iter_cnf_instances_hamilton(filename) -> Iterator[Dict[str, Any]]:
+    """
+    Streams the Hamiltonian instances of filename, each one as soon as its last edge is read.
+    """
     current_instance: dict[str, Any] = {}
     with open(filename, "r") as f:
         for line in f:
@@ -111,7 +151,7 @@ def parse_cnf_instances_hamilton(filename):
                 continue
             if line.startswith("c INSTANCE"):
                 if current_instance:
-                    instances.append(current_instance)
+                    yield current_instance
                 instance_id = int(line.split()[-1])
                 current_instance = {"id": instance_id, "vertices": set(), "edges": []}
             elif line.startswith("p edge"):
@@ -123,5 +163,8 @@ def parse_cnf_instances_hamilton(filename):
                 current_instance["edges"].append((u, v))
                 current_instance["vertices"].update([u, v])
         if current_instance:
-            instances.append(current_instance)
-    return instances
\ No newline at end of file
+            yield current_instance
+
+
+def parse_cnf_instances_hamilton(filename):
+    return list(iter_cnf_instances_hamilton(filename))
@@ -0,0 +1,241 @@
+import os
+from collections import defaultdict
+from typing import BinaryIO, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# bytes a proof writer holds before it writes them out, one write per instance below that
+PROOF_BUFFER_BYTES = 1 << 26
+# bytes read at a time when streaming a proof back in
+READ_CHUNK_BYTES = 1 << 16
+
+ADD, DELETE = b"a", b"d"
+
+
+def encode_literal(literal: int) -> bytes:
+    # binary DRAT: 2 * var + sign as a little endian base-128 varint
+    code = 2 * abs(literal) + (literal < 0)
+    out = bytearray()
+    while code > 127:
+        out.append((code & 127) | 128)
+        code >>= 7
+    out.append(code)
+    return bytes(out)
+
+
+class DratWriter:
+    """
+    Binary DRAT proof file. Lemmas are appended to one bytearray that is written out when the
+    writer is closed or holds buffer_bytes, so logging a lemma costs a few bytearray appends and
+    searches can keep the encoding of prefixes their lemmas share. The file is only created by
+    the first write, a writer that is discarded never touches the disk.
+    """
+
+    def __init__(self, path: str, buffer_bytes: int = PROOF_BUFFER_BYTES):
+        self.path = path
+        self.file: Optional[BinaryIO] = None
+        self.buffer_bytes = buffer_bytes
+        self.buffer = bytearray()
+        self.codes: Dict[int, bytes] = {}
+        self.lemmas = 0
+
+    def encode(self, literals: Sequence[int]) -> bytes:
+        codes = self.codes
+        parts = []
+        for literal in literals:
+            code = codes.get(literal)
+            if code is None:
+                code = codes[literal] = encode_literal(literal)
+            parts.append(code)
+        return b"".join(parts)
+
+    def add(self, literals: Sequence[int]):
+        self.add_encoded(self.encode(literals))
+
+    def delete(self, literals: Sequence[int]):
+        self.delete_encoded(self.encode(literals))
+
+    def add_encoded(self, encoded: bytes):
+        # a lemma the caller already ran through encode
+        self.lemmas += 1
+        buffer = self.buffer
+        buffer += ADD
+        buffer += encoded
+        buffer += b"\0"
+        if len(buffer) >= self.buffer_bytes:
+            self.flush()
+
+    def delete_encoded(self, encoded: bytes):
+        buffer = self.buffer
+        buffer += DELETE
+        buffer += encoded
+        buffer += b"\0"
+        if len(buffer) >= self.buffer_bytes:
+            self.flush()
+
+    def flush(self):
+        if self.file is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self.file = open(self.path, "wb")
+        self.file.write(self.buffer)
+        self.buffer = bytearray()
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+    def discard(self):
+        """
+        Drops the proof, removing whatever part of it was already written.
+        """
+        self.buffer = bytearray()
+        if self.file is not None:
+            self.file.close()
+            os.remove(self.path)
+            self.file = None
+
+
+def iter_drat(path: str) -> Iterator[Tuple[bytes, List[int]]]:
+    """
+    Streams (ADD or DELETE, literals) steps out of a binary DRAT file.
+    """
+    kind = None
+    literals: List[int] = []
+    code = shift = 0
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(READ_CHUNK_BYTES)
+            if not chunk:
+                break
+            for byte in chunk:
+                if kind is None:
+                    kind = bytes((byte,))
+                    if kind not in (ADD, DELETE):
+                        raise ValueError(f"{path} is not a binary DRAT proof")
+                    continue
+                code |= (byte & 127) << shift
+                if byte & 128:
+                    shift += 7
+                    continue
+                if code == 0:
+                    yield kind, literals
+                    kind, literals = None, []
+                else:
+                    literals.append(-(code >> 1) if code & 1 else code >> 1)
+                code = shift = 0
+    if kind is not None:
+        raise ValueError(f"{path} ends inside a lemma")
+
+
+class DratChecker:
+    """
+    Forward DRAT checker. Every added lemma has to be RUP, unit propagation of its negation over
+    the live clauses reaches a conflict, or RAT on its first literal. The proof is accepted once
+    the empty clause is added. Propagation runs over two watched literals, which stay valid from
+    one check to the next since every check starts from an empty assignment.
+    """
+
+    def __init__(self, clauses: Sequence[Sequence[int]]):
+        self.clauses: List[List[int]] = []
+        self.alive: List[bool] = []
+        self.watches: Dict[int, List[int]] = defaultdict(list)
+        self.units: Dict[int, int] = {}
+        self.lookup: Dict[Tuple[int, ...], List[int]] = defaultdict(list)
+        self.refuted = False
+        for clause in clauses:
+            self._add(clause)
+
+    def _add(self, literals: Sequence[int]):
+        clause = list(dict.fromkeys(literals))
+        index = len(self.clauses)
+        self.clauses.append(clause)
+        self.alive.append(True)
+        self.lookup[tuple(sorted(clause))].append(index)
+        if not clause:
+            self.refuted = True
+        elif len(clause) == 1:
+            self.units[index] = clause[0]
+        else:
+            self.watches[clause[0]].append(index)
+            self.watches[clause[1]].append(index)
+
+    def _delete(self, literals: Sequence[int]):
+        matches = self.lookup.get(tuple(sorted(set(literals))))
+        if matches:
+            index = matches.pop()
+            self.alive[index] = False
+            self.units.pop(index, None)
+
+    def _rup(self, literals: Sequence[int]) -> bool:
+        value: Dict[int, bool] = {}
+        queue: List[int] = []
+
+        def assign(literal: int) -> bool:
+            # False when literal is already false
+            if literal in value:
+                return value[literal]
+            value[literal], value[-literal] = True, False
+            queue.append(literal)
+            return True
+
+        for literal in literals:
+            if not assign(-literal):
+                return True
+        for literal in self.units.values():
+            if not assign(literal):
+                return True
+        head = 0
+        while head < len(queue):
+            false_literal = -queue[head]
+            head += 1
+            watching = self.watches[false_literal]
+            kept: List[int] = []
+            for at, index in enumerate(watching):
+                if not self.alive[index]:
+                    continue
+                clause = self.clauses[index]
+                if clause[0] == false_literal:
+                    clause[0], clause[1] = clause[1], clause[0]
+                if value.get(clause[0]) is True:
+                    kept.append(index)
+                    continue
+                for other in range(2, len(clause)):
+                    if value.get(clause[other]) is not False:
+                        clause[1], clause[other] = clause[other], clause[1]
+                        self.watches[clause[1]].append(index)
+                        break
+                else:
+                    kept.append(index)
+                    if not assign(clause[0]):
+                        kept.extend(watching[at + 1:])
+                        self.watches[false_literal] = kept
+                        return True
+            self.watches[false_literal] = kept
+        return False
+
+    def _rat(self, literals: Sequence[int]) -> bool:
+        pivot = literals[0]
+        for index, clause in enumerate(self.clauses):
+            if self.alive[index] and -pivot in clause:
+                if not self._rup(list(literals) + [literal for literal in clause if literal != -pivot]):
+                    return False
+        return True
+
+    def verify(self, steps: Iterator[Tuple[bytes, List[int]]]) -> bool:
+        if self.refuted:
+            return True
+        for kind, literals in steps:
+            if kind == DELETE:
+                self._delete(literals)
+                continue
+            if not (self._rup(literals) or (literals and self._rat(literals))):
+                return False
+            if not literals:
+                return True
+            self._add(literals)
+        return False
+
+
+def check_proof(clauses: Sequence[Sequence[int]], path: str) -> bool:
+    """
+    True when the binary DRAT proof at path refutes the clauses.
+    """
+    return DratChecker(clauses).verify(iter_drat(path))
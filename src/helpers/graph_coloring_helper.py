@@ -1,62 +1,122 @@
-from abc import ABC, abstractmethod
-import os
-from src.helpers.dmaics_parser import parse_multi_instance_graph
-from src.helpers.constants import RESULTS_FOLDER, CONFIGURATION_FILE_PATH
-from typing import List, Tuple, Dict, Any, Optional
-import json
-import csv
-import time
+from abc import abstractmethod
+from src.helpers.coloring_special_cases_helper import coloring_up_to_two, greedy_coloring
+from src.helpers.dmaics_parser import iter_multi_instance_graph, parse_multi_instance_graph
+from src.helpers.graph_decomposition_helper import ComponentSolverPool, connected_components, split_edges
+from src.helpers.instance_features_helper import graph_features
+from src.helpers.solver_harness_helper import SolverHarnessAbstractClass
+from src.helpers.constants import RESULTS_FOLDER
+from typing import List, Tuple, Dict, Any, Iterable, Optional, Union
 from src.helpers.project_selection_enum import ProjectSelection, SubProblemSelection
 
+# what a coloring method returns next to its YES/NO: a color per vertex, as a list or keyed by vertex
+Coloring = Union[List[int], Dict[int, Any]]
 
-class GraphColoringAbstractClass(ABC):
+
+class GraphColoringAbstractClass(SolverHarnessAbstractClass):
+
+    result_header = ["instance_id", "n_vertices", "n_edges", "k",
+                     "method", "colorable", "time_seconds", "coloring"]
+    solver_methods = {
+        SubProblemSelection.brute_force: "coloring_bruteforce",
+        SubProblemSelection.btracking: "coloring_backtracking",
+        SubProblemSelection.simple: "coloring_simple",
+        SubProblemSelection.best_case: "coloring_bestcase",
+    }
 
     def __init__(self, 
                     cnf_file_input_path: str,
                     result_file_name:str = "graph_coloring_results",
                     results_folder_path: str = RESULTS_FOLDER):
-        self.cnf_file_input_path = cnf_file_input_path
-        self.results_folder_path = results_folder_path
-        self.result_file_name = result_file_name
-        self.config_path = CONFIGURATION_FILE_PATH
-        self.solution_instances = self.parse_input_file()
-        print(f"Parsed {len(self.solution_instances)} instances from {self.cnf_file_input_path}")
-        self.sub_problems = self.set_config()
-
-    def set_config(self):
-        if not os.path.exists(self.config_path):
-            raise Exception("Please make sure the configuration file exists!!!")
-        with open(self.config_path, mode = 'r' , encoding= 'utf-8') as conf_buffer:
-            data = json.load(conf_buffer)
-        data = data["Project Configuration"]
-        selection = data["Selection"]
-        sub_problem = data["Sub Problem"]
-        sub_probs = []
-        for sub_prob in sub_problem:
-            if sub_prob["value"] == SubProblemSelection.brute_force.value:
-                sub_probs.append(SubProblemSelection.brute_force)
-            elif sub_prob["value"] == SubProblemSelection.btracking.value:
-                sub_probs.append(SubProblemSelection.btracking)
-            elif sub_prob["value"] == SubProblemSelection.simple.value:
-                sub_probs.append(SubProblemSelection.simple)
-            elif sub_prob["value"] == SubProblemSelection.best_case.value:
-                sub_probs.append(SubProblemSelection.best_case)
-        return sub_probs
-        
+        super().__init__(cnf_file_input_path, result_file_name, results_folder_path)
+        self.component_pool = ComponentSolverPool(self)
+
+    def solve_decomposed(self, method, n_vertices: int, edges: List[Tuple[int]], k: int) -> Tuple[bool, Optional[Coloring]]:
+        """
+        Colors every connected component independently and merges the colorings.
+        A coloring is independent per component so the exponential search only sees small graphs.
+        Methods may return a list of colors or a dict keyed by vertex, both are read by the
+        component's local vertex and the merged coloring is a dict when any component gave one.
+        """
+        components = connected_components(range(n_vertices), edges)
+        if len(components) <= 1:
+            return method(n_vertices, edges, k)
+
+        tasks, sizes, solved_components = [], [], []
+        for component, component_edges in zip(components, split_edges(components, edges)):
+            if not component_edges:
+                # isolated vertices are colored once the others are
+                continue
+            local = {vertex: index for index, vertex in enumerate(component)}
+            tasks.append((len(component), [(local[u], local[v]) for u, v in component_edges], k))
+            sizes.append(len(component))
+            solved_components.append(component)
+        if not tasks:
+            # no edges at all, the method's own answer keeps its coloring format
+            return method(n_vertices, edges, k)
+
+        if k < 1 and n_vertices > 0:
+            return False, []
+
+        colors: Dict[int, Any] = {}
+        as_dict = False
+        results = self.component_pool.map(method.__name__, tasks, sizes)
+        for component, (ok, component_coloring) in zip(solved_components, results):
+            if not ok:
+                return False, []
+            as_dict = as_dict or isinstance(component_coloring, dict)
+            for index, vertex in enumerate(component):
+                colors[vertex] = component_coloring[index]
+        # an isolated vertex takes the first color
+        first = min(colors.values(), default=0)
+        coloring = [colors.get(vertex, first) for vertex in range(n_vertices)]
+        return True, dict(enumerate(coloring)) if as_dict else coloring
+
     def parse_input_file(self):
         return parse_multi_instance_graph(self.cnf_file_input_path)
-    
-    def save_results(self, run_results: List[Any], sub_problem):
-        # Write to CSV
-        dir_name, file_name = os.path.split(self.cnf_file_input_path)
-        file_name_only, ext = os.path.splitext(file_name)
-        temp_result = os.path.join(self.results_folder_path, f"{sub_problem}_{file_name_only}_{self.result_file_name}.csv")
-        with open(temp_result, "w", newline="") as f:
-            w = csv.writer(f)
-            w.writerow(["instance_id", "n_vertices", "n_edges", "k",
-                    "method", "colorable", "time_seconds", "coloring"])
-            w.writerows(run_results)
-        print(f"\nResults written to {temp_result}")
+
+    def iter_input_file(self):
+        return iter_multi_instance_graph(self.cnf_file_input_path)
+
+    def worker_copy(self):
+        # a worker process colors the components of its instance inline, pools do not nest
+        worker = super().worker_copy()
+        worker.component_pool = ComponentSolverPool(worker, max_workers=1)
+        return worker
+
+    def solve_instance(self, method, instance):
+        instance_id, k, n_vertices, edges = instance
+        return self.solve_decomposed(method, n_vertices, edges, k)
+
+    def instance_features(self, instance) -> Dict[str, Any]:
+        instance_id, k, n_vertices, edges = instance
+        features = graph_features(n_vertices, edges)
+        features["k"] = k
+        return features
+
+    def route(self, features: Dict[str, Any]) -> str:
+        # at most two colors is a bipartite check, more colors than any degree always works greedily,
+        # both answer NO on a self-loop, which the degrees leave out
+        if features["k"] <= 2:
+            return "coloring_up_to_two"
+        if features["max_degree"] < features["k"]:
+            return "coloring_greedy"
+        return "coloring_backtracking"
+
+    def coloring_up_to_two(self, n_vertices: int, edges: List[Tuple[int]], k:int) -> Tuple[bool, Optional[List[int]]]:
+        return coloring_up_to_two(n_vertices, edges, k)
+
+    def coloring_greedy(self, n_vertices: int, edges: List[Tuple[int]], k:int) -> Tuple[bool, Optional[List[int]]]:
+        return greedy_coloring(n_vertices, edges, k)
+
+    def format_rows(self, instance, result, label: str, elapsed: float) -> Iterable[List[Any]]:
+        instance_id, k, n_vertices, edges = instance
+        bt_ok, bt_assign = result
+        yield [instance_id, n_vertices, len(edges), k,
+               label, "YES" if bt_ok else "NO",
+               f"{elapsed:.6f}", str(bt_assign)]
+
+    def finish(self):
+        self.component_pool.shutdown()
     
     @abstractmethod
     def coloring_backtracking(self, n_vertices: int, edges: List[Tuple[int]], k:int) -> Tuple[bool, Optional[Dict[int, bool]]]:
@@ -73,74 +133,3 @@ class GraphColoringAbstractClass(ABC):
     @abstractmethod
     def coloring_bestcase(self, n_vertices: int, edges: List[Tuple[int]], k:int) -> Tuple[bool, Optional[Dict[int, bool]]]:
         pass
-
-    def run(self):
-        results = []
-        
-        for instance_id, k, n_vertices, edges in self.solution_instances:
-
-            if SubProblemSelection.brute_force in self.sub_problems:
-                t0 = time.perf_counter()
-                bt_ok, bt_assign = self.coloring_bruteforce(n_vertices, edges, k)
-                bt_time = time.perf_counter() - t0
-                results.append([instance_id, n_vertices, len(edges), k,
-                        "BruteForce", "YES" if bt_ok else "NO",
-                        f"{bt_time:.6f}", str(bt_assign)])
-        
-        if SubProblemSelection.brute_force in self.sub_problems:
-            self.save_results(results, SubProblemSelection.brute_force.name)
-            results = []
-
-        for instance_id, k, n_vertices, edges in self.solution_instances:
-
-            if SubProblemSelection.btracking in self.sub_problems:
-                t0 = time.perf_counter()
-                bt_ok, bt_assign = self.coloring_backtracking(n_vertices, edges, k)
-                bt_time = time.perf_counter() - t0
-                results.append([instance_id, n_vertices, len(edges), k,
-                        "BackTracking", "YES" if bt_ok else "NO",
-                        f"{bt_time:.6f}", str(bt_assign)])
-        
-        if SubProblemSelection.btracking in self.sub_problems:
-            self.save_results(results, SubProblemSelection.btracking.name)
-            results = []
-
-        for instance_id, k, n_vertices, edges in self.solution_instances:
-
-            if SubProblemSelection.simple in self.sub_problems:
-                t0 = time.perf_counter()
-                bt_ok, bt_assign = self.coloring_simple(n_vertices, edges, k)
-                bt_time = time.perf_counter() - t0
-                results.append([instance_id, n_vertices, len(edges), k,
-                        "Simple", "YES" if bt_ok else "NO",
-                        f"{bt_time:.6f}", str(bt_assign)])
-        
-        if SubProblemSelection.simple in self.sub_problems:
-            self.save_results(results, SubProblemSelection.simple.name)
-            results = []
-        
-
-        for instance_id, k, n_vertices, edges in self.solution_instances:
-
-            if SubProblemSelection.best_case in self.sub_problems:
-                t0 = time.perf_counter()
-                bt_ok, bt_assign = self.coloring_bestcase(n_vertices, edges, k)
-                bt_time = time.perf_counter() - t0
-                results.append([instance_id, n_vertices, len(edges), k,
-                        "BestCase", "YES" if bt_ok else "NO",
-                        f"{bt_time:.6f}", str(bt_assign)])
-        
-        if SubProblemSelection.best_case in self.sub_problems:
-            self.save_results(results, SubProblemSelection.best_case.name)
-            results = []
-
-
-
-        
-
-
-    
-    
-
-
-    
\ No newline at end of file
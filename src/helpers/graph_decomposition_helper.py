@@ -0,0 +1,125 @@
+import copy
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Hashable, Iterable, List, Tuple
+
+# components smaller than this are solved inline, a worker round trip costs more than the search
+PARALLEL_MIN_VERTICES = 12
+
+_WORKER_SOLVER = None
+
+
+class UnionFind:
+    """
+    Disjoint set forest with union by size and path halving.
+    """
+
+    def __init__(self, items: Iterable[Hashable]):
+        self.parent = {item: item for item in items}
+        self.size = {item: 1 for item in self.parent}
+
+    def find(self, item):
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a, b):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+
+
+def connected_components(vertices: Iterable[Hashable], edges: List[Tuple[int]]) -> List[List[Hashable]]:
+    """
+    Splits the graph into connected components using union-find over the edge list.
+    Returns the components as sorted vertex lists, largest component first.
+    """
+    uf = UnionFind(vertices)
+    for u, v in edges:
+        if u not in uf.parent:
+            uf.parent[u], uf.size[u] = u, 1
+        if v not in uf.parent:
+            uf.parent[v], uf.size[v] = v, 1
+        uf.union(u, v)
+
+    groups: Dict[Hashable, List[Hashable]] = {}
+    for item in uf.parent:
+        groups.setdefault(uf.find(item), []).append(item)
+    components = [sorted(group) for group in groups.values()]
+    components.sort(key=len, reverse=True)
+    return components
+
+
+def split_edges(components: List[List[Hashable]], edges: List[Tuple[int]]) -> List[List[Tuple[int]]]:
+    """
+    Buckets the edge list by the component each edge belongs to.
+    """
+    owner = {}
+    for index, component in enumerate(components):
+        for vertex in component:
+            owner[vertex] = index
+    buckets: List[List[Tuple[int]]] = [[] for _ in components]
+    for u, v in edges:
+        buckets[owner[u]].append((u, v))
+    return buckets
+
+
+def _init_component_worker(solver):
+    global _WORKER_SOLVER
+    _WORKER_SOLVER = solver
+
+
+def _solve_component(method_name: str, args: Tuple[Any, ...]):
+    return getattr(_WORKER_SOLVER, method_name)(*args)
+
+
+class ComponentSolverPool:
+    """
+    Lazily started process pool that runs one solver method per graph component.
+    Every worker receives a copy of the solver once, tasks only carry the component.
+    """
+
+    def __init__(self, solver, max_workers: int = None):
+        self.solver = solver
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.executor = None
+
+    def _start(self):
+        # the workers only need the solver methods, not the parsed input or this pool
+        worker_solver = copy.copy(self.solver)
+        worker_solver.solution_instances = []
+        worker_solver.component_pool = None
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_component_worker,
+            initargs=(worker_solver,),
+        )
+
+    def map(self, method_name: str, tasks: List[Tuple[Any, ...]], sizes: List[int]) -> List[Any]:
+        """
+        Runs getattr(solver, method_name)(*task) for every task and returns the results in order.
+        Falls back to running inline when there is nothing worth shipping to a worker.
+        """
+        worth_parallel = (
+            self.max_workers > 1
+            and sum(1 for size in sizes if size >= PARALLEL_MIN_VERTICES) >= 2
+        )
+        if not worth_parallel:
+            method = getattr(self.solver, method_name)
+            return [method(*task) for task in tasks]
+
+        if self.executor is None:
+            self._start()
+        futures = [self.executor.submit(_solve_component, method_name, task) for task in tasks]
+        return [future.result() for future in futures]
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
@@ -0,0 +1,52 @@
+from typing import Dict, List, Sequence, Tuple
+
+
+def gray_code_brute_force(n_vars: int, clauses: Sequence[Sequence[int]]) -> Tuple[bool, Dict[int, int]]:
+    """
+    Exhaustive search over all 2^n assignments in Gray-code order, starting from all variables 0.
+    Step i flips the variable of the lowest set bit of i, so only the clauses of that one variable
+    are touched: their true literal counts and the number of unsatisfied clauses are updated in
+    O(occurrences) instead of re-checking every clause.
+    Returns (ok, {var: 0/1}) like the other SAT methods, with an empty assignment when unsatisfiable.
+    """
+    n_vars = max([n_vars] + [abs(literal) for clause in clauses for literal in clause])
+    # positive[v] / negative[v] are the clauses where v appears unnegated / negated
+    positive: List[List[int]] = [[] for _ in range(n_vars + 1)]
+    negative: List[List[int]] = [[] for _ in range(n_vars + 1)]
+    true_count: List[int] = []
+    for clause in clauses:
+        literals = set(clause)
+        if any(-literal in literals for literal in literals):
+            # always satisfied
+            continue
+        if not literals:
+            return False, {}
+        index = len(true_count)
+        true_count.append(0)
+        for literal in literals:
+            if literal > 0:
+                positive[literal].append(index)
+            else:
+                # satisfied by the all-zero start
+                negative[-literal].append(index)
+                true_count[index] += 1
+
+    value = [0] * (n_vars + 1)
+    unsat = true_count.count(0)
+    step = 0
+    while unsat:
+        step += 1
+        if step >> n_vars:
+            return False, {}
+        var = (step & -step).bit_length()
+        value[var] ^= 1
+        made_true, made_false = (positive[var], negative[var]) if value[var] else (negative[var], positive[var])
+        for index in made_true:
+            if true_count[index] == 0:
+                unsat -= 1
+            true_count[index] += 1
+        for index in made_false:
+            true_count[index] -= 1
+            if true_count[index] == 0:
+                unsat += 1
+    return True, {var: value[var] for var in range(1, n_vars + 1)}
@@ -0,0 +1,263 @@
+import sys
+from typing import List, Optional, Tuple
+
+from src.helpers.graph_decomposition_helper import UnionFind
+from src.helpers.longest_cycle_helper import longest_cycle
+
+
+def prune_cycle_edges(adj: List[int]) -> Optional[List[int]]:
+    """
+    Fixes both edges of every degree-2 vertex and deletes the other edges of a vertex with two
+    forced edges, until nothing changes. Every Hamiltonian cycle survives in the returned bitset
+    adjacency, where forced edges are the only ones left at their vertices. None when the forced
+    edges already rule out a Hamiltonian cycle.
+    """
+    n = len(adj)
+    adj = list(adj)
+    forced = [0] * n
+    closed = UnionFind(range(n))
+    queue = list(range(n))
+    while queue:
+        v = queue.pop()
+        if adj[v].bit_count() < 2:
+            return None
+        if adj[v].bit_count() == 2:
+            rest = adj[v] & ~forced[v]
+            while rest:
+                bit = rest & -rest
+                rest ^= bit
+                w = bit.bit_length() - 1
+                if closed.find(v) == closed.find(w) and closed.size[closed.find(v)] < n:
+                    # the forced edges would close a cycle that misses vertices
+                    return None
+                closed.union(v, w)
+                forced[v] |= bit
+                forced[w] |= 1 << v
+                if forced[w].bit_count() > 2:
+                    return None
+                queue.append(w)
+        if forced[v].bit_count() == 2 and adj[v] != forced[v]:
+            rest = adj[v] & ~forced[v]
+            while rest:
+                bit = rest & -rest
+                rest ^= bit
+                adj[bit.bit_length() - 1] &= ~(1 << v)
+                queue.append(bit.bit_length() - 1)
+            adj[v] = forced[v]
+    return adj
+
+
+class HamiltonSearch:
+    """
+    DFS path extension over bitset adjacency with degree, connectivity, bipartite balance and
+    forced move pruning.
+    The cycle search runs on the adjacency left by prune_cycle_edges. A Hamiltonian path is searched as a Hamiltonian cycle through an extra vertex joined to everyone.
+    """
+
+    def __init__(self, vertices: set, edges: List[Tuple[int]]):
+        self.order = sorted(vertices)
+        self.n = len(self.order)
+        self.index = {vertex: i for i, vertex in enumerate(self.order)}
+        self.adj = [0] * self.n
+        for u, v in edges:
+            if u == v:
+                continue
+            self.adj[self.index[u]] |= 1 << self.index[v]
+            self.adj[self.index[v]] |= 1 << self.index[u]
+        self.full = (1 << self.n) - 1
+        self.hub = None
+        self.nodes = 0
+
+    def reach(self, adj: List[int], region: int, root: int) -> int:
+        # bitset BFS restricted to region, one word operation per expanded vertex
+        seen = frontier = 1 << root
+        while frontier:
+            reached = 0
+            while frontier:
+                bit = frontier & -frontier
+                frontier ^= bit
+                reached |= adj[bit.bit_length() - 1]
+            frontier = reached & region & ~seen
+            seen |= frontier
+        return seen
+
+    def sides(self, adj: List[int], region: int, root: int) -> Tuple[int, int, bool]:
+        """
+        reach that also 2-colours what it reaches by BFS layer: (vertices on the side of root,
+        vertices on the other side, whether no edge joins two vertices of one side).
+        """
+        sides = [1 << root, 0]
+        seen = frontier = 1 << root
+        side = 0
+        bipartite = True
+        while frontier:
+            reached = 0
+            while frontier:
+                bit = frontier & -frontier
+                frontier ^= bit
+                reached |= adj[bit.bit_length() - 1]
+            reached &= region
+            if reached & sides[side]:
+                bipartite = False
+            side ^= 1
+            frontier = reached & ~seen
+            sides[side] |= frontier
+            seen |= frontier
+        return sides[0], sides[1], bipartite
+
+    def _extend(self, adj: List[int], path: List[int], unvisited: int, start: int) -> bool:
+        self.nodes += 1
+        cur = path[-1]
+        if not unvisited:
+            return (adj[cur] >> start) & 1 == 1
+
+        # every unvisited vertex still needs two neighbours among the unvisited, cur and start
+        anchors = unvisited | (1 << cur) | (1 << start)
+        hub_bit = (1 << self.hub) & unvisited if self.hub is not None else 0
+        forced = 0
+        need_hub = 0
+        rest = unvisited
+        while rest:
+            bit = rest & -rest
+            rest ^= bit
+            w = bit.bit_length() - 1
+            avail = (adj[w] & anchors).bit_count()
+            if avail < 2:
+                return False
+            if avail == 2:
+                # a vertex left with exactly cur and one other neighbour must come right after cur
+                if cur != start and (adj[cur] & bit):
+                    forced |= bit
+                # and only two vertices can lean on the hub
+                if adj[w] & hub_bit:
+                    need_hub += 1
+        if forced & (forced - 1) or need_hub > 2:
+            return False
+        if not adj[start] & unvisited:
+            return False
+
+        # a route through a bipartite region alternates sides, so a path over it that starts on
+        # one side has that side ahead by one vertex when it is odd and level when it is even
+        if not hub_bit:
+            region = unvisited | (1 << cur)
+            own, other, bipartite = self.sides(adj, region, cur)
+            if own | other != region:
+                return False
+            if bipartite and (
+                own.bit_count() - other.bit_count() != region.bit_count() & 1
+                # from the root the route closes a cycle, which needs both sides level
+                or (cur == start and region.bit_count() & 1)
+            ):
+                return False
+        else:
+            # the route left is cur -> ... -> hub -> ... -> start, so the real vertices split
+            # into at most two pieces, one hanging off cur and one off start
+            region = (unvisited ^ hub_bit) | (1 << cur) | (1 << start)
+            own, other, bipartite = self.sides(adj, region, cur)
+            reached = own | other
+            if reached != region:
+                if reached >> start & 1:
+                    return False
+                rest = region & ~reached
+                rest_own, rest_other, rest_bipartite = self.sides(adj, rest, start)
+                if rest_own | rest_other != rest:
+                    return False
+                if bipartite and own.bit_count() - other.bit_count() != reached.bit_count() & 1:
+                    return False
+                if rest_bipartite and rest_own.bit_count() - rest_other.bit_count() != rest.bit_count() & 1:
+                    return False
+            elif bipartite:
+                balance = own.bit_count() - other.bit_count()
+                if cur == start:
+                    # one path through start
+                    low, high = -1, 1
+                elif own >> start & 1:
+                    # a path from cur and one into start, both may be ahead on the side of cur
+                    low, high = 0, 2
+                else:
+                    low, high = -1, 1
+                if not low <= balance <= high:
+                    return False
+
+        candidates = forced or (adj[cur] & unvisited)
+        ordered = []
+        while candidates:
+            bit = candidates & -candidates
+            candidates ^= bit
+            w = bit.bit_length() - 1
+            ordered.append(((adj[w] & unvisited).bit_count(), w))
+        # fewest onward moves first
+        ordered.sort()
+        for _, w in ordered:
+            path.append(w)
+            if self._extend(adj, path, unvisited & ~(1 << w), start):
+                return True
+            path.pop()
+        return False
+
+    def _search_cycle(self, adj: List[int], n: int) -> Optional[List[int]]:
+        if n < 3:
+            return None
+        full = (1 << n) - 1
+        degrees = [a.bit_count() for a in adj]
+        if min(degrees) < 2:
+            return None
+        start = degrees.index(min(degrees))
+        path = [start]
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(max(limit, n + 100))
+        try:
+            found = self._extend(adj, path, full & ~(1 << start), start)
+        finally:
+            sys.setrecursionlimit(limit)
+        return path if found else None
+
+    def find_cycle(self) -> Optional[List[int]]:
+        if self.n < 3:
+            return None
+        # forced and deleted edges only hold for cycles, the path and largest cycle keep self.adj
+        adj = prune_cycle_edges(self.adj)
+        if adj is None:
+            return None
+        return self._search_cycle(adj, self.n)
+
+    def find_path(self) -> Optional[List[int]]:
+        if self.n == 1:
+            return [0]
+        # join an extra vertex to every vertex, a Hamiltonian cycle through it is a path of the graph
+        hub = self.n
+        adj = [a | (1 << hub) for a in self.adj] + [self.full]
+        self.hub = hub
+        try:
+            cycle = self._search_cycle(adj, self.n + 1)
+        finally:
+            self.hub = None
+        if cycle is None:
+            return None
+        at = cycle.index(hub)
+        return cycle[at + 1:] + cycle[:at]
+
+    def labels(self, path: List[int]) -> List[int]:
+        return [self.order[i] for i in path]
+
+
+def hamilton_backtrack_search(
+    vertices: set, edges: List[Tuple[int]]
+) -> Tuple[bool, List[int], bool, List[int], int]:
+    """
+    Pruned backtracking for the Hamiltonian cycle, then the path, then the largest cycle.
+    """
+    search = HamiltonSearch(vertices, edges)
+    if search.n == 0:
+        return False, [], False, [], 0
+
+    cycle = search.find_cycle()
+    if cycle is not None:
+        path = search.labels(cycle)
+        return True, path, True, path + [path[0]], longest_cycle(search, hamiltonian_cycle_found=True)
+
+    path = search.find_path()
+    largest_cycle_size = longest_cycle(search)
+    if path is None:
+        return False, [], False, [], largest_cycle_size
+    return True, search.labels(path), False, [], largest_cycle_size
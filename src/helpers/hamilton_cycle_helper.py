@@ -1,79 +1,146 @@
-import csv
-import json
-import os
-import time
-from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Tuple
-
-from src.helpers.constants import CONFIGURATION_FILE_PATH, RESULTS_FOLDER
-from src.helpers.dmaics_parser import parse_cnf_instances_hamilton
+from abc import abstractmethod
+from typing import Any, Dict, Iterable, List, Tuple
+
+from src.helpers.constants import RESULTS_FOLDER
+from src.helpers.dmaics_parser import iter_cnf_instances_hamilton, parse_cnf_instances_hamilton
+from src.helpers.graph_decomposition_helper import ComponentSolverPool, connected_components, split_edges
+from src.helpers.hamilton_reduction_helper import solve_reduced
+from src.helpers.held_karp_helper import MAX_HELD_KARP_VERTICES, held_karp_peak_bytes
+from src.helpers.instance_features_helper import graph_features
 from src.helpers.project_selection_enum import ProjectSelection, SubProblemSelection
+from src.helpers.solver_harness_helper import SolverHarnessAbstractClass
+
+# Auto runs Held-Karp only while its peak memory stays this small, its cost does not depend on the graph
+AUTO_HELD_KARP_MAX_BYTES = 16 * 2**20
+
+
+class HamiltonCycleAbstractClass(SolverHarnessAbstractClass):
+    result_header = [
+        "Instance_ID",
+        "Num_Vertices",
+        "Num_Edges",
+        "Hamiltonian_Path",
+        "Hamiltonian_Cycle",
+        "Largest_Cycle_Size",
+        "Algorithm",
+        "Time",
+    ]
+    solver_methods = {
+        SubProblemSelection.brute_force: "hamilton_bruteforce",
+        SubProblemSelection.btracking: "hamilton_backtracking",
+        SubProblemSelection.simple: "hamilton_simple",
+        SubProblemSelection.best_case: "hamilton_bestcase",
+    }
 
-
-class HamiltonCycleAbstractClass(ABC):
     def __init__(
         self,
         cnf_file_input_path: str,
         result_file_name: str = "graph_coloring_results",
         results_folder_path: str = RESULTS_FOLDER,
     ):
-        self.cnf_file_input_path = cnf_file_input_path
-        self.results_folder_path = results_folder_path
-        self.result_file_name = result_file_name
-        self.config_path = CONFIGURATION_FILE_PATH
-        self.solution_instances = self.parse_input_file()
-        print(
-            f"Parsed {len(self.solution_instances)} instances from {self.cnf_file_input_path}"
-        )
-        self.sub_problems = self.set_config()
-
-    def set_config(self):
-        if not os.path.exists(self.config_path):
-            raise Exception("Please make sure the configuration file exists!!!")
-        with open(self.config_path, mode="r", encoding="utf-8") as conf_buffer:
-            data = json.load(conf_buffer)
-        data = data["Project Configuration"]
-        selection = data["Selection"]
-        sub_problem = data["Sub Problem"]
-        sub_probs = []
-        for sub_prob in sub_problem:
-            if sub_prob["value"] == SubProblemSelection.brute_force.value:
-                sub_probs.append(SubProblemSelection.brute_force)
-            elif sub_prob["value"] == SubProblemSelection.btracking.value:
-                sub_probs.append(SubProblemSelection.btracking)
-            elif sub_prob["value"] == SubProblemSelection.simple.value:
-                sub_probs.append(SubProblemSelection.simple)
-            elif sub_prob["value"] == SubProblemSelection.best_case.value:
-                sub_probs.append(SubProblemSelection.best_case)
-        return sub_probs
+        super().__init__(cnf_file_input_path, result_file_name, results_folder_path)
+        self.component_pool = ComponentSolverPool(self)
+
+    def solve_decomposed(
+        self, method, vertices: set, edges: List[Tuple[int]]
+    ) -> Tuple[bool, List[int], bool, List[int], int]:
+        """
+        A disconnected graph has neither a Hamiltonian path nor a cycle, so only the
+        largest cycle is left to find and every component is searched on its own.
+        """
+        components = connected_components(vertices, edges)
+        if len(components) <= 1:
+            return method(vertices, edges)
+
+        tasks, sizes = [], []
+        for component, component_edges in zip(components, split_edges(components, edges)):
+            # a cycle needs at least three vertices
+            if len(component) >= 3 and len(component_edges) >= 3:
+                tasks.append((set(component), component_edges))
+                sizes.append(len(component))
+
+        results = self.component_pool.map(method.__name__, tasks, sizes)
+        largest_cycle_size = max((result[4] for result in results), default=0)
+        return False, [], False, [], largest_cycle_size
 
     def parse_input_file(self):
         return parse_cnf_instances_hamilton(self.cnf_file_input_path)
 
-    def save_results(self, run_results: List[Any], sub_problem):
-        # Write to CSV
-        dir_name, file_name = os.path.split(self.cnf_file_input_path)
-        file_name_only, ext = os.path.splitext(file_name)
-        temp_result = os.path.join(
-            self.results_folder_path,
-            f"{sub_problem}_{file_name_only}_{self.result_file_name}.csv",
+    def iter_input_file(self):
+        return iter_cnf_instances_hamilton(self.cnf_file_input_path)
+
+    def worker_copy(self):
+        # a worker process searches the components of its instance inline, pools do not nest
+        worker = super().worker_copy()
+        worker.component_pool = ComponentSolverPool(worker, max_workers=1)
+        return worker
+
+    def instance_id(self, instance):
+        return instance.get("id", -1)
+
+    def solve_instance(self, method, instance):
+        # the reduction is part of the timed solve, instances it decides never reach the solver
+        vertices, edges = instance.get("vertices", set()), instance.get("edges", [])
+        result, reduction = solve_reduced(vertices, edges)
+        if result is not None:
+            instance["reduction"] = reduction.reason
+            return result
+        return self.solve_decomposed(method, vertices, edges)
+
+    def solve_selected(self, method_name: str, instance):
+        solved = super().solve_selected(method_name, instance)
+        reason = instance.pop("reduction", None)
+        if reason is not None:
+            print(f"Reduction decided instance {self.instance_id(instance)} without search: {reason}")
+        return solved
+
+    def instance_features(self, instance) -> Dict[str, Any]:
+        # the vertices the solvers see, Held-Karp's memory depends on their count
+        index = {vertex: i for i, vertex in enumerate(sorted(instance.get("vertices", set())))}
+        return graph_features(
+            len(index), [(index[u], index[v]) for u, v in instance.get("edges", [])]
         )
-        with open(temp_result, "w", newline="") as f:
-            w = csv.writer(f)
-            w.writerow(
-                [
-                    "Instance_ID",
-                    "Num_Vertices",
-                    "Num_Edges",
-                    "Hamiltonian_Path",
-                    "Hamiltonian_Cycle",
-                    "Largest_Cycle_Size",
-                    "Algorithm",
-                    "Time",
-                ]
-            )
-            w.writerows(run_results)
-        print(f"\nResults written to {temp_result}")
+
+    def route(self, features: Dict[str, Any]) -> str:
+        if held_karp_peak_bytes(features["n_vertices"]) <= AUTO_HELD_KARP_MAX_BYTES:
+            return "hamilton_bestcase"
+        return "hamilton_backtracking"
+
+    def format_rows(
+        self, instance, result, label: str, elapsed: float
+    ) -> Iterable[List[Any]]:
+        path_exists, path, cycle_exists, cycle, largest_cycle_size = result
+        yield [
+            instance.get("id", -1),
+            len(instance.get("vertices", set())),
+            len(instance.get("edges", [])),
+            path if path_exists else "None",
+            cycle if cycle_exists else "None",
+            largest_cycle_size,
+            label,
+            f"{elapsed:.6f}",
+        ]
+
+    def run(self):
+        if SubProblemSelection.best_case in self.sub_problems:
+            self.report_held_karp_memory()
+        super().run()
+
+    def report_held_karp_memory(self):
+        """
+        Prints the peak memory Best Case (Held-Karp) needs for the largest instance before anything
+        is solved. The streaming modes read the input once more just to count vertices.
+        """
+        instances = self.solution_instances or self.iter_input_file()
+        largest = max((len(instance.get("vertices", set())) for instance in instances), default=0)
+        if largest > MAX_HELD_KARP_VERTICES:
+            print(f"Held-Karp is limited to {MAX_HELD_KARP_VERTICES} vertices, the largest instance has {largest}")
+            return
+        print(f"Held-Karp needs up to {held_karp_peak_bytes(largest) / 2**20:.1f} MiB "
+              f"for the largest instance ({largest} vertices)")
+
+    def finish(self):
+        self.component_pool.shutdown()
 
     @abstractmethod
     def hamilton_backtracking(
@@ -98,119 +165,3 @@ class HamiltonCycleAbstractClass(ABC):
         self, vertices: set, edges: List[Tuple[int]]
     ) -> Tuple[bool, List[int], bool, List[int], int]:
         pass
-
-    def run(self):
-        results = []
-
-        for inst in self.solution_instances:
-            vertices: set = inst.get("vertices", set())
-            edges: list[tuple[int]] = inst.get("edges", [])
-            inst_id: int = inst.get("id", -1)
-            n_vertices: int = len(vertices)
-
-            if SubProblemSelection.brute_force in self.sub_problems:
-                t0 = time.perf_counter()
-                path_exists, path, cycle_exists, cycle, largest_cycle_size = (
-                    self.hamilton_bruteforce(vertices, edges)
-                )
-                bt_time = time.perf_counter() - t0
-                results.append(
-                    [
-                        inst_id,
-                        n_vertices,
-                        len(edges),
-                        path if path_exists else "None",
-                        cycle if cycle_exists else "None",
-                        largest_cycle_size,
-                        "BruteForce",
-                        f"{bt_time:.6f}",
-                    ]
-                )
-
-        if SubProblemSelection.brute_force in self.sub_problems:
-            self.save_results(results, SubProblemSelection.brute_force.name)
-            results = []
-
-        for inst in self.solution_instances:
-            vertices: set = inst.get("vertices", set())
-            edges: list[tuple[int]] = inst.get("edges", [])
-            inst_id: int = inst.get("id", -1)
-            n_vertices: int = len(vertices)
-
-            if SubProblemSelection.btracking in self.sub_problems:
-                t0 = time.perf_counter()
-                path_exists, path, cycle_exists, cycle, largest_cycle_size = (
-                    self.hamilton_backtracking(vertices, edges)
-                )
-                bt_time = time.perf_counter() - t0
-                results.append(
-                    [
-                        inst_id,
-                        n_vertices,
-                        len(edges),
-                        path if path_exists else "None",
-                        cycle if cycle_exists else "None",
-                        largest_cycle_size,
-                        f"{bt_time:.6f}",
-                    ]
-                )
-
-        if SubProblemSelection.btracking in self.sub_problems:
-            self.save_results(results, SubProblemSelection.btracking.name)
-            results = []
-
-        for inst in self.solution_instances:
-            vertices: set = inst.get("vertices", set())
-            edges: list[tuple[int]] = inst.get("edges", [])
-            inst_id: int = inst.get("id", -1)
-            n_vertices: int = len(vertices)
-
-            if SubProblemSelection.simple in self.sub_problems:
-                t0 = time.perf_counter()
-                path_exists, path, cycle_exists, cycle, largest_cycle_size = (
-                    self.hamilton_simple(vertices, edges)
-                )
-                bt_time = time.perf_counter() - t0
-                results.append(
-                    [
-                        inst_id,
-                        n_vertices,
-                        len(edges),
-                        path if path_exists else "None",
-                        cycle if cycle_exists else "None",
-                        largest_cycle_size,
-                        f"{bt_time:.6f}",
-                    ]
-                )
-
-        if SubProblemSelection.simple in self.sub_problems:
-            self.save_results(results, SubProblemSelection.simple.name)
-            results = []
-
-        for inst in self.solution_instances:
-            vertices: set = inst.get("vertices", set())
-            edges: list[tuple[int]] = inst.get("edges", [])
-            inst_id: int = inst.get("id", -1)
-            n_vertices: int = len(vertices)
-
-            if SubProblemSelection.best_case in self.sub_problems:
-                t0 = time.perf_counter()
-                path_exists, path, cycle_exists, cycle, largest_cycle_size = (
-                    self.hamilton_bestcase(vertices, edges)
-                )
-                bt_time = time.perf_counter() - t0
-                results.append(
-                    [
-                        inst_id,
-                        n_vertices,
-                        len(edges),
-                        path if path_exists else "None",
-                        cycle if cycle_exists else "None",
-                        largest_cycle_size,
-                        f"{bt_time:.6f}",
-                    ]
-                )
-
-        if SubProblemSelection.best_case in self.sub_problems:
-            self.save_results(results, SubProblemSelection.best_case.name)
-            results = []
@@ -0,0 +1,80 @@
+from typing import List, NamedTuple, Optional, Tuple
+
+from src.helpers.hamilton_backtracking_helper import HamiltonSearch, prune_cycle_edges
+from src.helpers.longest_cycle_helper import biconnected_components, longest_cycle
+
+
+class HamiltonReduction(NamedTuple):
+    """
+    What can be read off a graph before any search. decided means both questions are answered
+    and only the largest cycle is left to find.
+    """
+    no_path: bool
+    no_cycle: bool
+    reason: str
+
+    @property
+    def decided(self) -> bool:
+        return self.no_path and self.no_cycle
+
+
+def reduce_hamilton_graph(vertices: set, edges: List[Tuple[int]]) -> HamiltonReduction:
+    """
+    Rules out a Hamiltonian path or cycle from degrees, biconnectivity, articulation points and
+    the edges forced by degree-2 vertices. Uses the same vertices as the solvers, the ones in edges.
+    """
+    return _reduce(HamiltonSearch(vertices, edges))
+
+
+def _reduce(search: HamiltonSearch) -> HamiltonReduction:
+    n, adj = search.n, search.adj
+    if n < 3:
+        return HamiltonReduction(False, False, "")
+
+    no_path = no_cycle = False
+    reasons = []
+    degrees = [neighbours.bit_count() for neighbours in adj]
+    if min(degrees) == 0:
+        no_path = no_cycle = True
+        reasons.append("isolated vertex")
+    ones = degrees.count(1)
+    if ones:
+        no_cycle = True
+        reasons.append(f"{ones} degree-1 vertices")
+        if ones > 2:
+            no_path = True
+
+    blocks = biconnected_components(n, adj)
+    if not no_cycle and len(blocks) > 1:
+        no_cycle = True
+        reasons.append("not biconnected")
+    if not no_path:
+        # removing v leaves one piece per block through v, a path survives at most two
+        through = [0] * n
+        for block in blocks:
+            while block:
+                bit = block & -block
+                block ^= bit
+                through[bit.bit_length() - 1] += 1
+        if max(through) > 2:
+            no_path = True
+            reasons.append("articulation point splitting the graph in three")
+
+    if not no_cycle and prune_cycle_edges(adj) is None:
+        no_cycle = True
+        reasons.append("forced edges")
+    return HamiltonReduction(no_path, no_cycle, ", ".join(reasons))
+
+
+def solve_reduced(
+    vertices: set, edges: List[Tuple[int]]
+) -> Tuple[Optional[Tuple[bool, List[int], bool, List[int], int]], HamiltonReduction]:
+    """
+    (result, reduction): the result tuple when the reduction decides the graph, with the largest
+    cycle from the bounded longest-cycle search, or None when a solver has to search it.
+    """
+    search = HamiltonSearch(vertices, edges)
+    reduction = _reduce(search)
+    if not reduction.decided:
+        return None, reduction
+    return (False, [], False, [], longest_cycle(search)), reduction
@@ -0,0 +1,137 @@
+import math
+from typing import List, Tuple
+
+import numpy as np
+
+# one uint32 word and one popcount byte per subset, 2^26 subsets is 320 MiB
+MAX_HELD_KARP_VERTICES = 26
+# layers are scanned in aligned blocks of 2^BLOCK_BITS subsets, so no index array spans the table
+BLOCK_BITS = 18
+# most bytes _fill_table holds at once per subset of a block: masks, ends and low (12) while the
+# cycle check holds low - 1, its popcounts, the gathered adjacency and the AND with ends (13)
+BLOCK_BYTES_PER_MASK = 25
+
+
+def held_karp_peak_bytes(n_vertices: int) -> int:
+    """
+    Peak bytes of the arrays hamilton_held_karp allocates for n_vertices: the dp table and the
+    popcount index, plus the comparison mask of one block, the arrays of its fullest layer and
+    numpy's ufunc buffer.
+    """
+    bits = min(n_vertices, BLOCK_BITS)
+    table = (1 << n_vertices) * (np.dtype(np.uint32).itemsize + np.dtype(np.uint8).itemsize)
+    # numpy's ufunc buffer, used when an operation mixes dtypes
+    buffer = np.getbufsize() * np.dtype(np.float64).itemsize
+    return table + (1 << bits) + math.comb(bits, bits // 2) * BLOCK_BYTES_PER_MASK + buffer
+
+
+def _fill_table(dp: np.ndarray, adj: np.ndarray, popcount: np.ndarray, n: int, lowest_start: bool) -> int:
+    """
+    dp[mask] is a packed bit array of the vertices a simple path covering exactly mask can end at.
+    Subsets are processed in popcount order so every mask is final before it is extended.
+    With lowest_start the path has to start at the lowest vertex of its mask, which splits the
+    subsets into one cycle table per start vertex without extra memory, and the size of the
+    largest cycle is returned: a mask closes into one when a path over it ends next to its lowest
+    vertex. Returns 0 otherwise.
+    """
+    largest_cycle_size = 0
+    block = 1 << min(n, BLOCK_BITS)
+    block_bits = block.bit_length() - 1
+    for size in range(1, n + 1):
+        for offset in range(0, 1 << n, block):
+            # the subsets of an aligned block share the popcount of offset above the block bits
+            if not 0 <= size - offset.bit_count() <= block_bits:
+                continue
+            masks = np.flatnonzero(popcount[offset:offset + block] == size).astype(np.uint32)
+            masks += np.uint32(offset)
+            ends = dp[masks]
+            live = ends != 0
+            masks, ends = masks[live], ends[live]
+            if masks.size == 0:
+                continue
+            if lowest_start:
+                low = masks & (~masks + np.uint32(1))
+                if size >= 3 and np.any(ends & adj[np.bitwise_count(low - np.uint32(1))]):
+                    largest_cycle_size = size
+            if size == n:
+                continue
+            for v in range(n):
+                bit = np.uint32(1 << v)
+                extend = ((masks & bit) == 0) & ((ends & adj[v]) != 0)
+                if lowest_start:
+                    extend &= low < bit
+                targets = masks[extend] | bit
+                # masks -> masks | bit is injective for a fixed v so the fancy index has no duplicates
+                dp[targets] |= bit
+    return largest_cycle_size
+
+
+def _walk_back(dp: np.ndarray, adj_bits: List[int], mask: int, end: int) -> List[int]:
+    """
+    Rebuilds the path ending at `end` that covers `mask`; the dp bits double as parent pointers.
+    """
+    path = [end]
+    while mask & (mask - 1):
+        prev_mask = mask ^ (1 << end)
+        candidates = int(dp[prev_mask]) & adj_bits[end]
+        end = (candidates & -candidates).bit_length() - 1
+        mask = prev_mask
+        path.append(end)
+    path.reverse()
+    return path
+
+
+def hamilton_held_karp(
+    vertices: set, edges: List[Tuple[int]]
+) -> Tuple[bool, List[int], bool, List[int], int]:
+    """
+    Exact Hamiltonian path / cycle and largest cycle using the Held-Karp subset DP.
+    Runs in O(2^n * n) time with held_karp_peak_bytes(n) of memory.
+    """
+    order = sorted(vertices)
+    n = len(order)
+    if n == 0:
+        return False, [], False, [], 0
+    if n == 1:
+        return True, order, False, [], 0
+    if n > MAX_HELD_KARP_VERTICES:
+        raise ValueError(
+            f"Held-Karp needs {held_karp_peak_bytes(n) / 2**20:.0f} MiB for {n} vertices, "
+            f"the limit is {MAX_HELD_KARP_VERTICES} vertices"
+        )
+
+    index = {vertex: i for i, vertex in enumerate(order)}
+    adj_bits = [0] * n
+    for u, v in edges:
+        if u == v:
+            continue
+        adj_bits[index[u]] |= 1 << index[v]
+        adj_bits[index[v]] |= 1 << index[u]
+    adj = np.array(adj_bits, dtype=np.uint32)
+
+    full = (1 << n) - 1
+    # popcounts by doubling, the upper half of every prefix is the lower half plus one
+    popcount = np.zeros(full + 1, dtype=np.uint8)
+    for v in range(n):
+        np.add(popcount[:1 << v], 1, out=popcount[1 << v:2 << v])
+    dp = np.zeros(full + 1, dtype=np.uint32)
+    singles = np.uint32(1) << np.arange(n, dtype=np.uint32)
+    dp[singles] = singles
+
+    largest_cycle_size = _fill_table(dp, adj, popcount, n, lowest_start=True)
+
+    if largest_cycle_size == n:
+        last = int(dp[full]) & adj_bits[0]
+        path = _walk_back(dp, adj_bits, full, (last & -last).bit_length() - 1)
+        path = [order[i] for i in path]
+        return True, path, True, path + [path[0]], largest_cycle_size
+
+    # no Hamiltonian cycle, redo the table with every vertex allowed as the start of the path
+    dp[:] = 0
+    dp[singles] = singles
+    _fill_table(dp, adj, popcount, n, lowest_start=False)
+    ends = int(dp[full])
+    if not ends:
+        return False, [], False, [], largest_cycle_size
+    path = _walk_back(dp, adj_bits, full, (ends & -ends).bit_length() - 1)
+    return True, [order[i] for i in path], False, [], largest_cycle_size
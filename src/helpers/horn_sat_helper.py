@@ -0,0 +1,51 @@
+from collections import defaultdict
+from typing import Dict, List, Sequence, Tuple
+
+
+def solve_horn(n_vars: int, clauses: Sequence[Sequence[int]]) -> Tuple[bool, Dict[int, int]]:
+    """
+    Horn-SAT (at most one positive literal per clause) by linear-time unit propagation.
+    Starts from all variables false and only sets a variable when a clause forces it, so the
+    answer is the minimal model. Returns (ok, {var: 0/1}), empty when unsatisfiable.
+    """
+    n_vars = max([n_vars] + [abs(literal) for clause in clauses for literal in clause])
+    value = [0] * (n_vars + 1)
+    positive: List[int] = []
+    # clause -> number of its negated variables not yet true
+    waiting: List[int] = []
+    watchers: Dict[int, List[int]] = defaultdict(list)
+    queue: List[int] = []
+    for index, clause in enumerate(clauses):
+        heads = {literal for literal in clause if literal > 0}
+        if len(heads) > 1:
+            raise ValueError(f"Clause {list(clause)} has more than one positive literal")
+        positive.append(heads.pop() if heads else 0)
+        body = {-literal for literal in clause if literal < 0}
+        waiting.append(len(body))
+        for var in body:
+            watchers[var].append(index)
+        if not body:
+            queue.append(index)
+
+    while queue:
+        index = queue.pop()
+        head = positive[index]
+        if head == 0:
+            # every variable of a purely negative clause is true
+            return False, {}
+        if value[head]:
+            continue
+        value[head] = 1
+        for other in watchers[head]:
+            waiting[other] -= 1
+            if waiting[other] == 0:
+                queue.append(other)
+    return True, {var: value[var] for var in range(1, n_vars + 1)}
+
+
+def solve_anti_horn(n_vars: int, clauses: Sequence[Sequence[int]]) -> Tuple[bool, Dict[int, int]]:
+    """
+    Anti-Horn (at most one negative literal per clause) is Horn with every polarity flipped.
+    """
+    ok, assignment = solve_horn(n_vars, [[-literal for literal in clause] for clause in clauses])
+    return ok, {var: 1 - value for var, value in assignment.items()}
@@ -0,0 +1,381 @@
+import heapq
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# VSIDS activity decay and the conflicts in the first restart, later restarts follow the Luby sequence
+ACTIVITY_DECAY = 0.95
+RESTART_CONFLICTS = 100
+# learned clauses kept before the longer half is dropped, the limit grows by LEARNED_GROWTH each time
+MIN_LEARNED = 2000
+LEARNED_GROWTH = 1.1
+
+TRUE, FALSE, UNASSIGNED = 1, 0, -1
+
+
+def _luby(i: int) -> int:
+    # 1, 1, 2, 1, 1, 2, 4, 1, 1, 2, ...
+    size, exponent = 1, 0
+    while size < i + 1:
+        exponent += 1
+        size = 2 * size + 1
+    while size - 1 != i:
+        size = (size - 1) >> 1
+        exponent -= 1
+        i %= size
+    return 1 << exponent
+
+
+class IncrementalSatSolver:
+    """
+    CDCL solver that is kept alive between related queries. Clauses are added with add_clause,
+    solve(assumptions) answers under extra unit literals that only hold for that call, and
+    push/pop open and drop scopes of clauses. Learned clauses, variable activities and saved phases
+    stay from one call to the next, so the shared part of many similar formulas is only paid once.
+
+    Literals are DIMACS integers. A scope is a fresh selector variable s: clauses added inside it
+    get -s appended and every solve assumes s, so pop only has to add the unit clause -s, which
+    also retires every learned clause derived from the scope.
+    """
+
+    def __init__(self, clauses: Iterable[Sequence[int]] = ()):
+        # internal variables start at 1, user variables and scope selectors are mapped onto them
+        self.internal: Dict[int, int] = {}
+        self.external: List[int] = [0]
+        self.scopes: List[int] = []
+        self.ok = True
+
+        self.clauses: List[List[int]] = []
+        self.learned: List[bool] = []
+        self.n_learned = 0
+        self.max_learned = MIN_LEARNED
+        # watches[code] are the clauses watching the literal with that code
+        self.watches: List[List[int]] = [[], []]
+        self.lit_value: List[int] = [UNASSIGNED, UNASSIGNED]
+        self.level: List[int] = [0]
+        self.reason: List[Optional[int]] = [None]
+        self.activity: List[float] = [0.0]
+        self.phase: List[int] = [FALSE]
+        self.heap: List[Tuple[float, int]] = []
+        self.activity_inc = 1.0
+
+        self.trail: List[int] = []
+        self.trail_lim: List[int] = []
+        self.queue_head = 0
+        self.conflicts = 0
+        self.decisions = 0
+        self.propagations = 0
+
+        for clause in clauses:
+            self.add_clause(clause)
+
+    # literal codes: 2 * var for the positive literal, 2 * var + 1 for the negative one
+
+    def _new_var(self, external: int) -> int:
+        var = len(self.external)
+        self.external.append(external)
+        self.watches += [[], []]
+        self.lit_value += [UNASSIGNED, UNASSIGNED]
+        self.level.append(0)
+        self.reason.append(None)
+        self.activity.append(0.0)
+        self.phase.append(FALSE)
+        heapq.heappush(self.heap, (0.0, var))
+        return var
+
+    def _code(self, literal: int) -> int:
+        var = self.internal.get(abs(literal))
+        if var is None:
+            var = self.internal[abs(literal)] = self._new_var(abs(literal))
+        return 2 * var + (literal < 0)
+
+    @property
+    def n_vars(self) -> int:
+        return len(self.internal)
+
+    def add_clause(self, clause: Sequence[int]):
+        """
+        Adds a clause to the innermost open scope, or permanently outside of any scope.
+        """
+        codes = [self._code(literal) for literal in clause]
+        if self.scopes:
+            codes.append(2 * self.scopes[-1] + 1)
+        self._add_codes(codes)
+
+    def push(self):
+        """
+        Opens a scope, the clauses added until the matching pop are dropped by it.
+        """
+        self.scopes.append(self._new_var(0))
+
+    def pop(self):
+        selector = self.scopes.pop()
+        self._add_codes([2 * selector + 1])
+
+    def _add_codes(self, codes: List[int]):
+        self._backtrack(0)
+        if not self.ok:
+            return
+        kept: List[int] = []
+        for code in dict.fromkeys(codes):
+            if code ^ 1 in kept or self.lit_value[code] == TRUE:
+                # tautology or already satisfied for good
+                return
+            if self.lit_value[code] == UNASSIGNED:
+                kept.append(code)
+        if not kept:
+            self.ok = False
+        elif len(kept) == 1:
+            self._enqueue(kept[0], None)
+            self.ok = self._propagate() is None
+        else:
+            self._attach(kept, learned=False)
+
+    def _attach(self, codes: List[int], learned: bool) -> int:
+        index = len(self.clauses)
+        self.clauses.append(codes)
+        self.learned.append(learned)
+        self.watches[codes[0]].append(index)
+        self.watches[codes[1]].append(index)
+        return index
+
+    def _enqueue(self, code: int, reason: Optional[int]):
+        var = code >> 1
+        self.lit_value[code] = TRUE
+        self.lit_value[code ^ 1] = FALSE
+        self.level[var] = len(self.trail_lim)
+        self.reason[var] = reason
+        self.trail.append(code)
+
+    def _propagate(self) -> Optional[int]:
+        """
+        Unit propagation over two watched literals, returns a falsified clause or None.
+        """
+        lit_value, clauses, watches = self.lit_value, self.clauses, self.watches
+        while self.queue_head < len(self.trail):
+            false_code = self.trail[self.queue_head] ^ 1
+            self.queue_head += 1
+            self.propagations += 1
+            watching = watches[false_code]
+            kept: List[int] = []
+            for at, index in enumerate(watching):
+                clause = clauses[index]
+                if clause[0] == false_code:
+                    clause[0], clause[1] = clause[1], clause[0]
+                if lit_value[clause[0]] == TRUE:
+                    kept.append(index)
+                    continue
+                for other in range(2, len(clause)):
+                    if lit_value[clause[other]] != FALSE:
+                        clause[1], clause[other] = clause[other], clause[1]
+                        watches[clause[1]].append(index)
+                        break
+                else:
+                    kept.append(index)
+                    if lit_value[clause[0]] == FALSE:
+                        kept.extend(watching[at + 1:])
+                        watches[false_code] = kept
+                        return index
+                    self._enqueue(clause[0], index)
+            watches[false_code] = kept
+        return None
+
+    def _bump(self, var: int):
+        self.activity[var] += self.activity_inc
+        if self.activity[var] > 1e100:
+            self.activity = [activity * 1e-100 for activity in self.activity]
+            self.activity_inc *= 1e-100
+            self._rebuild_heap()
+        heapq.heappush(self.heap, (-self.activity[var], var))
+        if len(self.heap) > 8 * len(self.external):
+            # drop the stale entries every bump leaves behind
+            self._rebuild_heap()
+
+    def _rebuild_heap(self):
+        self.heap = [(-self.activity[var], var) for var in range(1, len(self.external))]
+        heapq.heapify(self.heap)
+
+    def _analyze(self, conflict: int) -> Tuple[List[int], int]:
+        """
+        First UIP learned clause, asserting literal first, and the level to jump back to.
+        """
+        seen = set()
+        learned = [0]
+        pending = 0
+        code = -1
+        at = len(self.trail) - 1
+        current = len(self.trail_lim)
+        index: Optional[int] = conflict
+        while True:
+            for other in self.clauses[index]:
+                var = other >> 1
+                if other == code or var in seen or self.level[var] == 0:
+                    continue
+                seen.add(var)
+                self._bump(var)
+                if self.level[var] == current:
+                    pending += 1
+                else:
+                    learned.append(other)
+            while self.trail[at] >> 1 not in seen:
+                at -= 1
+            code = self.trail[at]
+            at -= 1
+            pending -= 1
+            if pending == 0:
+                break
+            index = self.reason[code >> 1]
+        learned[0] = code ^ 1
+        self.activity_inc /= ACTIVITY_DECAY
+        # drop literals implied by the rest of the clause through their reason
+        in_clause = {other >> 1 for other in learned}
+        learned = [learned[0]] + [other for other in learned[1:] if not self._redundant(other, in_clause)]
+        if len(learned) == 1:
+            return learned, 0
+        # the literal of the highest remaining level is watched second
+        deepest = max(range(1, len(learned)), key=lambda i: self.level[learned[i] >> 1])
+        learned[1], learned[deepest] = learned[deepest], learned[1]
+        return learned, self.level[learned[1] >> 1]
+
+    def _redundant(self, code: int, in_clause: set) -> bool:
+        index = self.reason[code >> 1]
+        if index is None:
+            return False
+        return all(other >> 1 in in_clause or self.level[other >> 1] == 0 for other in self.clauses[index])
+
+    def _reduce_learned(self):
+        """
+        Keeps the shorter half of the learned clauses, only called at level 0 where no clause
+        is the reason of a literal that conflict analysis looks at.
+        """
+        learned = sorted((index for index, flag in enumerate(self.learned) if flag),
+                         key=lambda index: len(self.clauses[index]))
+        dropped = set(learned[len(learned) // 2:])
+        self.clauses = [clause for index, clause in enumerate(self.clauses) if index not in dropped]
+        self.learned = [flag for index, flag in enumerate(self.learned) if index not in dropped]
+        self.n_learned -= len(dropped)
+        self.max_learned = int(self.max_learned * LEARNED_GROWTH)
+        self.watches = [[] for _ in self.watches]
+        for index, clause in enumerate(self.clauses):
+            self.watches[clause[0]].append(index)
+            self.watches[clause[1]].append(index)
+        for code in self.trail:
+            self.reason[code >> 1] = None
+
+    def _backtrack(self, level: int):
+        if len(self.trail_lim) <= level:
+            return
+        start = self.trail_lim[level]
+        for code in self.trail[start:]:
+            var = code >> 1
+            self.phase[var] = self.lit_value[2 * var]
+            self.lit_value[code] = self.lit_value[code ^ 1] = UNASSIGNED
+            self.reason[var] = None
+            heapq.heappush(self.heap, (-self.activity[var], var))
+        del self.trail[start:]
+        del self.trail_lim[level:]
+        self.queue_head = len(self.trail)
+
+    def _pick_branch(self) -> int:
+        while self.heap:
+            _, var = heapq.heappop(self.heap)
+            if self.lit_value[2 * var] == UNASSIGNED:
+                return 2 * var + (self.phase[var] == FALSE)
+        return -1
+
+    def solve(self, assumptions: Sequence[int] = ()) -> Tuple[bool, Dict[int, int]]:
+        """
+        Returns (ok, {var: 0/1}) over the user variables, with an empty assignment when the
+        clauses have no model in which every assumption holds. Assumptions are dropped afterwards,
+        learned clauses are kept.
+        """
+        if not self.ok:
+            return False, {}
+        assumed = [2 * selector for selector in self.scopes] + [self._code(literal) for literal in assumptions]
+        restart = 0
+        budget = RESTART_CONFLICTS * _luby(restart)
+        try:
+            while True:
+                conflict = self._propagate()
+                if conflict is not None:
+                    self.conflicts += 1
+                    budget -= 1
+                    if not self.trail_lim:
+                        self.ok = False
+                        return False, {}
+                    if assumed and len(self.trail_lim) == 1:
+                        # the assumptions alone propagate to a conflict
+                        return False, {}
+                    learned, level = self._analyze(conflict)
+                    self._backtrack(level)
+                    if len(learned) == 1:
+                        self._enqueue(learned[0], None)
+                    else:
+                        self.n_learned += 1
+                        self._enqueue(learned[0], self._attach(learned, learned=True))
+                    continue
+                if budget <= 0:
+                    restart += 1
+                    budget = RESTART_CONFLICTS * _luby(restart)
+                    self._backtrack(0)
+                    if self.n_learned > self.max_learned:
+                        self._reduce_learned()
+                    continue
+                if assumed and not self.trail_lim:
+                    # every assumption goes on decision level 1, so they cost one propagation
+                    # per restart however many there are
+                    self.trail_lim.append(len(self.trail))
+                    for code in assumed:
+                        if self.lit_value[code] == FALSE:
+                            # the clauses or an opposite assumption force it false
+                            return False, {}
+                        if self.lit_value[code] == UNASSIGNED:
+                            self._enqueue(code, None)
+                    continue
+                code = self._pick_branch()
+                if code == -1:
+                    return True, {
+                        external: int(self.lit_value[2 * self.internal[external]] == TRUE)
+                        for external in sorted(self.internal)
+                    }
+                self.decisions += 1
+                self.trail_lim.append(len(self.trail))
+                self._enqueue(code, None)
+        finally:
+            self._backtrack(0)
+
+
+class ClauseSelectorSolver:
+    """
+    Solves whole formulas over the variables 1..n_vars on one IncrementalSatSolver. The clauses every
+    formula so far contained are the base and are added as they are, the others are added once each,
+    guarded by a selector variable above n_vars, and a formula is solved by assuming the selectors of
+    its extra clauses. Learned clauses stay valid and are reused for as long as the base holds.
+    A formula without some base clause shrinks the base to the clauses it does share and starts a new
+    solver, or makes its own clauses the base when it shares less than half of them.
+    """
+
+    def __init__(self, n_vars: int):
+        self.n_vars = n_vars
+        self.solver: Optional[IncrementalSatSolver] = None
+        self.base: set = set()
+        self.selectors: Dict[Tuple[int, ...], int] = {}
+
+    def solve(self, clauses: Iterable[Sequence[int]]) -> Tuple[bool, Dict[int, int]]:
+        keys = dict.fromkeys(tuple(sorted(set(clause))) for clause in clauses)
+        if self.solver is None or not self.base <= keys.keys():
+            shared = self.base & keys.keys()
+            self.base = shared if self.solver is not None and 2 * len(shared) >= len(keys) else set(keys)
+            self.solver = IncrementalSatSolver(sorted(self.base))
+            self.selectors = {}
+        assumptions = []
+        for key in keys:
+            if key in self.base:
+                continue
+            selector = self.selectors.get(key)
+            if selector is None:
+                selector = self.selectors[key] = self.n_vars + 1 + len(self.selectors)
+                self.solver.add_clause(key + (-selector,))
+            assumptions.append(selector)
+        ok, assignment = self.solver.solve(assumptions)
+        if not ok:
+            return False, {}
+        return True, {var: assignment.get(var, 0) for var in range(1, self.n_vars + 1)}
@@ -0,0 +1,80 @@
+import itertools
+from typing import Any, Dict, Sequence, Tuple
+
+import numpy as np
+
+from src.helpers.bin_packing_bounds_helper import lower_bound_l1, lower_bound_l2
+
+
+def cnf_features(n_vars: int, clauses: Sequence[Sequence[int]]) -> Dict[str, Any]:
+    """
+    Structural features of a CNF formula, computed over flat literal arrays.
+    """
+    lengths = np.fromiter(map(len, clauses), dtype=np.int64, count=len(clauses))
+    literals = np.fromiter(itertools.chain.from_iterable(clauses), dtype=np.int64, count=int(lengths.sum()))
+    n_vars = max(n_vars, int(np.abs(literals).max())) if literals.size else n_vars
+    n_clauses = len(clauses)
+
+    # positive and negative literals per clause
+    clause_of = np.repeat(np.arange(n_clauses), lengths)
+    positives = np.bincount(clause_of, weights=literals > 0, minlength=n_clauses)
+    negatives = lengths - positives
+    occurrences = np.bincount(np.abs(literals), minlength=n_vars + 1)[1:]
+    length_values, length_counts = np.unique(lengths, return_counts=True)
+
+    return {
+        "n_vars": n_vars,
+        "n_clauses": n_clauses,
+        "clause_var_ratio": n_clauses / n_vars if n_vars else 0.0,
+        "clause_lengths": {int(length): int(count) for length, count in zip(length_values, length_counts)},
+        "max_clause_length": int(lengths.max()) if n_clauses else 0,
+        "two_cnf": bool(n_clauses == 0 or (lengths.min() >= 1 and lengths.max() <= 2)),
+        "horn": bool(np.all(positives <= 1)),
+        "anti_horn": bool(np.all(negatives <= 1)),
+        "positive_fraction": float((literals > 0).mean()) if literals.size else 0.0,
+        "var_occurrence_mean": float(occurrences.mean()) if n_vars else 0.0,
+        "var_occurrence_max": int(occurrences.max()) if n_vars else 0,
+        "var_occurrence_std": float(occurrences.std()) if n_vars else 0.0,
+        "unused_vars": int(np.count_nonzero(occurrences == 0)),
+    }
+
+
+def graph_features(n_vertices: int, edges: Sequence[Tuple[int, int]]) -> Dict[str, Any]:
+    """
+    Size, density and degree statistics of an undirected graph on vertices 0..n_vertices-1.
+    Repeated edges count once, self-loops are only counted and left out of the rest.
+    """
+    pairs = np.array(edges, dtype=np.int64).reshape(-1, 2)
+    loops = pairs[:, 0] == pairs[:, 1]
+    self_loops = int(np.unique(pairs[loops, 0]).size)
+    pairs = pairs[~loops]
+    pairs = np.unique(np.sort(pairs, axis=1), axis=0)
+    n_vertices = max(n_vertices, int(pairs.max()) + 1) if pairs.size else n_vertices
+    degrees = np.bincount(pairs.ravel(), minlength=n_vertices)
+    n_edges = len(pairs)
+    possible = n_vertices * (n_vertices - 1) // 2
+    return {
+        "n_vertices": n_vertices,
+        "n_edges": n_edges,
+        "density": n_edges / possible if possible else 0.0,
+        "min_degree": int(degrees.min()) if n_vertices else 0,
+        "max_degree": int(degrees.max()) if n_vertices else 0,
+        "mean_degree": float(degrees.mean()) if n_vertices else 0.0,
+        "self_loops": self_loops,
+    }
+
+
+def bin_packing_features(bin_capacity: int, items: Sequence[int]) -> Dict[str, Any]:
+    """
+    Size, fill and bound features of a bin packing instance.
+    """
+    sizes = np.asarray(items, dtype=np.int64)
+    return {
+        "n_items": int(sizes.size),
+        "bin_capacity": int(bin_capacity),
+        "fill_ratio": float(sizes.sum() / bin_capacity),
+        "large_item_fraction": float((2 * sizes > bin_capacity).mean()) if sizes.size else 0.0,
+        "distinct_sizes": int(np.unique(sizes).size),
+        "lower_bound_l1": lower_bound_l1(bin_capacity, sizes),
+        "lower_bound_l2": lower_bound_l2(bin_capacity, sizes),
+    }
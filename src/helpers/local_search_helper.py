@@ -0,0 +1,145 @@
+import random
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+ALGORITHMS = ("probsat", "walksat")
+
+
+class LocalSearchOptions(NamedTuple):
+    """
+    "local_search" entry of the "Execution" block, every field optional.
+    cb and eps shape the probSAT break weights (eps + break) ** -cb, noise is the WalkSAT
+    random walk probability.
+    """
+    algorithm: str = "probsat"
+    max_flips: int = 100000
+    max_tries: int = 10
+    cb: float = 2.38
+    eps: float = 1.0
+    noise: float = 0.567
+    seed: int = 0
+
+    @classmethod
+    def from_options(cls, options: Optional[Dict[str, Any]]) -> "LocalSearchOptions":
+        options = cls(**(options or {}))
+        if options.algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown local search algorithm {options.algorithm!r}, expected one of {ALGORITHMS}")
+        return options
+
+
+class _SearchState:
+    """
+    Assignment plus the incremental bookkeeping of one try: true literal count of every clause,
+    the sum of the variables of its true literals (the one true variable when the count is 1),
+    the break score of every variable and the unsatisfied clauses as a packed list.
+    """
+
+    def __init__(self, n_vars: int, clauses: List[List[int]], occurrences: List[List[int]], rng: random.Random):
+        self.clauses = clauses
+        self.occurrences = occurrences
+        self.value = [False] + [rng.random() < 0.5 for _ in range(n_vars)]
+        self.true_count = [0] * len(clauses)
+        self.true_sum = [0] * len(clauses)
+        self.breaks = [0] * (n_vars + 1)
+        self.unsat: List[int] = []
+        self.unsat_at = [-1] * len(clauses)
+        for index, clause in enumerate(clauses):
+            for literal in clause:
+                if self.value[abs(literal)] == (literal > 0):
+                    self.true_count[index] += 1
+                    self.true_sum[index] += abs(literal)
+            if self.true_count[index] == 0:
+                self._add_unsat(index)
+            elif self.true_count[index] == 1:
+                self.breaks[self.true_sum[index]] += 1
+
+    def _add_unsat(self, index: int):
+        self.unsat_at[index] = len(self.unsat)
+        self.unsat.append(index)
+
+    def _remove_unsat(self, index: int):
+        # swap the last clause into the hole
+        at = self.unsat_at[index]
+        last = self.unsat.pop()
+        if last != index:
+            self.unsat[at] = last
+            self.unsat_at[last] = at
+        self.unsat_at[index] = -1
+
+    def flip(self, var: int):
+        self.value[var] = not self.value[var]
+        made_true = var if self.value[var] else -var
+        true_count, true_sum, breaks = self.true_count, self.true_sum, self.breaks
+        for index in self.occurrences[made_true]:
+            true_count[index] += 1
+            if true_count[index] == 1:
+                self._remove_unsat(index)
+                breaks[var] += 1
+            elif true_count[index] == 2:
+                breaks[true_sum[index]] -= 1
+            true_sum[index] += var
+        for index in self.occurrences[-made_true]:
+            true_count[index] -= 1
+            true_sum[index] -= var
+            if true_count[index] == 0:
+                self._add_unsat(index)
+                breaks[var] -= 1
+            elif true_count[index] == 1:
+                breaks[true_sum[index]] += 1
+
+
+def _pick_probsat(clause: List[int], breaks: List[int], weights: List[float], rng: random.Random) -> int:
+    candidates = [abs(literal) for literal in clause]
+    return rng.choices(candidates, [weights[breaks[var]] for var in candidates])[0]
+
+
+def _pick_walksat(clause: List[int], breaks: List[int], noise: float, rng: random.Random) -> int:
+    candidates = [abs(literal) for literal in clause]
+    scores = [breaks[var] for var in candidates]
+    best = min(scores)
+    if best > 0 and rng.random() < noise:
+        return rng.choice(candidates)
+    return rng.choice([var for var, score in zip(candidates, scores) if score == best])
+
+
+def local_search(n_vars: int, clauses: Sequence[Sequence[int]],
+                 options: LocalSearchOptions = LocalSearchOptions()) -> Tuple[Optional[bool], Dict[int, int]]:
+    """
+    Incomplete SAT search: probSAT or WalkSAT flips from random assignments, restarting after
+    options.max_flips flips, for at most options.max_tries tries. A flip costs the occurrences of the
+    flipped variable. Returns (True, {var: 0/1}) when a model is found, (False, {}) only for an
+    empty clause, and (None, {}) when the budget runs out without an answer.
+    """
+    n_vars = max([n_vars] + [abs(literal) for clause in clauses for literal in clause])
+    prepared: List[List[int]] = []
+    for clause in clauses:
+        literals = set(clause)
+        if any(-literal in literals for literal in literals):
+            # always satisfied
+            continue
+        if not literals:
+            return False, {}
+        prepared.append(sorted(literals))
+
+    # occurrences[literal] are the clauses containing literal, negative literals index from the end
+    occurrences: List[List[int]] = [[] for _ in range(2 * n_vars + 1)]
+    for index, clause in enumerate(prepared):
+        for literal in clause:
+            occurrences[literal].append(index)
+    max_break = max((len(occurrence) for occurrence in occurrences), default=0)
+    weights = [(options.eps + score) ** -options.cb for score in range(max_break + 1)]
+
+    rng = random.Random(options.seed)
+    for _ in range(options.max_tries):
+        state = _SearchState(n_vars, prepared, occurrences, rng)
+        for _ in range(options.max_flips):
+            if not state.unsat:
+                break
+            clause = prepared[state.unsat[rng.randrange(len(state.unsat))]]
+            if options.algorithm == "probsat":
+                var = _pick_probsat(clause, state.breaks, weights, rng)
+            else:
+                var = _pick_walksat(clause, state.breaks, options.noise, rng)
+            state.flip(var)
+        if not state.unsat:
+            return True, {var: int(state.value[var]) for var in range(1, n_vars + 1)}
+    return None, {}
@@ -0,0 +1,142 @@
+from typing import TYPE_CHECKING, List, Tuple
+
+if TYPE_CHECKING:
+    from src.helpers.hamilton_backtracking_helper import HamiltonSearch
+
+
+def biconnected_components(n: int, adj: List[int]) -> List[int]:
+    """
+    Iterative Tarjan over bitset adjacency, returns every biconnected component as a vertex bitset.
+    """
+    disc = [-1] * n
+    low = [0] * n
+    components = []
+    edge_stack: List[Tuple[int, int]] = []
+    clock = 0
+
+    def neighbours(v: int):
+        rest = adj[v]
+        while rest:
+            bit = rest & -rest
+            rest ^= bit
+            yield bit.bit_length() - 1
+
+    for root in range(n):
+        if disc[root] != -1 or not adj[root]:
+            continue
+        disc[root] = low[root] = clock
+        clock += 1
+        stack = [(root, -1, neighbours(root))]
+        while stack:
+            v, parent, pending = stack[-1]
+            descended = False
+            for w in pending:
+                if disc[w] == -1:
+                    edge_stack.append((v, w))
+                    disc[w] = low[w] = clock
+                    clock += 1
+                    stack.append((w, v, neighbours(w)))
+                    descended = True
+                    break
+                if w != parent and disc[w] < disc[v]:
+                    edge_stack.append((v, w))
+                    low[v] = min(low[v], disc[w])
+            if descended:
+                continue
+            stack.pop()
+            if not stack:
+                continue
+            u = stack[-1][0]
+            low[u] = min(low[u], low[v])
+            if low[v] >= disc[u]:
+                component = 0
+                while True:
+                    a, b = edge_stack.pop()
+                    component |= (1 << a) | (1 << b)
+                    if (a, b) == (u, v):
+                        break
+                components.append(component)
+    return components
+
+
+class LongestCycleSearch:
+    """
+    Branch and bound for the largest simple cycle, reusing the adjacency of a HamiltonSearch.
+    A cycle never leaves its biconnected component, so components are searched largest first and
+    the search stops as soon as a cycle spans the largest component still to be searched.
+    A cycle in a bipartite component has as many vertices on each side, which caps both the
+    component and every partial path at twice its smaller side.
+    """
+
+    def __init__(self, search: "HamiltonSearch"):
+        self.search = search
+        self.best = 0
+        self.limit = 0
+        # one side of the component being searched when it is bipartite, else None
+        self.side = None
+        self.cycles = 0
+
+    def _extend(self, path: List[int], region: int, start: int, visited: int):
+        adj = self.search.adj
+        cur = path[-1]
+        # paths are rooted at the lowest vertex of their cycle, so a cycle is in canonical
+        # rotation here and is counted once, in the direction that leaves towards its smaller neighbour
+        if len(path) >= 3 and (adj[cur] >> start) & 1 and path[1] < cur:
+            self.cycles += 1
+            self.best = max(self.best, len(path))
+
+        open_region = region & ~visited
+        # vertices still reachable from cur bound how long this cycle can get
+        reachable = self.search.reach(adj, open_region | (1 << cur), cur)
+        if len(path) + reachable.bit_count() - 1 <= self.best:
+            return
+        if self.side is not None:
+            usable = visited | reachable
+            if 2 * min((usable & self.side).bit_count(), (usable & ~self.side).bit_count()) <= self.best:
+                return
+
+        options = adj[cur] & open_region
+        while options and self.best < self.limit:
+            bit = options & -options
+            options ^= bit
+            path.append(bit.bit_length() - 1)
+            self._extend(path, region, start, visited | bit)
+            path.pop()
+
+    def run(self, lower_bound: int = 0) -> int:
+        n = self.search.n
+        self.best = lower_bound
+        blocks = []
+        for block in biconnected_components(n, self.search.adj):
+            if block.bit_count() < 3:
+                continue
+            root = (block & -block).bit_length() - 1
+            own, other, bipartite = self.search.sides(self.search.adj, block, root)
+            if bipartite:
+                blocks.append((2 * min(own.bit_count(), other.bit_count()), own, block))
+            else:
+                blocks.append((block.bit_count(), None, block))
+        blocks.sort(key=lambda entry: entry[0], reverse=True)
+        for limit, side, block in blocks:
+            if limit <= self.best:
+                break
+            self.limit, self.side = limit, side
+            rest = block
+            while rest and self.best < self.limit:
+                bit = rest & -rest
+                rest ^= bit
+                # cycles are rooted at their lowest vertex, later roots only see higher vertices
+                region = rest
+                if region.bit_count() + 1 <= self.best:
+                    break
+                self._extend([bit.bit_length() - 1], region | bit, bit.bit_length() - 1, bit)
+        return self.best
+
+
+def longest_cycle(search: "HamiltonSearch", hamiltonian_cycle_found: bool = False) -> int:
+    """
+    Largest_Cycle_Size for the graph held by search, free when a Hamiltonian cycle was found.
+    """
+    if hamiltonian_cycle_found:
+        return search.n
+    return LongestCycleSearch(search).run()
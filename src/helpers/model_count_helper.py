@@ -0,0 +1,181 @@
+import sys
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+# upper bound on the literals held by the component cache keys, least recently used ones go first
+MAX_CACHE_LITERALS = 2_000_000
+
+Clause = Tuple[int, ...]
+
+
+def _assign(clauses: List[Clause], literal: int) -> List[Clause]:
+    # clauses with literal are satisfied, -literal is dropped from the rest
+    return [tuple(other for other in clause if other != -literal) for clause in clauses if literal not in clause]
+
+
+def _propagate(clauses: List[Clause]) -> Tuple[Optional[List[Clause]], Set[int]]:
+    """
+    Unit propagation over occurrence lists, linear in the size of the clauses. Returns the
+    simplified clauses and the variables it fixed, or None for the clauses when some clause is falsified.
+    """
+    occurrences: Dict[int, List[int]] = {}
+    for index, clause in enumerate(clauses):
+        for literal in clause:
+            occurrences.setdefault(literal, []).append(index)
+    # literals of each clause not falsified yet
+    remaining = [len(clause) for clause in clauses]
+    satisfied = [False] * len(clauses)
+    value: Dict[int, bool] = {}
+    queue: List[int] = []
+
+    def enqueue(literal: int) -> bool:
+        # False when the opposite literal is already set
+        known = value.get(abs(literal))
+        if known is None:
+            value[abs(literal)] = literal > 0
+            queue.append(literal)
+            return True
+        return known == (literal > 0)
+
+    for clause in clauses:
+        if not clause or (len(clause) == 1 and not enqueue(clause[0])):
+            return None, set(value)
+    while queue:
+        literal = queue.pop()
+        for index in occurrences.get(literal, ()):
+            satisfied[index] = True
+        for index in occurrences.get(-literal, ()):
+            if satisfied[index]:
+                continue
+            remaining[index] -= 1
+            if remaining[index] == 0:
+                return None, set(value)
+            if remaining[index] == 1:
+                # the literal left is unset, true or false but still queued, which conflicts when it comes up
+                unit = next((other for other in clauses[index] if value.get(abs(other), other > 0) == (other > 0)), None)
+                if unit is not None:
+                    enqueue(unit)
+
+    fixed = set(value)
+    if not fixed:
+        return clauses, fixed
+    return [
+        tuple(literal for literal in clause if abs(literal) not in value)
+        for index, clause in enumerate(clauses) if not satisfied[index]
+    ], fixed
+
+
+def _components(clauses: List[Clause]) -> List[List[Clause]]:
+    # clauses that share a variable, directly or through other clauses, end up together
+    parent: Dict[int, int] = {}
+
+    def find(var: int) -> int:
+        while parent.setdefault(var, var) != var:
+            parent[var] = parent[parent[var]]
+            var = parent[var]
+        return var
+
+    for clause in clauses:
+        root = find(abs(clause[0]))
+        for literal in clause[1:]:
+            other = find(abs(literal))
+            if other != root:
+                parent[other] = root
+    groups: Dict[int, List[Clause]] = {}
+    for clause in clauses:
+        groups.setdefault(find(abs(clause[0])), []).append(clause)
+    return list(groups.values())
+
+
+def _canonical(clauses: List[Clause]) -> Tuple[Clause, ...]:
+    """
+    Cache key of a component: variables renumbered 1, 2, ... in order of first appearance in the
+    sorted clauses, so copies of the same structure over other variables share one entry.
+    """
+    names: Dict[int, int] = {}
+    renamed = []
+    for clause in sorted(clauses):
+        renamed.append(tuple(sorted(
+            names.setdefault(abs(literal), len(names) + 1) * (1 if literal > 0 else -1) for literal in clause
+        )))
+    return tuple(sorted(renamed))
+
+
+class ModelCounter:
+    """
+    Exact #SAT by DPLL with component caching. After unit propagation the residual formula is split
+    into components with disjoint variables whose counts multiply, variables no clause mentions any
+    more double the count each. Every component is counted once under its canonical clause set
+    (see _canonical) and kept in an LRU cache bounded by max_cache_literals.
+    Counts are Python ints, so they never overflow.
+    """
+
+    def __init__(self, max_cache_literals: int = MAX_CACHE_LITERALS):
+        self.max_cache_literals = max_cache_literals
+        self.cache: "OrderedDict[Tuple[Clause, ...], int]" = OrderedDict()
+        self.cache_literals = 0
+        self.hits = 0
+        self.misses = 0
+
+    def count(self, n_vars: int, clauses: Sequence[Sequence[int]]) -> int:
+        """
+        Number of assignments of variables 1..n_vars (and any larger variable in the clauses)
+        that satisfy every clause.
+        """
+        n_vars = max([n_vars] + [abs(literal) for clause in clauses for literal in clause])
+        prepared: List[Clause] = []
+        for clause in clauses:
+            literals = set(clause)
+            if any(-literal in literals for literal in literals):
+                # always satisfied
+                continue
+            prepared.append(tuple(sorted(literals)))
+        # _count and _count_component recurse once each per branch variable
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(max(limit, 2 * n_vars + 100))
+        try:
+            return self._count(prepared, n_vars)
+        finally:
+            sys.setrecursionlimit(limit)
+
+    def _count(self, clauses: List[Clause], n_vars: int) -> int:
+        # n_vars is the number of variables the clauses range over, including ones they no longer mention
+        clauses, fixed = _propagate(clauses)
+        if clauses is None:
+            return 0
+        mentioned = {abs(literal) for clause in clauses for literal in clause}
+        total = 1 << (n_vars - len(fixed) - len(mentioned))
+        for component in _components(clauses):
+            total *= self._count_component(component)
+            if total == 0:
+                return 0
+        return total
+
+    def _count_component(self, clauses: List[Clause]) -> int:
+        key = _canonical(clauses)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return cached
+        self.misses += 1
+
+        occurrences: Dict[int, int] = {}
+        for clause in clauses:
+            for literal in clause:
+                occurrences[abs(literal)] = occurrences.get(abs(literal), 0) + 1
+        var = max(occurrences, key=occurrences.get)
+        # the branch variable is set on both sides, the others keep ranging over the component
+        n_vars = len(occurrences) - 1
+        result = self._count(_assign(clauses, var), n_vars) + self._count(_assign(clauses, -var), n_vars)
+
+        self.cache[key] = result
+        self.cache_literals += sum(map(len, key))
+        while self.cache_literals > self.max_cache_literals and self.cache:
+            evicted, _ = self.cache.popitem(last=False)
+            self.cache_literals -= sum(map(len, evicted))
+        return result
+
+
+def count_models(n_vars: int, clauses: Sequence[Sequence[int]], max_cache_literals: int = MAX_CACHE_LITERALS) -> int:
+    return ModelCounter(max_cache_literals).count(n_vars, clauses)
@@ -0,0 +1,150 @@
+import asyncio
+import csv
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, Hashable, List, Tuple
+
+# how many instances may wait between two stages, per solver worker
+QUEUE_SLOTS_PER_WORKER = 2
+
+_WORKER_HARNESS = None
+
+# marks the end of a queue
+_DONE = object()
+
+
+def _init_pipeline_worker(harness):
+    global _WORKER_HARNESS
+    _WORKER_HARNESS = harness
+
+
+def _solve_in_worker(method_name: str, instance) -> Tuple[Any, Any, List[Any]]:
+    # timed inside the worker so queueing and pickling never count as solve time
+    return _WORKER_HARNESS.solve_selected(method_name, instance)
+
+
+def start_pipeline_pool(harness, max_workers: int) -> ProcessPoolExecutor:
+    """
+    Process pool whose workers each hold one worker copy of the harness.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_pipeline_worker,
+        initargs=(harness.worker_copy(),),
+    )
+
+
+class SolvePipeline:
+    """
+    Streams one sub problem through three overlapped stages: the parser feeds a bounded queue,
+    solver tasks hand instances to the process pool, and the writer appends rows in input order,
+    holding answers that arrive early until the ones before them are written. The parser takes a
+    slot for every instance it reads and the writer gives it back once that instance's rows are
+    written, so a slow instance holds back the stream instead of letting answers pile up behind it,
+    and the first row is written as soon as the first instance is solved.
+    """
+
+    def __init__(self, harness, sub_problem: str, method_name: str, label: str, executor: Executor, workers: int):
+        self.harness = harness
+        self.sub_problem = sub_problem
+        self.method_name = method_name
+        self.label = label
+        self.executor = executor
+        self.workers = workers
+        self.solved = 0
+        self.distinct = 0
+        # most answers ever held back waiting for an earlier instance
+        self.most_waiting = 0
+
+    async def _parse(self, parsed: asyncio.Queue, slots: asyncio.Semaphore):
+        loop = asyncio.get_running_loop()
+        instances = self.harness.iter_input_file()
+        index = 0
+        while True:
+            await slots.acquire()
+            # file reads stay off the event loop
+            instance = await loop.run_in_executor(None, next, instances, _DONE)
+            if instance is _DONE:
+                break
+            await parsed.put((index, instance))
+            index += 1
+        for _ in range(self.workers):
+            await parsed.put(_DONE)
+
+    async def _solve(self, parsed: asyncio.Queue, answered: asyncio.Queue, shared: Dict[Hashable, asyncio.Future]):
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await parsed.get()
+            if item is _DONE:
+                await answered.put(_DONE)
+                return
+            index, instance = item
+            key = self.harness.instance_key(instance)
+            if key is None or key not in shared:
+                future = loop.run_in_executor(self.executor, _solve_in_worker, self.method_name, instance)
+                if key is not None:
+                    # identical instances later in the stream wait on this same solve
+                    shared[key] = future
+                    self.distinct += 1
+            else:
+                future = shared[key]
+            result, timing, extra = await future
+            await answered.put((index, instance, result, timing, extra))
+
+    async def _write(self, answered: asyncio.Queue, slots: asyncio.Semaphore, out_path: str):
+        running = self.workers
+        waiting: Dict[int, Tuple[Any, Any, Any, List[Any]]] = {}
+        with open(out_path, "w", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(self.harness.csv_header(self.sub_problem))
+            while running:
+                item = await answered.get()
+                if item is _DONE:
+                    running -= 1
+                    continue
+                index, *answer = item
+                waiting[index] = answer
+                self.most_waiting = max(self.most_waiting, len(waiting))
+                while self.solved in waiting:
+                    instance, result, timing, extra = waiting.pop(self.solved)
+                    w.writerows(self.harness.result_rows(instance, result, self.label, timing, extra))
+                    self.solved += 1
+                    slots.release()
+                if answered.empty():
+                    # nothing else is ready, let the rows so far reach the file
+                    f.flush()
+
+    async def run(self, out_path: str):
+        slots = QUEUE_SLOTS_PER_WORKER * self.workers
+        parsed: asyncio.Queue = asyncio.Queue(maxsize=slots)
+        answered: asyncio.Queue = asyncio.Queue(maxsize=slots)
+        shared: Dict[Hashable, asyncio.Future] = {}
+        # instances read but not yet written, whatever stage they are in
+        in_flight = asyncio.Semaphore(slots)
+        tasks = [asyncio.create_task(self._parse(parsed, in_flight)),
+                 asyncio.create_task(self._write(answered, in_flight, out_path))]
+        tasks += [asyncio.create_task(self._solve(parsed, answered, shared)) for _ in range(self.workers)]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        if shared:
+            print(f"Solved {self.distinct} distinct of {self.solved} instances with {self.label}")
+
+
+def run_pipelined(harness, max_workers: int = None):
+    """
+    Runs every selected sub problem of harness through a SolvePipeline on one shared process pool.
+    """
+    workers = max_workers or os.cpu_count() or 1
+    executor = start_pipeline_pool(harness, workers)
+    try:
+        for sub_problem, method_name, label in harness.selected_methods():
+            out_path = harness.result_path(sub_problem.name)
+            pipeline = SolvePipeline(harness, sub_problem.name, method_name, label, executor, workers)
+            asyncio.run(pipeline.run(out_path))
+            print(f"\nResults written to {out_path}")
+    finally:
+        executor.shutdown(cancel_futures=True)
@@ -0,0 +1,165 @@
+import cProfile
+import io
+import marshal
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional
+
+# rows of the ranked hot-function summary
+SUMMARY_TOP_FUNCTIONS = 25
+
+
+class SamplingProfiler:
+    """
+    Low-overhead alternative to cProfile: a background thread looks at the profiled thread's stack
+    every interval seconds. Exposes the enable / disable / dump_stats / create_stats surface of
+    cProfile.Profile and writes the same marshalled pstats format, with sample counts in place of
+    call counts and every sample weighted by the wall time since the previous one.
+    """
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self.self_time: Counter = Counter()
+        self.total_time: Counter = Counter()
+        self.callers: Dict[tuple, Counter] = defaultdict(Counter)
+        self.stats: Dict[tuple, tuple] = {}
+        self._target = None
+        self._stop = None
+        self._thread = None
+        self._switch_interval = None
+
+    @staticmethod
+    def _key(code) -> tuple:
+        return code.co_filename, code.co_firstlineno, code.co_name
+
+    def _sample(self):
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            now = time.perf_counter()
+            weight, last = now - last, now
+            stack = []
+            while frame is not None:
+                stack.append(self._key(frame.f_code))
+                frame = frame.f_back
+            if not stack:
+                continue
+            self.self_time[stack[0]] += weight
+            # recursion puts a function on the stack many times, it still counts once per sample
+            for key in set(stack):
+                self.samples[key] += 1
+                self.total_time[key] += weight
+            for callee, caller in zip(stack, stack[1:]):
+                self.callers[callee][caller] += 1
+
+    def enable(self):
+        self._target = threading.get_ident()
+        self._stop = threading.Event()
+        # the sampler needs the GIL at least as often as it wants to sample
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval / 2))
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+
+    def disable(self):
+        self._stop.set()
+        self._thread.join()
+        sys.setswitchinterval(self._switch_interval)
+
+    def create_stats(self):
+        self.stats = {
+            key: (count, count, self.self_time[key], self.total_time[key], dict(self.callers[key]))
+            for key, count in self.samples.items()
+        }
+
+    def dump_stats(self, path: str):
+        self.create_stats()
+        with open(path, "wb") as f:
+            marshal.dump(self.stats, f)
+
+
+PROFILERS = ("cprofile", "sampling")
+
+
+class SolveProfiler:
+    """
+    Profiling mode of the harness, configured by the "profile" entry of the "Execution" block:
+        {"methods": ["sat_backtracking"], "instances": ["3"], "profiler": "cprofile", "interval": 0.001}
+    methods takes solver method names or sub problem names and instances takes instance ids, a
+    missing list selects everything. Every selected call is dumped to <results csv>_profiles/<id>.prof
+    and a ranked hot-function summary of all of a method's calls goes to <results csv>_profile.txt.
+    """
+
+    def __init__(self, options: Dict[str, Any]):
+        self.methods = set(options.get("methods") or [])
+        self.instances = {str(inst_id) for inst_id in options.get("instances") or []}
+        self.profiler = options.get("profiler", "cprofile")
+        if self.profiler not in PROFILERS:
+            raise ValueError(f"Unknown profiler {self.profiler}, expected one of {list(PROFILERS)}")
+        self.interval = float(options.get("interval", 0.001))
+        self.active = False
+        self.result_path = ""
+        self.dumps: List[str] = []
+
+    @classmethod
+    def from_options(cls, options: Optional[Dict[str, Any]]) -> Optional["SolveProfiler"]:
+        return cls(options) if options is not None else None
+
+    def begin(self, method_name: str, sub_problem: str, result_path: str):
+        """
+        Starts a results file, its calls are profiled when the method is selected.
+        """
+        self.active = not self.methods or bool({method_name, sub_problem} & self.methods)
+        self.result_path = result_path
+        self.dumps = []
+
+    def _profile_dir(self) -> str:
+        return os.path.splitext(self.result_path)[0] + "_profiles"
+
+    def call(self, inst_id, fn, *args):
+        """
+        Returns fn(*args), profiled when the current method and inst_id are selected.
+        """
+        if not self.active or (self.instances and str(inst_id) not in self.instances):
+            return fn(*args)
+        if self.profiler == "cprofile":
+            profiler = cProfile.Profile()
+        else:
+            profiler = SamplingProfiler(self.interval)
+        profiler.enable()
+        try:
+            return fn(*args)
+        finally:
+            profiler.disable()
+            profiler.create_stats()
+            # a call shorter than one sample leaves nothing to dump
+            if profiler.stats:
+                os.makedirs(self._profile_dir(), exist_ok=True)
+                path = os.path.join(self._profile_dir(), f"{inst_id}.prof")
+                profiler.dump_stats(path)
+                self.dumps.append(path)
+
+    def finish(self):
+        """
+        Writes the ranked summary over every profile dumped for the current results file.
+        """
+        if not self.dumps:
+            return
+        stream = io.StringIO()
+        stats = pstats.Stats(*self.dumps, stream=stream)
+        stats.strip_dirs()
+        # the dump files are listed once here instead of above every table
+        stats.files = []
+        print(f"{len(self.dumps)} profiled calls, {self.profiler} profiler, in {self._profile_dir()}", file=stream)
+        for order in ("tottime", "cumulative"):
+            stats.sort_stats(order).print_stats(SUMMARY_TOP_FUNCTIONS)
+        summary_path = os.path.splitext(self.result_path)[0] + "_profile.txt"
+        with open(summary_path, "w") as f:
+            f.write(stream.getvalue())
+        print(f"Profile of {len(self.dumps)} calls written to {summary_path}")
+        self.dumps = []
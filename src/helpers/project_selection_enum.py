@@ -12,3 +12,7 @@ class SubProblemSelection(str, Enum):
     btracking = "Backtracking"
     best_case = "Best Case"
     simple = "Simple"
+    auto = "Auto"
+    local_search = "Local Search"
+    model_count = "Model Count"
+    incremental = "Incremental"
@@ -1,62 +1,226 @@
-from abc import ABC, abstractmethod
+from abc import abstractmethod
+from src.helpers.batch_sat_helper import batch_brute_force
+from src.helpers.drat_helper import DratWriter, check_proof
+from src.helpers.dmaics_parser import iter_multi_instance_dimacs, parse_multi_instance_dimacs
+from src.helpers.horn_sat_helper import solve_anti_horn, solve_horn
+from src.helpers.incremental_sat_helper import ClauseSelectorSolver, IncrementalSatSolver
+from src.helpers.instance_features_helper import cnf_features
+from src.helpers.local_search_helper import LocalSearchOptions, local_search
+from src.helpers.model_count_helper import MAX_CACHE_LITERALS, count_models
+from src.helpers.two_sat_helper import solve_two_sat
+from src.helpers.solver_harness_helper import AUTO_METHOD, SolverHarnessAbstractClass
+from src.helpers.constants import RESULTS_FOLDER
+from typing import List, Tuple, Dict, Any, Iterable, Optional
+from src.helpers.project_selection_enum import ProjectSelection, SubProblemSelection
+from collections import defaultdict
 import os
-from src.helpers.dmaics_parser import parse_multi_instance_dimacs
-from src.helpers.constants import RESULTS_FOLDER, CONFIGURATION_FILE_PATH
-from typing import List, Tuple, Dict, Any
-import json
-import csv
+import shutil
 import time
-from src.helpers.project_selection_enum import ProjectSelection, SubProblemSelection
 
+# batch mode brute-forces instances up to this many variables together, bigger ones one by one
+BATCH_MAX_VARS = 20
+
+# the Incremental sub problem starts a fresh solver once the shared one holds this many distinct clauses
+INCREMENTAL_MAX_CLAUSES = 100_000
+
+# satisfiable column, None is an incomplete method that gave up
+SATISFIABLE_LABELS = {True: "S", False: "U", None: "UNKNOWN"}
+
+# extra column of the Model Count results, written right after the solution
+MODEL_COUNT_COLUMN = "model_count"
+
+# every method route can pick, the Auto sub problem writes proofs under their names
+AUTO_ROUTES = ("sat_two_cnf", "sat_horn", "sat_anti_horn", "sat_backtracking")
 
-class SatSolverAbstractClass(ABC):
+
+class SatSolverAbstractClass(SolverHarnessAbstractClass):
+
+    result_header = ["instance_id", "n_vars", "n_clauses", "method",
+                     "satisfiable", "time_seconds", "solution"]
+    solver_methods = {
+        SubProblemSelection.brute_force: "sat_bruteforce",
+        SubProblemSelection.btracking: "sat_backtracking",
+        SubProblemSelection.simple: "sat_simple",
+        SubProblemSelection.best_case: "sat_bestcase",
+        SubProblemSelection.local_search: "sat_local_search",
+        SubProblemSelection.model_count: "sat_model_count",
+        SubProblemSelection.incremental: "sat_incremental",
+    }
 
     def __init__(self, 
                     cnf_file_input_path: str,
                     result_file_name:str = "sat_solver_results",
                     results_folder_path: str = RESULTS_FOLDER):
-        self.cnf_file_input_path = cnf_file_input_path
-        self.results_folder_path = results_folder_path
-        self.result_file_name = result_file_name
-        self.config_path = CONFIGURATION_FILE_PATH
-        self.solution_instances = self.parse_input_file()
-        print(f"Parsed {len(self.solution_instances)} instances from {self.cnf_file_input_path}")
-        self.sub_problems = self.set_config()
-
-    def set_config(self):
-        if not os.path.exists(self.config_path):
-            raise Exception("Please make sure the configuration file exists!!!")
-        with open(self.config_path, mode = 'r' , encoding= 'utf-8') as conf_buffer:
-            data = json.load(conf_buffer)
-        data = data["Project Configuration"]
-        selection = data["Selection"]
-        sub_problem = data["Sub Problem"]
-        sub_probs = []
-        for sub_prob in sub_problem:
-            if sub_prob["value"] == SubProblemSelection.brute_force.value:
-                sub_probs.append(SubProblemSelection.brute_force)
-            elif sub_prob["value"] == SubProblemSelection.btracking.value:
-                sub_probs.append(SubProblemSelection.btracking)
-            elif sub_prob["value"] == SubProblemSelection.simple.value:
-                sub_probs.append(SubProblemSelection.simple)
-            elif sub_prob["value"] == SubProblemSelection.best_case.value:
-                sub_probs.append(SubProblemSelection.best_case)
-        return sub_probs
-        
+        super().__init__(cnf_file_input_path, result_file_name, results_folder_path)
+        self.local_search_options = LocalSearchOptions.from_options(self.execution.get("local_search"))
+        # branching heuristic of sat_backtracking, see branching_helper.HEURISTICS
+        self.branching = self.execution.get("branching")
+        self.max_cache_literals = self.execution.get("model_count", {}).get("max_cache_literals", MAX_CACHE_LITERALS)
+        self.max_incremental_clauses = self.execution.get("incremental", {}).get("max_clauses", INCREMENTAL_MAX_CLAUSES)
+        # one shared solver per variable count for the Incremental sub problem, see sat_incremental
+        self.incremental_solvers: Dict[int, ClauseSelectorSolver] = {}
+        # DRAT proofs of U answers, the writer of the instance being solved is in self.proof.
+        # sat_backtracking switches to the branching search in proof mode, see the docs in src/sat.py
+        self.proof_options = self.execution.get("proof")
+        self.proof: Optional[DratWriter] = None
+
     def parse_input_file(self):
         return parse_multi_instance_dimacs(self.cnf_file_input_path)
-    
-    def save_results(self, run_results: List[Any], sub_problem):
-        # Write to CSV
-        dir_name, file_name = os.path.split(self.cnf_file_input_path)
-        file_name_only, ext = os.path.splitext(file_name)
-        temp_result = os.path.join(self.results_folder_path, f"{sub_problem}_{file_name_only}_{self.result_file_name}.csv")
-        with open(temp_result, "w", newline="") as f:
-            w = csv.writer(f)
-            w.writerow(["instance_id", "n_vars", "n_clauses", "method",
-                        "satisfiable", "time_seconds", "solution"])
-            w.writerows(run_results)
-        print(f"\nResults written to {temp_result}")
+
+    def iter_input_file(self):
+        return iter_multi_instance_dimacs(self.cnf_file_input_path)
+
+    def solve_instance(self, method, instance):
+        inst_id, n_vars, clauses = instance
+        if self.proof_options is None:
+            return method(n_vars, clauses)
+        self.proof = DratWriter(os.path.join(self.proof_dir(method.__name__), f"{inst_id}.drat"))
+        try:
+            result = method(n_vars, clauses)
+        except BaseException:
+            self.proof.discard()
+            raise
+        finally:
+            proof, self.proof = self.proof, None
+        # only U answers of methods that log proofs are written out, in one write
+        if result[0] is False and proof.lemmas:
+            proof.close()
+        else:
+            proof.discard()
+        return result
+
+    def proof_dir(self, method_name: str) -> str:
+        return os.path.splitext(self.result_path(method_name))[0] + "_proofs"
+
+    def proof_dirs(self) -> List[str]:
+        """
+        Proof directory of every method this run can call.
+        """
+        names = []
+        for sub_problem, method_name, label in self.selected_methods():
+            names += AUTO_ROUTES if method_name == AUTO_METHOD else [method_name]
+        return [self.proof_dir(name) for name in dict.fromkeys(names)]
+
+    def run(self):
+        if self.proof_options is not None:
+            # proofs left by an earlier run would be checked against this run's instances
+            for proof_dir in self.proof_dirs():
+                shutil.rmtree(proof_dir, ignore_errors=True)
+        super().run()
+
+    def finish(self):
+        """
+        Checks every proof this run wrote against its instance, streaming both.
+        """
+        super().finish()
+        if self.proof_options is None:
+            return
+        proof_dirs = []
+        for proof_dir in self.proof_dirs():
+            if not os.path.isdir(proof_dir):
+                continue
+            if os.listdir(proof_dir):
+                proof_dirs.append(proof_dir)
+            else:
+                # the method answered U without logging a proof, or never answered U
+                os.rmdir(proof_dir)
+        if not self.proof_options.get("check", True):
+            return
+        checked = {proof_dir: [] for proof_dir in proof_dirs}
+        for inst_id, n_vars, clauses in self.iter_input_file():
+            for proof_dir in proof_dirs:
+                path = os.path.join(proof_dir, f"{inst_id}.drat")
+                if os.path.exists(path):
+                    checked[proof_dir].append((inst_id, check_proof(clauses, path)))
+        for proof_dir, results in checked.items():
+            failed = [inst_id for inst_id, ok in results if not ok]
+            print(f"Verified {len(results) - len(failed)} of {len(results)} DRAT proofs in {proof_dir}")
+            if failed:
+                print(f"Proofs rejected for instances {failed}")
+
+    def instance_features(self, instance) -> Dict[str, Any]:
+        inst_id, n_vars, clauses = instance
+        return cnf_features(n_vars, clauses)
+
+    def route(self, features: Dict[str, Any]) -> str:
+        # polynomial fragments first, everything else is searched
+        if features["two_cnf"]:
+            return "sat_two_cnf"
+        if features["horn"]:
+            return "sat_horn"
+        if features["anti_horn"]:
+            return "sat_anti_horn"
+        return "sat_backtracking"
+
+    def sat_two_cnf(self, n_vars:int, clauses:List[List[int]]) -> Tuple[bool, Dict[int, bool]]:
+        return solve_two_sat(n_vars, clauses)
+
+    def sat_horn(self, n_vars:int, clauses:List[List[int]]) -> Tuple[bool, Dict[int, bool]]:
+        return solve_horn(n_vars, clauses)
+
+    def sat_anti_horn(self, n_vars:int, clauses:List[List[int]]) -> Tuple[bool, Dict[int, bool]]:
+        return solve_anti_horn(n_vars, clauses)
+
+    def sat_local_search(self, n_vars:int, clauses:List[List[int]]) -> Tuple[Optional[bool], Dict[int, bool]]:
+        # incomplete, None when the flip budget runs out
+        return local_search(n_vars, clauses, self.local_search_options)
+
+    def sat_model_count(self, n_vars:int, clauses:List[List[int]]) -> Tuple[bool, Dict[int, bool], int]:
+        # the count comes from the component cache counter, the solution column still gets one model
+        count = count_models(n_vars, clauses, self.max_cache_literals)
+        if count == 0:
+            return False, {}, 0
+        ok, assignment = IncrementalSatSolver(clauses).solve()
+        n_vars = max([n_vars] + list(assignment))
+        return ok, {var: assignment.get(var, 0) for var in range(1, n_vars + 1)}, count
+
+    def sat_incremental(self, n_vars:int, clauses:List[List[int]]) -> Tuple[bool, Dict[int, bool]]:
+        # instances over the same variables reuse one CDCL solver and what it learned from the
+        # clauses they share with earlier instances, benchmark repeats therefore time a warm solver
+        n_vars = max([n_vars] + [abs(literal) for clause in clauses for literal in clause])
+        solver = self.incremental_solvers.get(n_vars)
+        if solver is None or len(solver.selectors) > self.max_incremental_clauses:
+            solver = self.incremental_solvers[n_vars] = ClauseSelectorSolver(n_vars)
+        return solver.solve(clauses)
+
+    def csv_header(self, sub_problem: str) -> List[str]:
+        header = super().csv_header(sub_problem)
+        if sub_problem == SubProblemSelection.model_count.name:
+            header.insert(len(self.result_header), MODEL_COUNT_COLUMN)
+        return header
+
+    def solve_batch(self, method_name: str, instances: List[Any]) -> Optional[List[Tuple[Any, float]]]:
+        """
+        Brute force of every group of instances with the same variable count in one vectorized pass,
+        see batch_sat_helper. Each instance is charged an equal share of its group's time.
+        """
+        if method_name != "sat_bruteforce":
+            return None
+        max_vars = self.batch.get("max_vars", BATCH_MAX_VARS)
+        groups = defaultdict(list)
+        solved: List[Tuple[Any, float]] = [None] * len(instances)
+        for at, (inst_id, n_vars, clauses) in enumerate(instances):
+            n = max([n_vars] + [abs(literal) for clause in clauses for literal in clause])
+            if n <= max_vars:
+                groups[n].append(at)
+            else:
+                solved[at] = self.timed_solve(self.sat_bruteforce, instances[at])
+        for n, members in groups.items():
+            t0 = time.perf_counter()
+            results = batch_brute_force(n, [instances[at][2] for at in members])
+            share = (time.perf_counter() - t0) / len(members)
+            for at, result in zip(members, results):
+                solved[at] = (result, share)
+        return solved
+
+    def format_rows(self, instance, result, label: str, elapsed: float) -> Iterable[List[Any]]:
+        inst_id, n_vars, clauses = instance
+        # the Model Count method also returns the count
+        bt_ok, bt_assign, *count = result
+        yield [inst_id, n_vars, len(clauses), label,
+               SATISFIABLE_LABELS[bt_ok],
+               elapsed,
+               str(bt_assign)] + count
     
     @abstractmethod
     def sat_backtracking(self, n_vars:int, clauses:List[List[int]]) -> Tuple[bool, Dict[int, bool]]:
@@ -73,82 +237,3 @@ class SatSolverAbstractClass(ABC):
     @abstractmethod
     def sat_bestcase(self, n_vars:int, clauses:List[List[int]]) -> Tuple[bool, Dict[int, bool]]:
         pass
-
-    def run(self):
-        results = []
-        
-        for inst_id, n_vars, clauses in self.solution_instances:
-
-            if SubProblemSelection.brute_force in self.sub_problems:
-                t0 = time.perf_counter()
-                bt_ok, bt_assign = self.sat_bruteforce(n_vars, clauses)
-                bt_time = time.perf_counter() - t0
-                results.append([inst_id, n_vars, len(clauses),
-                                 "BruteForce",
-                            "S" if bt_ok else "U", 
-                            bt_time,
-                            str(bt_assign)])
-        
-        if SubProblemSelection.brute_force in self.sub_problems:
-            self.save_results(results, SubProblemSelection.brute_force.name)
-            results = []
-
-        for inst_id, n_vars, clauses in self.solution_instances:
-
-            if SubProblemSelection.btracking in self.sub_problems:
-                t0 = time.perf_counter()
-                bt_ok, bt_assign = self.sat_backtracking(n_vars, clauses)
-                bt_time = time.perf_counter() - t0
-                results.append([inst_id, n_vars, len(clauses),
-                            "BackTracking",
-                            "S" if bt_ok else "U", 
-                            bt_time,
-                            str(bt_assign)])
-        
-        if SubProblemSelection.btracking in self.sub_problems:
-            self.save_results(results, SubProblemSelection.btracking.name)
-            results = []
-
-        for inst_id, n_vars, clauses in self.solution_instances:
-
-            if SubProblemSelection.simple in self.sub_problems:
-                t0 = time.perf_counter()
-                bt_ok, bt_assign = self.sat_simple(n_vars, clauses)
-                bt_time = time.perf_counter() - t0
-                results.append([inst_id, n_vars, len(clauses), 
-                                "Simple",
-                            "S" if bt_ok else "U", 
-                            bt_time, 
-                            str(bt_assign)])
-        
-        if SubProblemSelection.simple in self.sub_problems:
-            self.save_results(results, SubProblemSelection.simple.name)
-            results = []
-        
-
-        for inst_id, n_vars, clauses in self.solution_instances:
-
-            if SubProblemSelection.best_case in self.sub_problems:
-                t0 = time.perf_counter()
-                bt_ok, bt_assign = self.sat_bestcase(n_vars, clauses)
-                bt_time = time.perf_counter() - t0
-                results.append([inst_id, n_vars, len(clauses), 
-                                "BestCase",
-                            "S" if bt_ok else "U", 
-                            bt_time, 
-                            str(bt_assign)])
-        
-        if SubProblemSelection.best_case in self.sub_problems:
-            self.save_results(results, SubProblemSelection.best_case.name)
-            results = []
-
-
-
-        
-
-
-    
-    
-
-
-    
\ No newline at end of file
@@ -0,0 +1,286 @@
+from abc import ABC, abstractmethod
+import copy
+import os
+from src.helpers.constants import RESULTS_FOLDER, CONFIGURATION_FILE_PATH
+from src.helpers.benchmark_helper import BENCHMARK_COLUMNS, BenchmarkOptions, BenchmarkTiming, measure
+from src.helpers.distributed_helper import run_distributed
+from src.helpers.pipeline_helper import run_pipelined
+from src.helpers.profiling_helper import SolveProfiler
+from typing import List, Dict, Any, Iterable, Iterator, Hashable, Optional, Tuple
+import json
+import csv
+import time
+from src.helpers.project_selection_enum import ProjectSelection, SubProblemSelection
+
+
+# printed in the method column of every results file
+METHOD_LABELS = {
+    SubProblemSelection.brute_force: "BruteForce",
+    SubProblemSelection.btracking: "BackTracking",
+    SubProblemSelection.simple: "Simple",
+    SubProblemSelection.best_case: "BestCase",
+    SubProblemSelection.auto: "Auto",
+    SubProblemSelection.local_search: "LocalSearch",
+    SubProblemSelection.model_count: "ModelCount",
+    SubProblemSelection.incremental: "Incremental",
+}
+
+# the Auto sub problem picks a solver method per instance, see SolverHarnessAbstractClass.route
+AUTO_METHOD = "auto"
+# extra CSV columns of the Auto results: the method that ran and the features it was picked on
+AUTO_COLUMNS = ["engine", "features"]
+
+
+class SolverHarnessAbstractClass(ABC):
+    """
+    Shared parse -> solve -> time -> write loop behind every problem type.
+    A problem adapter only says how to parse its input, which method answers which sub problem,
+    how to call that method on one instance and how the answer becomes CSV rows.
+    """
+
+    # header of the results CSV
+    result_header: List[str] = []
+    # sub problem -> name of the method that solves it
+    solver_methods: Dict[SubProblemSelection, str] = {}
+
+    def __init__(self,
+                    cnf_file_input_path: str,
+                    result_file_name: str = "sat_solver_results",
+                    results_folder_path: str = RESULTS_FOLDER):
+        self.cnf_file_input_path = cnf_file_input_path
+        self.results_folder_path = results_folder_path
+        self.result_file_name = result_file_name
+        self.config_path = CONFIGURATION_FILE_PATH
+        self.sub_problems = self.set_config()
+        self.execution = self.execution_options()
+        self.profiler = SolveProfiler.from_options(self.execution.get("profile"))
+        self.benchmark = BenchmarkOptions.from_options(self.execution.get("benchmark"))
+        # a batch shares one time between its instances while benchmark mode times each one, so
+        # benchmark mode solves one by one
+        self.batch = self.execution.get("batch") if self.benchmark is None else None
+        if self.pipelined or self.distributed:
+            # instances are streamed from the file while solving
+            self.solution_instances = []
+        else:
+            self.solution_instances = self.parse_input_file()
+            print(f"Parsed {len(self.solution_instances)} instances from {self.cnf_file_input_path}")
+
+    def load_config(self) -> Dict[str, Any]:
+        if not os.path.exists(self.config_path):
+            raise Exception("Please make sure the configuration file exists!!!")
+        with open(self.config_path, mode = 'r' , encoding= 'utf-8') as conf_buffer:
+            data = json.load(conf_buffer)
+        return data["Project Configuration"]
+
+    def set_config(self):
+        data = self.load_config()
+        selection = data["Selection"]
+        sub_problem = data["Sub Problem"]
+        sub_probs = []
+        for sub_prob in sub_problem:
+            for selected in SubProblemSelection:
+                if sub_prob["value"] == selected.value:
+                    sub_probs.append(selected)
+        return sub_probs
+
+    def execution_options(self) -> Dict[str, Any]:
+        """
+        Optional "Execution" block of the configuration, e.g. {"mode": "pipelined", "workers": 4}.
+        """
+        return self.load_config().get("Execution", {})
+
+    @property
+    def pipelined(self) -> bool:
+        # profiles are collected in this process and batches need every instance up front,
+        # so both run the sequential loop
+        return self.execution.get("mode") == "pipelined" and self.profiler is None and self.batch is None
+
+    @property
+    def distributed(self) -> bool:
+        # same limits as pipelined, workers only see one shard of instances at a time
+        return self.execution.get("mode") == "distributed" and self.profiler is None and self.batch is None
+
+    def result_path(self, sub_problem: str) -> str:
+        dir_name, file_name = os.path.split(self.cnf_file_input_path)
+        file_name_only, ext = os.path.splitext(file_name)
+        return os.path.join(self.results_folder_path, f"{sub_problem}_{file_name_only}_{self.result_file_name}.csv")
+
+    def csv_header(self, sub_problem: str) -> List[str]:
+        header = list(self.result_header)
+        if self.benchmark is not None:
+            header += BENCHMARK_COLUMNS
+        if sub_problem == SubProblemSelection.auto.name:
+            header += AUTO_COLUMNS
+        return header
+
+    def save_results(self, run_results: Iterable[List[Any]], sub_problem):
+        # Write to CSV
+        temp_result = self.result_path(sub_problem)
+        with open(temp_result, "w", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(self.csv_header(sub_problem))
+            w.writerows(run_results)
+        print(f"\nResults written to {temp_result}")
+
+    @abstractmethod
+    def parse_input_file(self) -> List[Any]:
+        pass
+
+    def iter_input_file(self) -> Iterator[Any]:
+        """
+        Instances one at a time for the pipelined mode, problems with a streaming parser override this.
+        """
+        return iter(self.parse_input_file())
+
+    def worker_copy(self):
+        """
+        Copy of the harness that is shipped to worker processes, without the parsed input.
+        """
+        worker = copy.copy(self)
+        worker.solution_instances = []
+        return worker
+
+    @abstractmethod
+    def solve_instance(self, method, instance) -> Any:
+        """
+        Calls one solver method on one parsed instance and returns its raw answer.
+        """
+        pass
+
+    @abstractmethod
+    def format_rows(self, instance, result, label: str, elapsed: float) -> Iterable[List[Any]]:
+        """
+        Turns one answer into the CSV rows for that instance.
+        """
+        pass
+
+    def instance_id(self, instance):
+        return instance[0]
+
+    def call_solver(self, method, instance) -> Any:
+        """
+        solve_instance, passed through the profiler when profiling is configured.
+        """
+        if self.profiler is None:
+            return self.solve_instance(method, instance)
+        return self.profiler.call(self.instance_id(instance), self.solve_instance, method, instance)
+
+    def timed_solve(self, method, instance) -> Tuple[Any, Any]:
+        """
+        Returns (answer, timing). The timing is the seconds of one call, or a BenchmarkTiming
+        over repeated calls in benchmark mode.
+        """
+        t0 = time.perf_counter()
+        result = self.call_solver(method, instance)
+        elapsed = time.perf_counter() - t0
+        if self.benchmark is None:
+            return result, elapsed
+        # the call above was the first warmup
+        options = self.benchmark._replace(warmup=max(0, self.benchmark.warmup - 1))
+        return result, measure(self.solve_instance, method, instance, options=options)
+
+    def instance_features(self, instance) -> Dict[str, Any]:
+        """
+        Structural features of one instance, used by route and written to the Auto results.
+        """
+        raise NotImplementedError(f"{type(self).__name__} has no Auto mode")
+
+    def route(self, features: Dict[str, Any]) -> str:
+        """
+        Name of the cheapest solver method that is correct for an instance with these features.
+        """
+        raise NotImplementedError(f"{type(self).__name__} has no Auto mode")
+
+    def solve_selected(self, method_name: str, instance) -> Tuple[Any, Any, List[Any]]:
+        """
+        timed_solve by method name, plus the extra columns of the row. AUTO_METHOD measures the
+        instance first and runs whatever route picks, the pick and the features are the extra columns.
+        """
+        if method_name != AUTO_METHOD:
+            result, timing = self.timed_solve(getattr(self, method_name), instance)
+            return result, timing, []
+        features = self.instance_features(instance)
+        engine = self.route(features)
+        result, timing = self.timed_solve(getattr(self, engine), instance)
+        return result, timing, [engine, json.dumps(features, sort_keys=True)]
+
+    def result_rows(self, instance, result, label: str, timing, extra: List[Any] = ()) -> Iterable[List[Any]]:
+        """
+        format_rows with the median as the time and the benchmark columns appended in benchmark mode,
+        followed by the extra columns.
+        """
+        if not isinstance(timing, BenchmarkTiming):
+            return (row + list(extra) for row in self.format_rows(instance, result, label, timing))
+        return (
+            row + timing.columns() + list(extra)
+            for row in self.format_rows(instance, result, label, timing.median)
+        )
+
+    def instance_key(self, instance) -> Optional[Hashable]:
+        """
+        Key under which identical instances share one solve, None turns caching off.
+        """
+        return None
+
+    def solve_batch(self, method_name: str, instances: List[Any]) -> Optional[List[Tuple[Any, float]]]:
+        """
+        Batch mode hook: (answer, seconds) for every instance when the method can solve many
+        instances in one pass, None to solve them one by one.
+        """
+        return None
+
+    def solve_all(self, method_name: str, label: str) -> Iterator[List[Any]]:
+        """
+        Times the method on every instance and yields the CSV rows. Instances with the same
+        instance_key are solved once and reuse the cached answer and its time.
+        """
+        if self.batch is not None:
+            batched = self.solve_batch(method_name, self.solution_instances)
+            if batched is not None:
+                for instance, (result, seconds) in zip(self.solution_instances, batched):
+                    yield from self.result_rows(instance, result, label, seconds)
+                return
+        cache = {}
+        for instance in self.solution_instances:
+            key = self.instance_key(instance)
+            if key is None or key not in cache:
+                solved = self.solve_selected(method_name, instance)
+                if key is not None:
+                    cache[key] = solved
+            else:
+                solved = cache[key]
+            result, timing, extra = solved
+            yield from self.result_rows(instance, result, label, timing, extra)
+        if cache:
+            print(f"Solved {len(cache)} distinct of {len(self.solution_instances)} instances with {label}")
+
+    def finish(self):
+        """
+        Called once every selected sub problem has been written.
+        """
+        pass
+
+    def selected_methods(self) -> Iterator[Tuple[SubProblemSelection, str, str]]:
+        # (sub problem, solver method name, label) for every configured sub problem, in run order
+        for sub_problem, method_name in self.solver_methods.items():
+            if sub_problem in self.sub_problems:
+                yield sub_problem, method_name, METHOD_LABELS[sub_problem]
+        if SubProblemSelection.auto in self.sub_problems:
+            yield SubProblemSelection.auto, AUTO_METHOD, METHOD_LABELS[SubProblemSelection.auto]
+
+    def run(self):
+        try:
+            if self.pipelined:
+                run_pipelined(self, self.execution.get("workers"))
+                return
+            if self.distributed:
+                run_distributed(self, self.execution.get("distributed"))
+                return
+            for sub_problem, method_name, label in self.selected_methods():
+                if self.profiler is not None:
+                    self.profiler.begin(method_name, sub_problem.name, self.result_path(sub_problem.name))
+                self.save_results(self.solve_all(method_name, label), sub_problem.name)
+                if self.profiler is not None:
+                    self.profiler.finish()
+        finally:
+            self.finish()
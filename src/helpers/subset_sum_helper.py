@@ -0,0 +1,52 @@
+import sys
+from typing import List, Sequence
+
+import numpy as np
+
+
+def exact_fill_combinations(bin_capacity: int, items: Sequence[int]) -> List[List[int]]:
+    """
+    Every distinct multiset of items that fills a bin exactly, largest items first.
+    reach[i][s] records whether the sizes from i on can add up to s, so walking the table
+    backwards from bin_capacity only ever enters branches that end in a combination.
+    Zero-size items never change a sum, negative ones and ones bigger than the bin are in no exact
+    fill, all of them are left out.
+    """
+    if bin_capacity <= 0:
+        raise ValueError(f"Bin capacity must be positive, got {bin_capacity}")
+    sizes = np.asarray(items, dtype=np.int64)
+    values, counts = np.unique(sizes[(sizes > 0) & (sizes <= bin_capacity)], return_counts=True)
+    values, counts = values[::-1].tolist(), counts[::-1].tolist()
+
+    reach = np.zeros((len(values) + 1, bin_capacity + 1), dtype=bool)
+    reach[len(values), 0] = True
+    for i in range(len(values) - 1, -1, -1):
+        row, below = reach[i], reach[i + 1]
+        value = values[i]
+        for take in range(min(counts[i], bin_capacity // value) + 1):
+            shift = take * value
+            row[shift:] |= below[: bin_capacity + 1 - shift]
+
+    combinations: List[List[int]] = []
+    chosen: List[int] = []
+
+    def walk(i: int, left: int):
+        if left == 0:
+            combinations.append(list(chosen))
+            return
+        value = values[i]
+        for take in range(min(counts[i], left // value), -1, -1):
+            if reach[i + 1, left - take * value]:
+                chosen.extend([value] * take)
+                walk(i + 1, left - take * value)
+                if take:
+                    del chosen[-take:]
+
+    if values and reach[0, bin_capacity]:
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(max(limit, len(values) + 100))
+        try:
+            walk(0, bin_capacity)
+        finally:
+            sys.setrecursionlimit(limit)
+    return combinations
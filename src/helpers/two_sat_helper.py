@@ -0,0 +1,105 @@
+import itertools
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+
+def is_two_cnf(clauses: Sequence[Sequence[int]]) -> bool:
+    # unit clauses count, [x] is the same clause as [x, x]
+    return all(1 <= len(clause) <= 2 for clause in clauses)
+
+
+def implication_graph(n_vars: int, clauses: Sequence[Sequence[int]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    CSR arrays (indptr, targets) of the implication graph of a 2-CNF formula.
+    Literal x is node 2(x-1), literal -x is node 2(x-1)+1, so negation flips the lowest bit.
+    Clause (a or b) gives the edges -a -> b and -b -> a. Variables above n_vars get nodes as well.
+    """
+    lengths = np.fromiter(map(len, clauses), dtype=np.int64, count=len(clauses))
+    flat = np.fromiter(itertools.chain.from_iterable(clauses), dtype=np.int64, count=int(lengths.sum()))
+    if flat.size:
+        n_vars = max(n_vars, int(np.abs(flat).max()))
+    # first and last literal of every clause, the same literal twice for a unit clause
+    last = np.cumsum(lengths) - 1
+    nodes = 2 * (np.abs(flat) - 1) + (flat < 0)
+    a, b = nodes[last - lengths + 1], nodes[last]
+    sources = np.concatenate((a ^ 1, b ^ 1))
+    targets = np.concatenate((b, a))
+
+    order = np.argsort(sources, kind="stable")
+    indptr = np.zeros(2 * n_vars + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=2 * n_vars), out=indptr[1:])
+    return indptr, targets[order]
+
+
+def strongly_connected_components(indptr: Sequence[int], targets: Sequence[int]) -> List[int]:
+    """
+    Iterative Tarjan over a CSR graph. Returns the component of every node, components are
+    numbered in the order Tarjan closes them, which is a reverse topological order.
+    """
+    n_nodes = len(indptr) - 1
+    index = [-1] * n_nodes
+    low = [0] * n_nodes
+    comp = [-1] * n_nodes
+    stack: List[int] = []
+    counter = 0
+    n_comp = 0
+
+    # next edge to look at for every node on the depth-first path
+    next_edge = list(indptr[:-1])
+
+    for root in range(n_nodes):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        path = [root]
+        while path:
+            v = path[-1]
+            edge, end = next_edge[v], indptr[v + 1]
+            while edge < end:
+                w = targets[edge]
+                edge += 1
+                if index[w] == -1:
+                    next_edge[v] = edge
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    path.append(w)
+                    break
+                if comp[w] == -1 and index[w] < low[v]:
+                    # w is still on the stack
+                    low[v] = index[w]
+            else:
+                path.pop()
+                if low[v] == index[v]:
+                    while True:
+                        w = stack.pop()
+                        comp[w] = n_comp
+                        if w == v:
+                            break
+                    n_comp += 1
+                if path:
+                    u = path[-1]
+                    if low[v] < low[u]:
+                        low[u] = low[v]
+    return comp
+
+
+def solve_two_sat(n_vars: int, clauses: Sequence[Sequence[int]]) -> Tuple[bool, Dict[int, int]]:
+    """
+    2-SAT in O(n + m). Unsatisfiable exactly when some x and -x share a component, otherwise x is
+    true when its component comes after the component of -x in topological order.
+    Returns (ok, {var: 0/1}) like the other SAT methods, with an empty assignment when unsatisfiable.
+    """
+    indptr, targets = implication_graph(n_vars, clauses)
+    if len(indptr) == 1:
+        return True, {}
+    comp = np.array(strongly_connected_components(indptr.tolist(), targets.tolist()), dtype=np.int64)
+    positive, negative = comp[0::2], comp[1::2]
+    if np.any(positive == negative):
+        return False, {}
+    # Tarjan numbers components in reverse topological order
+    values = (positive < negative).astype(int).tolist()
+    return True, {var + 1: value for var, value in enumerate(values)}
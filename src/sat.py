@@ -38,10 +38,21 @@ EXAMPLE OUTPUT
 instance_id,n_vars,n_clauses,method,satisfiable,time_seconds,solution
 3,4,10,U,0.00024808302987366915,BruteForce,{}
 4,4,10,S,0.00013304100139066577,BruteForce,"{1: True, 2: False, 3: False, 4: False}"
+
+PROOF MODE
+------------
+"Execution": {"proof": {}} in the configuration makes every U answer that logs a proof also write a
+binary DRAT proof, results/<method>_<input>_sat_solver_results_proofs/<instance_id>.drat, checked
+once the run ends ({"proof": {"check": false}} only writes them). backtack cannot log a proof, so in
+proof mode Backtracking runs the index-order branching search instead and its time_seconds are the
+times of that search.
 """
 
 from typing import List, Tuple, Dict
 from src.helpers.sat_solver_helper import SatSolverAbstractClass
+from src.helpers.branching_helper import solve_with_branching
+from src.helpers.gray_code_helper import gray_code_brute_force
+from src.helpers.two_sat_helper import is_two_cnf, solve_two_sat
 import itertools
 
 
@@ -102,6 +113,10 @@ class SatSolver(SatSolverAbstractClass):
     
 
     def sat_backtracking(self, n_vars:int, clauses:List[List[int]]) -> Tuple[bool, Dict[int, bool]]:
+        if self.branching is not None or self.proof is not None:
+            # same backtracking, with the variable and value order picked by the configured heuristic,
+            # index order when only a proof is asked for
+            return solve_with_branching(n_vars, clauses, self.branching or "index", self.proof)
         # clauses [[-2, 3], [-1, 4], [-2, 4], [-4, -2], [-4, -1], [1, 1], [4, 4], [-4, -3], [-1, -4], [3, 3]]
         # Create a Dictionary called assignment that keeps track of the assignments 0/1
         assignment = dict()
@@ -111,30 +126,15 @@ class SatSolver(SatSolverAbstractClass):
         # Try all combinations of assignments using backtracking
         return (assignment != {}, assignment)
     
-    def brute_force(self, depth, n_vars:int, assignment:Dict[int, bool], clauses:List[List[int]]) -> Dict[int, bool]:
-        for i in range(2): # try both 0 and 1 in 
-            # if we are not on the last depth, call on this function
-            assignment[depth] = i
-            if self.is_valid(clauses, assignment):
-                return assignment
-            elif depth != n_vars:
-                new_assignment = self.brute_force(depth+1, n_vars, assignment, clauses)
-                if new_assignment != {}:
-                    return new_assignment
-
-        return {}
-
-
-
     def sat_bruteforce(self, n_vars:int, clauses:List[List[int]]) -> Tuple[bool, Dict[int, bool]]:
-        # Create a Dictionary called assignment that starts off with all keys pointing to being 0; it tracks of the assignments 0/1
-        # each clause will ALWAYS be in the assignment
-        assignment = self.brute_force(1, n_vars, {(i+1):0 for i in range(n_vars)}, clauses)
-
-        return (assignment != {}, assignment)
+        # every assignment is tried, in Gray-code order so each one costs a single variable flip
+        return gray_code_brute_force(n_vars, clauses)
 
     def sat_bestcase(self, n_vars:int, clauses:List[List[int]]) -> Tuple[bool, Dict[int, bool]]:
-        pass
+        # 2-CNF is solved in linear time through the implication graph, anything else is backtracked
+        if is_two_cnf(clauses):
+            return solve_two_sat(n_vars, clauses)
+        return self.sat_backtracking(n_vars, clauses)
 
     def sat_simple(self, n_vars:int, clauses:List[List[int]]) -> Tuple[bool, Dict[int, bool]]:
         pass
\ No newline at end of file
@@ -11,17 +11,20 @@ ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
+from src.helpers.benchmark_helper import BENCHMARK_COLUMNS, BenchmarkOptions, measure
 from src.helpers.dmaics_parser import parse_multi_instance_dimacs
 from src.sat import SatSolver
 
-def run_solver_and_write_csv(instances, out_csv, method_name, solver_func):
+def run_solver_and_write_csv(instances, out_csv, method_name, solver_func, benchmark_options=None):
     #running solver and writing the results to our CSV files
+    #with benchmark_options the time is the median of repeated runs, see benchmark_helper.measure
     os.makedirs(os.path.dirname(out_csv) or ".", exist_ok=True)
     nvars_list, times_list, sat_flags = [], [], []
 
     with open(out_csv, "w", newline="", encoding="utf-8") as f:
         w = csv.writer(f)
-        w.writerow(["instance_id", "n_vars", "n_clauses", "method", "satisfiable", "time_seconds", "solution"])
+        header = ["instance_id", "n_vars", "n_clauses", "method", "satisfiable", "time_seconds", "solution"]
+        w.writerow(header + BENCHMARK_COLUMNS if benchmark_options else header)
 
         #timing each instance for graphing purposes
         for (inst_id, n_vars, clauses) in instances:
@@ -33,7 +36,14 @@ def run_solver_and_write_csv(instances, out_csv, method_name, solver_func):
             sat_flag = "S" if ok else "U"
             sol_str = str(assign) if ok else "{}"
 
-            w.writerow([inst_id, n_vars, n_clauses, method_name, sat_flag, dt, sol_str])
+            if benchmark_options:
+                #the call above was the first warmup
+                timing = measure(solver_func, n_vars, clauses,
+                                 options=benchmark_options._replace(warmup=max(0, benchmark_options.warmup - 1)))
+                dt = timing.median
+                w.writerow([inst_id, n_vars, n_clauses, method_name, sat_flag, dt, sol_str] + timing.columns())
+            else:
+                w.writerow([inst_id, n_vars, n_clauses, method_name, sat_flag, dt, sol_str])
 
             nvars_list.append(n_vars)
             times_list.append(dt)
@@ -42,7 +52,7 @@ def run_solver_and_write_csv(instances, out_csv, method_name, solver_func):
     return nvars_list, times_list, sat_flags
 
 
-def read_team_inputs(input_file, results_folder):
+def read_team_inputs(input_file, results_folder, benchmark_options=None):
     #parsing input file and generating CSV files for each solving method
     os.makedirs(results_folder, exist_ok=True)
     
@@ -56,58 +66,56 @@ def read_team_inputs(input_file, results_folder):
     back_csv = os.path.join(results_folder, "backtracking_results.csv")
     
     #brute force solver
-    run_solver_and_write_csv(instances, brute_csv, "BruteForce", solver.sat_bruteforce)
+    run_solver_and_write_csv(instances, brute_csv, "BruteForce", solver.sat_bruteforce, benchmark_options)
     
     #backtracking solverr
-    run_solver_and_write_csv(instances, back_csv, "BackTracking", solver.sat_backtracking)
+    run_solver_and_write_csv(instances, back_csv, "BackTracking", solver.sat_backtracking, benchmark_options)
     
     return brute_csv, back_csv
 
 
-def plot_brute_vs_backtrack(brute_csv, back_csv, output_name="plot_brute_vs_backtrack.png"):
+def plot_brute_vs_backtrack(brute_csv, back_csv, output_name="plot_brute_vs_backtrack.png",
+                            aggregate=False, show=True):
+    #aggregate: one median point per n_vars with an IQR bar instead of every run
+    #show=False only saves the file, for CI boxes and big benchmark sweeps
     #read CSV files
     brute_df = pd.read_csv(brute_csv)
     back_df = pd.read_csv(back_csv)
 
     plt.figure(figsize=(12, 6))
-    added_labels = set()
 
     #helper function
     def plot_method(df, method_name, color_base):
-        unsat_sizes, unsat_times = [], []
-        
-        for i in range(len(df)):
-            size = df.loc[i, "n_vars"]
-            time_val = df.loc[i, "time_seconds"]
-            sat_flag = df.loc[i, "satisfiable"] == "S"
-
-            if sat_flag:
-                label = f"{method_name} (Sat)"
-                color = color_base
-                marker = "o"
-            else:
-                label = f"{method_name} (Unsat)"
-                color = "red" if color_base == "blue" else "orange"
-                marker = "^"
-                unsat_sizes.append(size)
-                unsat_times.append(time_val)
-
-            if label not in added_labels:
-                plt.scatter(size, time_val, color=color, marker=marker, label=label)
-                added_labels.add(label)
+        sizes = df["n_vars"].to_numpy(dtype=float)
+        times = df["time_seconds"].to_numpy(dtype=float)
+        sat_mask = (df["satisfiable"] == "S").to_numpy()
+        unsat_color = "red" if color_base == "blue" else "orange"
+
+        #one scatter (or errorbar) call per class instead of one per row
+        for mask, label, color, marker in (
+            (sat_mask, f"{method_name} (Sat)", color_base, "o"),
+            (~sat_mask, f"{method_name} (Unsat)", unsat_color, "^"),
+        ):
+            if not mask.any():
+                continue
+            if aggregate:
+                grouped = pd.Series(times[mask]).groupby(sizes[mask])
+                q1, median, q3 = (grouped.quantile(q) for q in (0.25, 0.5, 0.75))
+                plt.errorbar(median.index, median.to_numpy(),
+                             yerr=[(median - q1).to_numpy(), (q3 - median).to_numpy()],
+                             fmt=marker, color=color, capsize=3, label=f"{label} median/IQR")
             else:
-                plt.scatter(size, time_val, color=color, marker=marker)
-        
-        #accounting for expontential fitting in unsat cases
-        if len(unsat_sizes) > 1:
-            log_unsat_times = np.log(unsat_times)
-            fit = np.polyfit(unsat_sizes, log_unsat_times, 1)
+                plt.scatter(sizes[mask], times[mask], color=color, marker=marker, label=label)
+
+        #accounting for expontential fitting in unsat cases, log of a zero time is undefined
+        fit_mask = ~sat_mask & (times > 0)
+        unsat_sizes = sizes[fit_mask]
+        if np.unique(unsat_sizes).size > 1:
+            fit = np.polyfit(unsat_sizes, np.log(times[fit_mask]), 1)
             a, b = np.exp(fit[1]), fit[0]
 
-            def exp_fit(x):
-                return a * np.exp(b * x)
-            sizes_fit = np.linspace(min(unsat_sizes), max(unsat_sizes), 100)
-            times_fit = exp_fit(sizes_fit)
+            sizes_fit = np.linspace(unsat_sizes.min(), unsat_sizes.max(), 100)
+            times_fit = a * np.exp(b * sizes_fit)
             plt.plot(
                 sizes_fit,
                 times_fit,
@@ -128,24 +136,36 @@ def plot_brute_vs_backtrack(brute_csv, back_csv, output_name="plot_brute_vs_back
     plt.tight_layout()
 
     plt.savefig(output_name)
-    plt.show()
+    if show:
+        plt.show()
+    plt.close()
 
 
 def main():
-    if len(sys.argv) < 3:
-        print("Try: uv run src/team_sat.py input/team_tests.cnf results")
+    flags = {"--benchmark", "--aggregate", "--headless"}
+    args = [arg for arg in sys.argv[1:] if arg not in flags]
+    if len(args) < 2:
+        print("Try: uv run src/team_sat.py input/team_tests.cnf results [--benchmark] [--aggregate] [--headless]")
         sys.exit(1)
 
-    input_file = sys.argv[1]
+    input_file = args[0]
     #print(input_file)
-    results_folder = sys.argv[2]
+    results_folder = args[1]
     #print(results_folder)
+    #--benchmark: warmup, repeated runs with gc off, median time plus min/IQR columns
+    benchmark_options = BenchmarkOptions() if "--benchmark" in sys.argv else None
+
+    #--headless: no window at all, the Agg backend renders straight to the file
+    if "--headless" in sys.argv:
+        plt.switch_backend("Agg")
 
-    brute_csv, back_csv = read_team_inputs(input_file, results_folder)
+    brute_csv, back_csv = read_team_inputs(input_file, results_folder, benchmark_options)
 
     if brute_csv and back_csv:
         plot_path = os.path.join(results_folder, "plot_brute_vs_backtrack.png")
-        plot_brute_vs_backtrack(brute_csv, back_csv, plot_path)
+        plot_brute_vs_backtrack(brute_csv, back_csv, plot_path,
+                                aggregate="--aggregate" in sys.argv,
+                                show="--headless" not in sys.argv)
     else:
         sys.exit(1)
 
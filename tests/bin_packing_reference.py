@@ -0,0 +1,30 @@
+"""
+Brute-force answers the bin packing engines are checked against.
+"""
+from functools import lru_cache
+
+
+def optimal_bins(bin_capacity, items):
+    # fewest bins over every way to take out a bin holding the first remaining item
+    @lru_cache(maxsize=None)
+    def fewest(mask):
+        if mask == 0:
+            return 0
+        low = mask & -mask
+        best = len(items)
+        rest = mask ^ low
+        sub = rest
+        while True:
+            chosen = sub | low
+            if sum(items[i] for i in range(len(items)) if chosen >> i & 1) <= bin_capacity:
+                best = min(best, 1 + fewest(mask ^ chosen))
+            if sub == 0:
+                break
+            sub = (sub - 1) & rest
+        return best
+    return fewest((1 << len(items)) - 1)
+
+
+def check_packing(bin_capacity, items, bins):
+    assert sorted(item for bin_items in bins for item in bin_items) == sorted(items)
+    assert all(sum(bin_items) <= bin_capacity for bin_items in bins)
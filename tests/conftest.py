@@ -0,0 +1,36 @@
+import csv
+import json
+import os
+
+import pytest
+
+from src.helpers import solver_harness_helper
+from src.helpers.project_selection_enum import ProjectSelection, SubProblemSelection
+
+
+@pytest.fixture
+def run_harness(tmp_path, monkeypatch):
+    """
+    Runs a problem harness on an input file with a configuration written to tmp_path and returns
+    {sub problem name: rows of its results CSV, header included}.
+    """
+    def run(harness_class, selection: ProjectSelection, input_path: str, sub_problems, execution=None):
+        config_path = os.path.join(tmp_path, "student_config.json")
+        with open(config_path, "w") as config:
+            json.dump({"Project Configuration": {
+                "Selection": {"name": selection.name, "value": selection.value},
+                "Sub Problem": [{"name": SubProblemSelection[name].name, "value": SubProblemSelection[name].value}
+                                for name in sub_problems],
+                "Execution": execution or {},
+            }}, config)
+        monkeypatch.setattr(solver_harness_helper, "CONFIGURATION_FILE_PATH", config_path)
+        results_path = os.path.join(tmp_path, "results")
+        os.makedirs(results_path, exist_ok=True)
+        harness = harness_class(input_path, results_folder_path=results_path)
+        harness.run()
+        rows = {}
+        for name in sub_problems:
+            with open(harness.result_path(name), newline="") as results:
+                rows[name] = list(csv.reader(results))
+        return rows
+    return run
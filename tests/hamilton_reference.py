@@ -0,0 +1,37 @@
+"""
+Brute-force answers the Hamiltonian engines are checked against.
+"""
+import itertools
+
+
+def random_graph(rng, n, m):
+    edges = {tuple(sorted((rng.randint(1, n), rng.randint(1, n)))) for _ in range(m)}
+    edges = sorted(edge for edge in edges if edge[0] != edge[1])
+    return {v for edge in edges for v in edge}, edges
+
+
+def brute_force(vertices, edges):
+    # (path exists, cycle exists, largest cycle) over every ordering of every vertex subset
+    edge_set = {frozenset(edge) for edge in edges}
+    joined = lambda order, closed: all(frozenset(pair) in edge_set for pair in zip(order, order[1:] + order[:closed]))
+    order = sorted(vertices)
+    path = bool(order) and any(joined(list(p), 0) for p in itertools.permutations(order))
+    largest = 0
+    for size in range(len(order), 2, -1):
+        if any(joined([subset[0], *rest], 1) for subset in itertools.combinations(order, size)
+               for rest in itertools.permutations(subset[1:])):
+            largest = size
+            break
+    return path, len(order) >= 3 and largest == len(order), largest
+
+
+def check_walks(vertices, edges, result):
+    edge_set = {frozenset(edge) for edge in edges}
+    path_found, path, cycle_found, cycle, largest = result
+    if path_found:
+        assert sorted(path) == sorted(vertices)
+        assert all(frozenset(pair) in edge_set for pair in zip(path, path[1:]))
+    if cycle_found:
+        assert cycle[0] == cycle[-1] and sorted(cycle[:-1]) == sorted(vertices)
+        assert all(frozenset(pair) in edge_set for pair in zip(cycle, cycle[1:]))
+    return path_found, cycle_found, largest
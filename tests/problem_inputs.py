@@ -0,0 +1,76 @@
+"""
+Random input files for all four problems and the results a run writes for them, without its timings.
+"""
+import random
+
+from src.bin_packing import BinPacking
+from src.graph_coloring import GraphColoring
+from src.hamilton_cycle import HamiltonCycleColoring
+from src.helpers.project_selection_enum import ProjectSelection
+from src.sat import SatSolver
+
+
+def write_sat(path, rng: random.Random, count: int):
+    with open(path, "w") as cnf:
+        for inst_id in range(count):
+            n = rng.randint(2, 12)
+            clauses = [[rng.choice([1, -1]) * rng.randint(1, n) for _ in range(rng.randint(1, 3))]
+                       for _ in range(rng.randint(1, 4 * n))]
+            cnf.write(f"c {inst_id} 3 ?\np cnf {n} {len(clauses)}\n")
+            cnf.writelines(",".join(map(str, clause)) + ",0\n" for clause in clauses)
+
+
+def write_bin_packing(path, rng: random.Random, count: int):
+    with open(path, "w") as bins:
+        for _ in range(count):
+            bin_capacity = rng.randint(5, 30)
+            items = [rng.randint(1, bin_capacity) for _ in range(rng.randint(1, 12))]
+            bins.write(f"{bin_capacity} {' '.join(map(str, items))}\n")
+
+
+def write_hamiltonian(path, rng: random.Random, count: int):
+    with open(path, "w") as graphs:
+        for inst_id in range(1, count + 1):
+            n = rng.randint(3, 9)
+            edges = sorted({tuple(sorted(rng.sample(range(1, n + 1), 2))) for _ in range(rng.randint(2, 2 * n))})
+            graphs.write(f"c INSTANCE {inst_id}\np edge {n} {len(edges)}\n")
+            graphs.writelines(f"e {u} {v}\n" for u, v in edges)
+
+
+def write_graph_coloring(path, rng: random.Random, count: int):
+    with open(path, "w") as graphs:
+        for inst_id in range(count):
+            n = rng.randint(2, 12)
+            edges = sorted({tuple(sorted(rng.sample(range(1, n + 1), 2))) for _ in range(rng.randint(1, 2 * n))})
+            # the student search methods are empty, Auto answers k <= 2 and k above the max degree
+            k = rng.choice([1, 2, n])
+            graphs.write(f"c {inst_id} {k} ?\np cnf {n} {len(edges)}\n")
+            graphs.writelines(f"{u},{v}\n" for u, v in edges)
+
+
+# problem -> (harness, selection, input writer, sub problems to run)
+PROBLEMS = {
+    "sat": (SatSolver, ProjectSelection.sat, write_sat, ["brute_force", "btracking", "best_case", "auto"]),
+    "bin_packing": (BinPacking, ProjectSelection.bin_packing, write_bin_packing, ["btracking", "simple", "auto"]),
+    "hamiltonian": (HamiltonCycleColoring, ProjectSelection.hamiltonian, write_hamiltonian, ["btracking", "best_case", "auto"]),
+    "graph_coloring": (GraphColoring, ProjectSelection.graph_coloring, write_graph_coloring, ["auto"]),
+}
+
+
+def without_timings(results):
+    """
+    The results of a run_harness call with every time column dropped.
+    """
+    stripped = {}
+    for sub_problem, (header, *rows) in results.items():
+        kept = [at for at, column in enumerate(header) if "time" not in column.lower()]
+        stripped[sub_problem] = [[row[at] for at in kept] for row in [header, *rows]]
+    return stripped
+
+
+def run_problem(run_harness, tmp_path, problem: str, execution=None, count: int = 40):
+    harness_class, selection, write, sub_problems = PROBLEMS[problem]
+    path = tmp_path / f"{problem}_input.txt"
+    if not path.exists():
+        write(path, random.Random(problem), count)
+    return without_timings(run_harness(harness_class, selection, str(path), sub_problems, execution))
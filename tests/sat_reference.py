@@ -0,0 +1,34 @@
+"""
+Brute-force answers the SAT engines are checked against.
+"""
+import itertools
+
+
+def random_cnf(rng, n_vars, n_clauses, max_length=3, min_length=1):
+    return [[rng.choice([1, -1]) * rng.randint(1, n_vars) for _ in range(rng.randint(min_length, max_length))]
+            for _ in range(n_clauses)]
+
+
+def satisfies(clauses, assignment):
+    return all(any(assignment.get(abs(literal), 0) == (literal > 0) for literal in clause) for clause in clauses)
+
+
+def models(n_vars, clauses):
+    # every satisfying assignment of variables 1..n_vars
+    for values in itertools.product((0, 1), repeat=n_vars):
+        assignment = dict(enumerate(values, 1))
+        if satisfies(clauses, assignment):
+            yield assignment
+
+
+def satisfiable(n_vars, clauses):
+    return next(models(n_vars, clauses), None) is not None
+
+
+def check_answer(n_vars, clauses, answer):
+    # the answer of a complete engine: right verdict, and a model when it says satisfiable
+    ok, assignment = answer[:2]
+    assert ok == satisfiable(n_vars, clauses)
+    if ok:
+        assert all(abs(literal) in assignment for clause in clauses for literal in clause)
+        assert satisfies(clauses, assignment)
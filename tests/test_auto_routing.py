@@ -0,0 +1,110 @@
+import ast
+import itertools
+import json
+import random
+
+from src.helpers.coloring_special_cases_helper import coloring_up_to_two, greedy_coloring
+from src.helpers.horn_sat_helper import solve_anti_horn, solve_horn
+from src.helpers.instance_features_helper import cnf_features
+from src.helpers.project_selection_enum import ProjectSelection
+from src.sat import SatSolver
+from tests.sat_reference import check_answer, random_cnf, satisfies, satisfiable
+
+
+def random_horn(rng, n, m, positive=1):
+    # at most one literal with the sign of positive per clause
+    clauses = []
+    for _ in range(m):
+        variables = rng.sample(range(1, n + 1), rng.randint(1, min(3, n)))
+        flipped = rng.randrange(len(variables) + 1)
+        clauses.append([(positive if at == flipped else -positive) * var for at, var in enumerate(variables)])
+    return clauses
+
+
+def test_horn_and_anti_horn_match_brute_force():
+    rng = random.Random(42)
+    for _ in range(400):
+        n = rng.randint(1, 9)
+        horn = random_horn(rng, n, rng.randint(0, 3 * n))
+        check_answer(n, horn, solve_horn(n, horn))
+        anti_horn = random_horn(rng, n, rng.randint(0, 3 * n), positive=-1)
+        check_answer(n, anti_horn, solve_anti_horn(n, anti_horn))
+
+
+def test_cnf_features_flag_the_polynomial_fragments():
+    rng = random.Random(420)
+    for _ in range(300):
+        n = rng.randint(1, 8)
+        clauses = random_cnf(rng, n, rng.randint(1, 3 * n))
+        features = cnf_features(n, clauses)
+        assert features["two_cnf"] == all(len(clause) <= 2 for clause in clauses)
+        assert features["horn"] == all(sum(literal > 0 for literal in clause) <= 1 for clause in clauses)
+        assert features["anti_horn"] == all(sum(literal < 0 for literal in clause) <= 1 for clause in clauses)
+        assert features["n_clauses"] == len(clauses)
+
+
+def colorable(n, edges, k):
+    return any(all(coloring[u] != coloring[v] for u, v in edges) for coloring in itertools.product(range(k), repeat=n))
+
+
+def check_coloring(n, edges, k, answer):
+    ok, coloring = answer
+    assert ok == colorable(n, edges, k)
+    if ok:
+        assert len(coloring) == n and all(0 <= color < k for color in coloring)
+        assert all(coloring[u] != coloring[v] for u, v in edges)
+
+
+def test_coloring_special_cases_match_brute_force():
+    rng = random.Random(421)
+    for _ in range(400):
+        n = rng.randint(1, 7)
+        # self-loops included, no coloring survives one
+        edges = [(rng.randrange(n), rng.randrange(n)) for _ in range(rng.randint(0, 2 * n))]
+        k = rng.randint(0, 2)
+        check_coloring(n, edges, k, coloring_up_to_two(n, edges, k))
+        # more colors than any degree leaves a color free for every vertex, unless it has a self-loop
+        k = max(sum(vertex in edge for edge in edges) for vertex in range(n)) + 1
+        ok, coloring = greedy_coloring(n, edges, k)
+        assert ok == all(u != v for u, v in edges)
+        if ok:
+            assert all(0 <= color < k for color in coloring) and all(coloring[u] != coloring[v] for u, v in edges)
+
+
+def test_sat_auto_routes_each_fragment_to_its_engine(tmp_path, run_harness):
+    rng = random.Random(422)
+    instances = []
+    for inst_id in range(80):
+        n = rng.randint(2, 9)
+        kind = inst_id % 4
+        if kind == 0:
+            clauses = random_cnf(rng, n, rng.randint(1, 3 * n), max_length=2)
+        elif kind == 1:
+            clauses = random_horn(rng, n, rng.randint(1, 3 * n))
+        elif kind == 2:
+            clauses = random_horn(rng, n, rng.randint(1, 3 * n), positive=-1)
+        else:
+            clauses = random_cnf(rng, n, rng.randint(1, 4 * n), min_length=3)
+        instances.append((n, clauses))
+    path = tmp_path / "auto.cnf"
+    with open(path, "w") as cnf:
+        for inst_id, (n, clauses) in enumerate(instances):
+            cnf.write(f"c {inst_id} 3 ?\np cnf {n} {len(clauses)}\n")
+            cnf.writelines(",".join(map(str, clause)) + ",0\n" for clause in clauses)
+
+    header, *rows = run_harness(SatSolver, ProjectSelection.sat, str(path), ["auto"])["auto"]
+    assert len(rows) == len(instances)
+    for (n, clauses), row in zip(instances, rows):
+        result = dict(zip(header, row))
+        features = json.loads(result["features"])
+        if features["two_cnf"]:
+            assert result["engine"] == "sat_two_cnf"
+        elif features["horn"]:
+            assert result["engine"] == "sat_horn"
+        elif features["anti_horn"]:
+            assert result["engine"] == "sat_anti_horn"
+        else:
+            assert result["engine"] == "sat_backtracking"
+        assert (result["satisfiable"] == "S") == satisfiable(n, clauses)
+        if result["satisfiable"] == "S":
+            assert satisfies(clauses, ast.literal_eval(result["solution"]))
@@ -0,0 +1,29 @@
+import random
+
+from src.helpers.batch_sat_helper import batch_brute_force
+from tests.problem_inputs import run_problem
+from tests.sat_reference import check_answer, random_cnf
+
+
+def test_batch_matches_brute_force():
+    rng = random.Random(43)
+    for n in range(1, 11):
+        formulas = [random_cnf(rng, n, rng.randint(0, 5 * n)) for _ in range(rng.randint(1, 40))]
+        for clauses, answer in zip(formulas, batch_brute_force(n, formulas)):
+            check_answer(n, clauses, answer)
+
+
+def test_batch_mode_writes_the_one_by_one_results(tmp_path, run_harness):
+    one_by_one = run_problem(run_harness, tmp_path, "sat")
+    batched = run_problem(run_harness, tmp_path, "sat", {"batch": {"max_vars": 8}})
+    # the models may differ, the verdicts may not
+    for sub_problem, rows in one_by_one.items():
+        header = rows[0]
+        keep = [at for at, column in enumerate(header) if column != "solution"]
+        assert [[row[at] for at in keep] for row in batched[sub_problem]] == [[row[at] for at in keep] for row in rows]
+
+
+def test_benchmark_mode_turns_batches_off(tmp_path, run_harness):
+    results = run_problem(run_harness, tmp_path, "sat", {"batch": {}, "benchmark": {"max_repeats": 2, "max_seconds": 0.01}})
+    for header, *rows in results.values():
+        assert all(len(row) == len(header) for row in rows)
@@ -0,0 +1,44 @@
+import gc
+import random
+import time
+
+from src.helpers.benchmark_helper import BENCHMARK_COLUMNS, BenchmarkOptions, measure
+from tests.problem_inputs import run_problem
+
+
+def test_measure_warms_up_and_stays_within_its_budget(capsys):
+    calls, gc_states = [], []
+
+    def solve(seconds):
+        calls.append(seconds)
+        gc_states.append(gc.isenabled())
+        print("printed by every call")
+        time.sleep(seconds)
+
+    options = BenchmarkOptions(warmup=2, min_repeats=3, max_repeats=4, max_seconds=10.0)
+    timing = measure(solve, 0.001, options=options)
+    assert 1 <= timing.repeats <= 4 and timing.loops == 1
+    assert len(calls) == options.warmup + timing.repeats
+    assert 0.001 <= timing.minimum <= timing.median and timing.iqr >= 0
+    # the warmup runs with the collector on, the timed calls without it
+    assert gc_states == [True] * options.warmup + [False] * timing.repeats
+    assert gc.isenabled()
+    assert "printed" not in capsys.readouterr().out
+
+
+def test_short_calls_are_batched_into_loops():
+    timing = measure(random.random, options=BenchmarkOptions(max_repeats=5, max_seconds=0.5))
+    assert timing.loops > 1 and timing.repeats <= 5
+
+
+def test_benchmark_columns_follow_the_results(tmp_path, run_harness):
+    benchmark = {"benchmark": {"max_repeats": 3, "max_seconds": 0.01}}
+    plain = run_problem(run_harness, tmp_path, "sat", count=15)
+    timed = run_problem(run_harness, tmp_path, "sat", benchmark, count=15)
+    for sub_problem, (header, *rows) in timed.items():
+        # time columns are dropped by run_problem, the repeats column is what is left of the benchmark ones
+        kept = [column for column in BENCHMARK_COLUMNS if "time" not in column]
+        assert all(column in header for column in kept)
+        without = [at for at, column in enumerate(header) if column not in kept]
+        assert [[row[at] for at in without] for row in [header, *rows]] == plain[sub_problem]
+        assert all(1 <= int(row[header.index("repeats")]) <= 3 for row in rows)
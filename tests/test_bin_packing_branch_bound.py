@@ -0,0 +1,69 @@
+import random
+import time
+
+import pytest
+
+from src.helpers.bin_packing_bounds_helper import lower_bound_l2, lower_bound_l3, martello_toth_reduction
+from src.helpers.bin_packing_branch_bound_helper import BinPackingBranchAndBound, bin_packing_branch_and_bound
+from tests.bin_packing_reference import check_packing, optimal_bins
+
+
+def triplets(rng, n_bins, bin_capacity=1000):
+    # Falkenauer-style: every bin of the optimum holds exactly three items in (C/4, C/2)
+    items = []
+    while len(items) < 3 * n_bins:
+        a = rng.randint(380, 490)
+        b = rng.randint(251, (bin_capacity - a) // 2)
+        c = bin_capacity - a - b
+        if 250 < c < 500:
+            items += [a, b, c]
+    rng.shuffle(items)
+    return items
+
+
+def test_branch_and_bound_matches_brute_force():
+    rng = random.Random(31)
+    for _ in range(400):
+        bin_capacity = rng.randint(1, 30)
+        items = [rng.randint(1, bin_capacity) for _ in range(rng.randint(0, 9))]
+        bins = bin_packing_branch_and_bound(bin_capacity, items)
+        check_packing(bin_capacity, items, bins)
+        assert len(bins) == optimal_bins(bin_capacity, items)
+        assert bins.proven_optimal
+
+
+def test_reduction_keeps_the_optimum():
+    rng = random.Random(310)
+    reduced = 0
+    for _ in range(400):
+        bin_capacity = rng.randint(1, 30)
+        items = [rng.randint(1, bin_capacity) for _ in range(rng.randint(0, 9))]
+        fixed, rest = martello_toth_reduction(bin_capacity, items)
+        check_packing(bin_capacity, items, fixed + [[item] for item in rest])
+        optimum = optimal_bins(bin_capacity, items)
+        assert len(fixed) + optimal_bins(bin_capacity, rest) == optimum
+        assert lower_bound_l2(bin_capacity, items) <= lower_bound_l3(bin_capacity, items) <= optimum
+        reduced += bool(fixed)
+    assert reduced > 100
+
+
+def test_search_returns_its_incumbent_once_the_budget_runs_out():
+    rng = random.Random(311)
+    # 33 triplets: FFD needs more bins than L2 and the search cannot close the gap in 0.5 s
+    items = triplets(rng, 33)
+    search = BinPackingBranchAndBound(1000, items, max_nodes=10 ** 9, time_limit=0.5)
+    started = time.perf_counter()
+    bins = search.solve()
+    assert time.perf_counter() - started < 1.5
+    check_packing(1000, items, bins)
+    assert len(bins) >= 33
+    assert bins.proven_optimal == (len(bins) == 33)
+
+    bins = bin_packing_branch_and_bound(1000, items, max_nodes=50)
+    check_packing(1000, items, bins)
+    assert not bins.proven_optimal
+
+
+def test_item_larger_than_a_bin_is_rejected():
+    with pytest.raises(ValueError):
+        bin_packing_branch_and_bound(10, [4, 11])
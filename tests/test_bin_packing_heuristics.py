@@ -0,0 +1,86 @@
+import ast
+import random
+from collections import defaultdict
+
+import pytest
+
+from src.bin_packing import BinPacking
+from src.helpers.bin_packing_bounds_helper import lower_bound_l2
+from src.helpers import bin_packing_heuristics_helper
+from src.helpers.bin_packing_heuristics_helper import HEURISTICS, first_fit_decreasing, pack_decreasing
+from src.helpers.project_selection_enum import ProjectSelection
+from tests.bin_packing_reference import check_packing, optimal_bins
+
+
+def random_instance(rng, max_items):
+    bin_capacity = rng.randint(1, 30)
+    return bin_capacity, [rng.randint(1, bin_capacity) for _ in range(rng.randint(0, max_items))]
+
+
+@pytest.mark.parametrize("heuristic", sorted(HEURISTICS))
+def test_heuristics_stay_within_their_guarantee(heuristic):
+    rng = random.Random(32)
+    for _ in range(400):
+        bin_capacity, items = random_instance(rng, 9)
+        bins = pack_decreasing(bin_capacity, items, heuristic)
+        check_packing(bin_capacity, items, bins)
+        optimum = optimal_bins(bin_capacity, items)
+        assert lower_bound_l2(bin_capacity, items) <= optimum <= len(bins)
+        # FFD and BFD never use more than 11/9 OPT + 6/9 bins
+        assert 9 * len(bins) <= 11 * optimum + 6
+
+
+def naive_first_fit_decreasing(bin_capacity, items):
+    bins = []
+    for item in sorted(items, reverse=True):
+        for bin_items in bins:
+            if sum(bin_items) + item <= bin_capacity:
+                bin_items.append(item)
+                break
+        else:
+            bins.append([item])
+    return bins
+
+
+@pytest.mark.parametrize("run_work", [0, bin_packing_heuristics_helper.FFD_RUN_WORK])
+def test_first_fit_runs_and_tree_match_plain_first_fit(monkeypatch, run_work):
+    # no work budget sends every instance to the tree, the default one to the runs
+    monkeypatch.setattr(bin_packing_heuristics_helper, "FFD_RUN_WORK", run_work)
+    rng = random.Random(322)
+    for _ in range(1000):
+        bin_capacity = rng.randint(1, 40)
+        items = [rng.randint(0, bin_capacity) for _ in range(rng.randint(0, 40))]
+        assert first_fit_decreasing(bin_capacity, items) == naive_first_fit_decreasing(bin_capacity, items)
+
+
+def test_unknown_heuristic_is_rejected():
+    with pytest.raises(ValueError):
+        pack_decreasing(10, [3, 4], "nfd")
+
+
+def test_simple_rows_report_the_gap_to_the_lower_bound(tmp_path, run_harness):
+    rng = random.Random(321)
+    instances = [random_instance(rng, 9) for _ in range(40)]
+    instances = [(bin_capacity, items) for bin_capacity, items in instances if items]
+    path = tmp_path / "bins.txt"
+    path.write_text("".join(f"{bin_capacity} {' '.join(map(str, items))}\n" for bin_capacity, items in instances))
+
+    results = run_harness(BinPacking, ProjectSelection.bin_packing, str(path), ["simple", "btracking"])
+    for sub_problem, (header, *rows) in results.items():
+        assert ("gap" in header) == (sub_problem == "simple")
+        packed = defaultdict(list)
+        for row in rows:
+            result = dict(zip(header, row))
+            packed[int(result["instance_id"])].append(result)
+        assert sorted(packed) == list(range(len(instances)))
+        for inst_id, (bin_capacity, items) in enumerate(instances):
+            bins = [ast.literal_eval(result["bins_array"]) for result in packed[inst_id]]
+            check_packing(bin_capacity, items, bins)
+            if sub_problem == "btracking":
+                assert len(bins) == optimal_bins(bin_capacity, items)
+                assert all(result["proven_optimal"] == "True" for result in packed[inst_id])
+                continue
+            lower_bound = lower_bound_l2(bin_capacity, items)
+            for result in packed[inst_id]:
+                assert int(result["l2_lower_bound"]) == lower_bound
+                assert int(result["gap"]) == len(bins) - lower_bound
@@ -0,0 +1,42 @@
+import random
+
+from src.bin_packing import BinPacking
+from src.helpers.dmaics_parser import iter_multi_instance_bin_packing, parse_multi_instance_bin_packing
+from src.helpers.project_selection_enum import ProjectSelection
+
+
+def test_parser_matches_line_splitting(tmp_path):
+    rng = random.Random(34)
+    for attempt in range(50):
+        lines = [[rng.randint(0, 10 ** rng.randint(1, 12)) for _ in range(rng.randint(1, 20))] for _ in range(rng.randint(1, 30))]
+        text = ""
+        for numbers in lines:
+            gap = lambda: rng.choice([" ", "  ", "\t", " \t "])
+            text += rng.choice(["", " ", "\t"]) + gap().join(map(str, numbers)) + rng.choice(["", " "])
+            text += rng.choice(["\n", "\r\n", "\n\n", "\n \n"])
+        path = tmp_path / f"bins_{attempt}.txt"
+        path.write_bytes(text.encode())
+        parsed = parse_multi_instance_bin_packing(str(path))
+        assert [instance.tolist() for instance in parsed] == lines
+        assert [instance.tolist() for instance in iter_multi_instance_bin_packing(str(path))] == lines
+
+
+class SortingBinPacking(BinPacking):
+    # a solver that sorts and overwrites its items, later calls must still see the file's items
+    expected = [10, 2, 5, 4, 7, 1, 3, 8, 6]
+
+    def sort_items(self, bin_capacity, clauses):
+        assert type(clauses) is list and all(type(item) is int for item in clauses)
+        assert [bin_capacity] + clauses == self.expected
+        clauses.sort()
+        clauses[0] = -1
+        return [[item] for item in self.expected[1:]]
+
+    binpacking_bestcase = binpacking_backtracing = sort_items
+
+
+def test_solvers_get_their_own_item_lists(tmp_path, run_harness):
+    path = tmp_path / "bins.txt"
+    path.write_text("10 2 5 4 7 1 3 8 6\n" * 2)
+    results = run_harness(SortingBinPacking, ProjectSelection.bin_packing, str(path), ["best_case", "btracking"])
+    assert all(len(rows) == 1 + 2 * 8 for rows in results.values())
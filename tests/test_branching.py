@@ -0,0 +1,20 @@
+import random
+
+import pytest
+
+from src.helpers.branching_helper import HEURISTICS, solve_with_branching
+from tests.sat_reference import check_answer, random_cnf
+
+
+@pytest.mark.parametrize("heuristic", HEURISTICS)
+def test_every_heuristic_matches_brute_force(heuristic):
+    rng = random.Random(46)
+    for _ in range(300):
+        n = rng.randint(1, 10)
+        clauses = random_cnf(rng, n, rng.randint(0, 5 * n))
+        check_answer(n, clauses, solve_with_branching(n, clauses, heuristic))
+
+
+def test_unknown_heuristic_is_rejected():
+    with pytest.raises(ValueError):
+        solve_with_branching(2, [[1, 2]], "vsids")
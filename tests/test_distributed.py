@@ -0,0 +1,15 @@
+import pytest
+
+from tests.problem_inputs import PROBLEMS, run_problem
+
+DISTRIBUTED = {"mode": "distributed", "distributed": {"local_workers": 2, "shard_size": 4, "heartbeat_seconds": 0.2}}
+
+
+# the coordinator's serve_forever thread leaves through sys.exit(0) when the run stops it
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+@pytest.mark.parametrize("problem", sorted(PROBLEMS))
+def test_distributed_run_writes_the_sequential_results(tmp_path, run_harness, problem):
+    sequential = run_problem(run_harness, tmp_path, problem)
+    # 40 instances over shards of 4 keep both workers busy and returning shards out of order
+    distributed = run_problem(run_harness, tmp_path, problem, DISTRIBUTED)
+    assert distributed == sequential
@@ -0,0 +1,93 @@
+import os
+import random
+
+from src.helpers.branching_helper import solve_with_branching
+from src.helpers.drat_helper import ADD, DELETE, DratWriter, check_proof, iter_drat
+from src.helpers.project_selection_enum import ProjectSelection
+from src.sat import SatSolver
+from tests.sat_reference import random_cnf, satisfiable
+
+
+def test_proofs_read_back_as_written(tmp_path):
+    rng = random.Random(49)
+    path = str(tmp_path / "steps.drat")
+    # a tiny buffer makes the writer flush in the middle of the steps
+    writer = DratWriter(path, buffer_bytes=16)
+    steps = []
+    for _ in range(300):
+        kind = rng.choice([ADD, DELETE])
+        literals = [rng.choice([1, -1]) * rng.randint(1, 10 ** rng.randint(1, 9)) for _ in range(rng.randint(0, 5))]
+        (writer.add if kind == ADD else writer.delete)(literals)
+        steps.append((kind, literals))
+    writer.close()
+    assert list(iter_drat(path)) == steps
+    assert writer.lemmas == sum(kind == ADD for kind, literals in steps)
+
+
+def test_discarded_proof_leaves_no_file(tmp_path):
+    kept, flushed, buffered = (str(tmp_path / f"{name}.drat") for name in ("kept", "flushed", "buffered"))
+    for path in (kept, flushed, buffered):
+        writer = DratWriter(path, buffer_bytes=8)
+        # the long lemma fills the buffer and is written before the writer is discarded
+        writer.add(list(range(1, 10)) if path == flushed else [1])
+        if path == kept:
+            writer.close()
+        else:
+            writer.discard()
+    assert os.listdir(tmp_path) == ["kept.drat"]
+
+
+def test_search_proofs_of_unsatisfiable_formulas_check(tmp_path):
+    rng = random.Random(490)
+    checked = 0
+    for attempt in range(300):
+        n = rng.randint(1, 8)
+        clauses = random_cnf(rng, n, rng.randint(2 * n, 6 * n))
+        path = str(tmp_path / f"{attempt}.drat")
+        proof = DratWriter(path)
+        ok, assignment = solve_with_branching(n, clauses, "index", proof)
+        proof.close()
+        assert ok == satisfiable(n, clauses)
+        if not ok:
+            checked += 1
+            assert check_proof(clauses, path)
+    assert checked > 50
+
+
+def test_no_proof_refutes_a_satisfiable_formula(tmp_path):
+    rng = random.Random(491)
+    rejected = 0
+    while rejected < 200:
+        n = rng.randint(1, 6)
+        clauses = random_cnf(rng, n, rng.randint(1, 3 * n))
+        if not satisfiable(n, clauses):
+            continue
+        path = str(tmp_path / "forged.drat")
+        proof = DratWriter(path)
+        for lemma in random_cnf(rng, n, rng.randint(0, 10)) + [[]]:
+            if rng.random() < 0.2:
+                proof.delete(rng.choice(clauses))
+            proof.add(lemma)
+        proof.close()
+        assert not check_proof(clauses, path)
+        rejected += 1
+
+
+def test_proof_mode_checks_this_runs_proofs_only(tmp_path, run_harness, capsys):
+    rng = random.Random(492)
+    instances = [random_cnf(rng, 6, rng.randint(5, 30)) for _ in range(30)]
+    path = tmp_path / "proved.cnf"
+    with open(path, "w") as cnf:
+        for inst_id, clauses in enumerate(instances):
+            cnf.write(f"c {inst_id} 3 ?\np cnf 6 {len(clauses)}\n")
+            cnf.writelines(",".join(map(str, clause)) + ",0\n" for clause in clauses)
+    # a proof left behind by an earlier run over another input of the same name
+    proof_dir = tmp_path / "results" / "sat_backtracking_proved_sat_solver_results_proofs"
+    proof_dir.mkdir(parents=True)
+    (proof_dir / "999.drat").write_bytes(b"a\x02\x00")
+
+    header, *rows = run_harness(SatSolver, ProjectSelection.sat, str(path), ["btracking"], {"proof": {}})["btracking"]
+    unsatisfiable = [result[0] for result in rows if dict(zip(header, result))["satisfiable"] == "U"]
+    assert unsatisfiable == [str(inst_id) for inst_id, clauses in enumerate(instances) if not satisfiable(6, clauses)]
+    assert sorted(os.listdir(proof_dir)) == sorted(f"{inst_id}.drat" for inst_id in unsatisfiable)
+    assert f"Verified {len(unsatisfiable)} of {len(unsatisfiable)} DRAT proofs" in capsys.readouterr().out
@@ -0,0 +1,111 @@
+import ast
+import itertools
+import random
+
+from src.graph_coloring import GraphColoring
+from src.helpers.graph_decomposition_helper import connected_components, split_edges
+from src.helpers.project_selection_enum import ProjectSelection
+
+
+def random_graph(rng, n, m):
+    return [(rng.randrange(n), rng.randrange(n)) for _ in range(m)]
+
+
+def flood_fill_components(n, edges):
+    adj = {v: set() for v in range(n)}
+    for u, v in edges:
+        adj[u].add(v)
+        adj[v].add(u)
+    seen, components = set(), []
+    for root in range(n):
+        if root in seen:
+            continue
+        stack, component = [root], set()
+        while stack:
+            v = stack.pop()
+            if v not in component:
+                component.add(v)
+                stack.extend(adj[v])
+        seen |= component
+        components.append(component)
+    return components
+
+
+def test_connected_components_match_flood_fill():
+    rng = random.Random(26)
+    for _ in range(500):
+        n = rng.randint(1, 15)
+        edges = random_graph(rng, n, rng.randint(0, n))
+        components = connected_components(range(n), edges)
+        assert sorted(map(sorted, components)) == sorted(map(sorted, flood_fill_components(n, edges)))
+        per_component = split_edges(components, edges)
+        assert sorted(edge for component_edges in per_component for edge in component_edges) == sorted(edges)
+        for component, component_edges in zip(components, per_component):
+            assert all(u in component and v in component for u, v in component_edges)
+
+
+def colorable(n, edges, k):
+    return any(all(coloring[u] != coloring[v] for u, v in edges) for coloring in itertools.product(range(k), repeat=n))
+
+
+def test_disconnected_colorings_are_merged_per_component(tmp_path, run_harness):
+    # Auto answers k <= 2 and k above the max degree without the student search methods
+    rng = random.Random(260)
+    instances = []
+    for inst_id in range(60):
+        n = rng.randint(1, 8)
+        edges = sorted({tuple(sorted(edge)) for edge in random_graph(rng, n, rng.randint(0, n))})
+        degrees = [sum(v in edge for edge in edges) for v in range(n)]
+        k = rng.choice([1, 2, max(degrees) + 1])
+        instances.append((str(inst_id), k, n, edges))
+    path = tmp_path / "graphs.txt"
+    with open(path, "w") as graphs:
+        for inst_id, k, n, edges in instances:
+            graphs.write(f"c {inst_id} {k} ?\np cnf {n} {len(edges)}\n")
+            graphs.writelines(f"{u + 1},{v + 1}\n" for u, v in edges)
+
+    header, *rows = run_harness(GraphColoring, ProjectSelection.graph_coloring, str(path), ["auto"])["auto"]
+    assert len(rows) == len(instances)
+    for (inst_id, k, n, edges), row in zip(instances, rows):
+        result = dict(zip(header, row))
+        assert result["instance_id"] == inst_id
+        assert (result["colorable"] == "YES") == colorable(n, edges, k)
+        if result["colorable"] == "YES":
+            coloring = ast.literal_eval(result["coloring"])
+            assert len(coloring) == n and all(0 <= color < k for color in coloring)
+            assert all(coloring[u] != coloring[v] for u, v in edges)
+
+
+class DictColoring(GraphColoring):
+    """
+    Backtracking by brute force, returning the coloring keyed by vertex like the abstract signature.
+    """
+
+    def coloring_backtracking(self, n_vertices, edges, k):
+        for coloring in itertools.product(range(k), repeat=n_vertices):
+            if all(coloring[u] != coloring[v] for u, v in edges):
+                return True, dict(enumerate(coloring))
+        return False, {}
+
+
+def test_dict_colorings_are_merged_by_vertex(tmp_path, run_harness):
+    rng = random.Random(261)
+    instances = []
+    for inst_id in range(40):
+        n = rng.randint(1, 9)
+        edges = sorted({tuple(sorted(edge)) for edge in random_graph(rng, n, rng.randint(0, n)) if edge[0] != edge[1]})
+        instances.append((str(inst_id), 3, n, edges))
+    path = tmp_path / "graphs.txt"
+    with open(path, "w") as graphs:
+        for inst_id, k, n, edges in instances:
+            graphs.write(f"c {inst_id} {k} ?\np cnf {n} {len(edges)}\n")
+            graphs.writelines(f"{u + 1},{v + 1}\n" for u, v in edges)
+
+    header, *rows = run_harness(DictColoring, ProjectSelection.graph_coloring, str(path), ["btracking"])["btracking"]
+    for (inst_id, k, n, edges), row in zip(instances, rows):
+        result = dict(zip(header, row))
+        assert (result["colorable"] == "YES") == colorable(n, edges, k)
+        if result["colorable"] == "YES":
+            coloring = ast.literal_eval(result["coloring"])
+            assert sorted(coloring) == list(range(n)) and all(0 <= color < k for color in coloring.values())
+            assert all(coloring[u] != coloring[v] for u, v in edges)
@@ -0,0 +1,18 @@
+import random
+
+from src.helpers.gray_code_helper import gray_code_brute_force
+from tests.sat_reference import check_answer, random_cnf
+
+
+def test_gray_code_matches_brute_force():
+    rng = random.Random(45)
+    for _ in range(500):
+        n = rng.randint(1, 10)
+        clauses = random_cnf(rng, n, rng.randint(0, 5 * n))
+        check_answer(n, clauses, gray_code_brute_force(n, clauses))
+
+
+def test_variables_above_the_header_count_are_enumerated():
+    # x3 is only in the clauses, the header says two variables
+    ok, assignment = gray_code_brute_force(2, [[3], [-1], [-2]])
+    assert ok and assignment[3] == 1
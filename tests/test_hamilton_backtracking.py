@@ -0,0 +1,35 @@
+import random
+
+from src.helpers.hamilton_backtracking_helper import hamilton_backtrack_search
+from tests.hamilton_reference import brute_force, check_walks, random_graph
+
+
+def random_bipartite_graph(rng, left, right, m):
+    edges = sorted({(rng.randint(1, left), left + rng.randint(1, right)) for _ in range(m)})
+    return {v for edge in edges for v in edge}, edges
+
+
+def test_backtracking_matches_brute_force():
+    rng = random.Random(28)
+    for _ in range(400):
+        n = rng.randint(2, 7)
+        vertices, edges = random_graph(rng, n, rng.randint(1, n * (n - 1) // 2))
+        result = hamilton_backtrack_search(vertices, edges)
+        assert check_walks(vertices, edges, result) == brute_force(vertices, edges)
+
+
+def test_bipartite_side_balance_matches_brute_force():
+    rng = random.Random(280)
+    for _ in range(300):
+        left, right = rng.randint(1, 4), rng.randint(1, 4)
+        vertices, edges = random_bipartite_graph(rng, left, right, rng.randint(1, left * right))
+        result = hamilton_backtrack_search(vertices, edges)
+        assert check_walks(vertices, edges, result) == brute_force(vertices, edges)
+
+
+def test_unbalanced_complete_bipartite_graph_is_answered_without_enumeration():
+    # sides of 14 and 11 leave no Hamiltonian path, the longest cycle alternates over 2 * 11 vertices
+    left, right = 14, 11
+    edges = [(u, left + v) for u in range(1, left + 1) for v in range(1, right + 1)]
+    result = hamilton_backtrack_search(set(range(1, left + right + 1)), edges)
+    assert result == (False, [], False, [], 2 * right)
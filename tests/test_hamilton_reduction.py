@@ -0,0 +1,53 @@
+import ast
+import random
+
+from src.hamilton_cycle import HamiltonCycleColoring
+from src.helpers.hamilton_reduction_helper import reduce_hamilton_graph, solve_reduced
+from src.helpers.project_selection_enum import ProjectSelection
+from tests.hamilton_reference import brute_force, check_walks, random_graph
+
+
+def test_reduction_only_rules_out_what_brute_force_rules_out():
+    rng = random.Random(30)
+    decided = 0
+    for _ in range(500):
+        n = rng.randint(3, 8)
+        vertices, edges = random_graph(rng, n, rng.randint(1, n * (n - 1) // 2))
+        path, cycle, largest = brute_force(vertices, edges)
+        reduction = reduce_hamilton_graph(vertices, edges)
+        assert not (reduction.no_path and path)
+        assert not (reduction.no_cycle and cycle)
+        result, _ = solve_reduced(vertices, edges)
+        if result is not None:
+            decided += 1
+            assert result == (False, [], False, [], largest)
+    # the rules have to fire on part of the sample for the test to mean anything
+    assert decided > 50
+
+
+def test_reduced_harness_matches_brute_force(tmp_path, run_harness):
+    rng = random.Random(300)
+    instances = []
+    while len(instances) < 60:
+        n = rng.randint(3, 7)
+        vertices, edges = random_graph(rng, n, rng.randint(1, n * (n - 1) // 2))
+        if edges:
+            instances.append((vertices, edges))
+    path = tmp_path / "graphs.cnf"
+    with open(path, "w") as graphs:
+        for inst_id, (vertices, edges) in enumerate(instances, 1):
+            # headers count one more vertex than the edges use, the solvers only see the used ones
+            graphs.write(f"c INSTANCE {inst_id}\np edge {max(vertices) + 1} {len(edges)}\n")
+            graphs.writelines(f"e {u} {v}\n" for u, v in edges)
+
+    results = run_harness(HamiltonCycleColoring, ProjectSelection.hamiltonian, str(path), ["btracking", "best_case"])
+    for header, *rows in results.values():
+        assert len(rows) == len(instances)
+        for (vertices, edges), row in zip(instances, rows):
+            result = dict(zip(header, row))
+            walk = lambda column: [] if result[column] == "None" else ast.literal_eval(result[column])
+            answer = (result["Hamiltonian_Path"] != "None", walk("Hamiltonian_Path"),
+                      result["Hamiltonian_Cycle"] != "None", walk("Hamiltonian_Cycle"),
+                      int(result["Largest_Cycle_Size"]))
+            assert int(result["Num_Vertices"]) == len(vertices)
+            assert check_walks(vertices, edges, answer) == brute_force(vertices, edges)
@@ -0,0 +1,51 @@
+import random
+import tracemalloc
+
+import pytest
+
+from src.hamilton_cycle import HamiltonCycleColoring
+from src.helpers.held_karp_helper import hamilton_held_karp, held_karp_peak_bytes
+from src.helpers.project_selection_enum import ProjectSelection
+from tests.hamilton_reference import brute_force, check_walks, random_graph
+
+
+def test_held_karp_matches_brute_force():
+    rng = random.Random(27)
+    for _ in range(400):
+        n = rng.randint(2, 7)
+        vertices, edges = random_graph(rng, n, rng.randint(1, n * (n - 1) // 2))
+        result = hamilton_held_karp(vertices, edges)
+        assert check_walks(vertices, edges, result) == brute_force(vertices, edges)
+
+
+@pytest.mark.parametrize("n", [16, 19])
+def test_peak_bytes_match_traced_allocations(n):
+    rng = random.Random(n)
+    vertices, edges = random_graph(rng, n, 3 * n)
+    tracemalloc.start()
+    try:
+        hamilton_held_karp(vertices | set(range(1, n + 1)), edges)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    # the estimate covers numpy's whole ufunc buffer, which small tables do not fill
+    assert 0.5 * held_karp_peak_bytes(n) <= peak <= 1.05 * held_karp_peak_bytes(n)
+
+
+@pytest.mark.parametrize("execution", [None, {"mode": "pipelined", "workers": 2}])
+def test_run_reports_the_peak_before_solving(tmp_path, run_harness, capsys, execution):
+    rng = random.Random(270)
+    path = tmp_path / "graphs.cnf"
+    largest = 0
+    with open(path, "w") as graphs:
+        for inst_id, n in enumerate([5, 12, 7], 1):
+            vertices, edges = random_graph(rng, n, 2 * n)
+            largest = max(largest, len({v for edge in edges for v in edge}))
+            graphs.write(f"c INSTANCE {inst_id}\np edge {n} {len(edges)}\n")
+            graphs.writelines(f"e {u} {v}\n" for u, v in edges)
+    run_harness(HamiltonCycleColoring, ProjectSelection.hamiltonian, str(path), ["best_case"], execution)
+    out = capsys.readouterr().out
+    report = f"Held-Karp needs up to {held_karp_peak_bytes(largest) / 2**20:.1f} MiB " \
+             f"for the largest instance ({largest} vertices)"
+    assert out.count(report) == 1
+    assert out.index(report) < out.index("Results written")
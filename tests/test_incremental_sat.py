@@ -0,0 +1,104 @@
+import ast
+import itertools
+import random
+
+import pytest
+
+from src.helpers import incremental_sat_helper
+from src.helpers.incremental_sat_helper import ClauseSelectorSolver, IncrementalSatSolver
+from src.helpers.project_selection_enum import ProjectSelection
+from src.sat import SatSolver
+from tests.sat_reference import check_answer, random_cnf, satisfiable, satisfies
+
+
+@pytest.fixture
+def busy_solver(monkeypatch):
+    # restarts and learned clause reduction also happen on small formulas
+    monkeypatch.setattr(incremental_sat_helper, "RESTART_CONFLICTS", 2)
+    monkeypatch.setattr(incremental_sat_helper, "MIN_LEARNED", 5)
+
+
+def test_scopes_and_assumptions_match_brute_force(busy_solver):
+    rng = random.Random(47)
+    for _ in range(200):
+        n = rng.randint(1, 10)
+        solver, scopes = IncrementalSatSolver(), [[]]
+        for _ in range(40):
+            step = rng.random()
+            if step < 0.45:
+                clause = random_cnf(rng, n, 1)[0]
+                solver.add_clause(clause)
+                scopes[-1].append(clause)
+            elif step < 0.6:
+                solver.push()
+                scopes.append([])
+            elif step < 0.75 and len(scopes) > 1:
+                solver.pop()
+                scopes.pop()
+            else:
+                assumptions = [rng.choice([1, -1]) * rng.randint(1, n) for _ in range(rng.randint(0, 3))]
+                clauses = [clause for scope in scopes for clause in scope] + [[literal] for literal in assumptions]
+                ok, assignment = solver.solve(assumptions)
+                assert ok == satisfiable(n, clauses)
+                if ok:
+                    assert satisfies(clauses, assignment)
+
+
+def pigeonhole(pigeons, holes):
+    # pigeon i sits in hole j when variable i * holes + j + 1 is true
+    var = lambda i, j: i * holes + j + 1
+    clauses = [[var(i, j) for j in range(holes)] for i in range(pigeons)]
+    clauses += [[-var(i, j), -var(k, j)] for j in range(holes) for i, k in itertools.combinations(range(pigeons), 2)]
+    return clauses, var
+
+
+def test_learned_clauses_survive_assumptions_and_reduction(busy_solver):
+    # pigeonhole formulas take hundreds of conflicts, so restarts and reductions do happen
+    clauses, var = pigeonhole(6, 6)
+    solver = IncrementalSatSolver(clauses)
+    closed_hole = [-var(i, 5) for i in range(6)]
+    assert solver.solve(closed_hole) == (False, {})
+    assert solver.conflicts > 100
+    ok, assignment = solver.solve()
+    assert ok and satisfies(clauses, assignment)
+    assert solver.solve(closed_hole) == (False, {})
+    ok, assignment = solver.solve(closed_hole[1:])
+    assert ok and satisfies(clauses + [[literal] for literal in closed_hole[1:]], assignment)
+
+
+def test_shared_clauses_match_brute_force(busy_solver):
+    rng = random.Random(470)
+    for _ in range(40):
+        n = rng.randint(1, 10)
+        solver = ClauseSelectorSolver(n)
+        base = random_cnf(rng, n, rng.randint(0, 4 * n))
+        for _ in range(30):
+            # mostly the base with a few changes, sometimes an unrelated formula
+            if rng.random() < 0.8:
+                clauses = [clause for clause in base if rng.random() < 0.95] + random_cnf(rng, n, rng.randint(0, 3))
+            else:
+                clauses = random_cnf(rng, n, rng.randint(0, 4 * n))
+            ok, assignment = solver.solve(clauses)
+            check_answer(n, clauses, (ok, assignment))
+            if ok:
+                assert sorted(assignment) == list(range(1, n + 1))
+
+
+def test_incremental_sub_problem_matches_brute_force(tmp_path, run_harness):
+    rng = random.Random(471)
+    base = random_cnf(rng, 10, 35)
+    instances = [base + random_cnf(rng, 10, rng.randint(0, 4), max_length=1) for _ in range(40)]
+    path = tmp_path / "related.cnf"
+    with open(path, "w") as cnf:
+        for inst_id, clauses in enumerate(instances):
+            cnf.write(f"c {inst_id} 3 ?\np cnf 10 {len(clauses)}\n")
+            cnf.writelines(",".join(map(str, clause)) + ",0\n" for clause in clauses)
+
+    header, *rows = run_harness(SatSolver, ProjectSelection.sat, str(path), ["incremental"])["incremental"]
+    assert len(rows) == len(instances)
+    for clauses, row in zip(instances, rows):
+        result = dict(zip(header, row))
+        assert result["method"] == "Incremental"
+        assert (result["satisfiable"] == "S") == satisfiable(10, clauses)
+        if result["satisfiable"] == "S":
+            assert satisfies(clauses, ast.literal_eval(result["solution"]))
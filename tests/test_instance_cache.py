@@ -0,0 +1,41 @@
+import ast
+import random
+from collections import defaultdict
+
+from src.bin_packing import BinPacking
+from src.helpers.project_selection_enum import ProjectSelection
+
+
+class CountingBinPacking(BinPacking):
+    calls = []
+
+    def binpacking_backtracing(self, bin_capacity, clauses):
+        self.calls.append((bin_capacity, sorted(clauses)))
+        return super().binpacking_backtracing(bin_capacity, clauses)
+
+
+def test_identical_instances_are_solved_once(tmp_path, run_harness):
+    rng = random.Random(35)
+    distinct = [(rng.randint(5, 20), [rng.randint(1, 5) for _ in range(rng.randint(1, 8))]) for _ in range(10)]
+    # reordered items and another capacity make a repeat or a new instance
+    instances = []
+    for _ in range(60):
+        bin_capacity, items = rng.choice(distinct)
+        if rng.random() < 0.2:
+            bin_capacity += 1
+        instances.append((bin_capacity, rng.sample(items, len(items))))
+    path = tmp_path / "bins.txt"
+    path.write_text("".join(f"{bin_capacity} {' '.join(map(str, items))}\n" for bin_capacity, items in instances))
+
+    CountingBinPacking.calls = []
+    header, *rows = run_harness(CountingBinPacking, ProjectSelection.bin_packing, str(path), ["btracking"])["btracking"]
+    keys = {(bin_capacity, tuple(sorted(items))) for bin_capacity, items in instances}
+    assert sorted((bin_capacity, tuple(items)) for bin_capacity, items in CountingBinPacking.calls) == sorted(keys)
+
+    # every instance still gets rows with its own id
+    packed = defaultdict(list)
+    for row in rows:
+        result = dict(zip(header, row))
+        packed[int(result["instance_id"])] += ast.literal_eval(result["bins_array"])
+    assert {inst_id: sorted(items) for inst_id, items in packed.items()} == \
+        {inst_id: sorted(items) for inst_id, (bin_capacity, items) in enumerate(instances)}
@@ -0,0 +1,35 @@
+import random
+
+import pytest
+
+from src.helpers.local_search_helper import ALGORITHMS, LocalSearchOptions, local_search
+from tests.sat_reference import random_cnf, satisfiable, satisfies
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_local_search_answers_are_sound(algorithm):
+    rng = random.Random(44)
+    options = LocalSearchOptions(algorithm=algorithm, max_flips=500, max_tries=2)
+    found = 0
+    for _ in range(200):
+        n = rng.randint(1, 10)
+        clauses = random_cnf(rng, n, rng.randint(0, 5 * n))
+        ok, assignment = local_search(n, clauses, options)
+        # incomplete: it may give up, but never calls a satisfiable formula unsatisfiable
+        assert ok is not False
+        if ok:
+            found += 1
+            assert sorted(assignment) == list(range(1, n + 1)) and satisfies(clauses, assignment)
+        elif satisfiable(n, clauses):
+            # small satisfiable formulas are found well within the budget
+            pytest.fail(f"{algorithm} gave up on satisfiable {clauses}")
+    assert found > 50
+
+
+def test_empty_clause_is_unsatisfiable():
+    assert local_search(2, [[1, 2], []]) == (False, {})
+
+
+def test_unknown_algorithm_is_rejected():
+    with pytest.raises(ValueError):
+        LocalSearchOptions.from_options({"algorithm": "gsat"})
@@ -0,0 +1,25 @@
+import random
+
+from src.helpers.hamilton_backtracking_helper import HamiltonSearch
+from src.helpers.longest_cycle_helper import longest_cycle
+from tests.hamilton_reference import brute_force, random_graph
+
+
+def test_longest_cycle_matches_brute_force():
+    rng = random.Random(29)
+    for _ in range(300):
+        n = rng.randint(3, 8)
+        # sparse graphs split into several blocks, dense ones are mostly one block
+        vertices, edges = random_graph(rng, n, rng.randint(n // 2, n * (n - 1) // 2))
+        assert longest_cycle(HamiltonSearch(vertices, edges)) == brute_force(vertices, edges)[2]
+
+
+def test_bipartite_block_limit_does_not_cut_the_longest_cycle():
+    # K(8, 6) without a few edges still has a cycle through all 6 vertices of the small side
+    rng = random.Random(290)
+    left, right = 8, 6
+    edges = [(u, left + v) for u in range(1, left + 1) for v in range(1, right + 1)]
+    for edge in rng.sample(edges, 4):
+        edges.remove(edge)
+    search = HamiltonSearch({v for edge in edges for v in edge}, edges)
+    assert longest_cycle(search) == 2 * right
@@ -0,0 +1,64 @@
+import ast
+import random
+import sys
+
+from src.helpers.model_count_helper import ModelCounter, count_models
+from src.helpers.project_selection_enum import ProjectSelection
+from src.sat import SatSolver
+from tests.sat_reference import models, random_cnf, satisfies
+
+
+def test_counts_match_brute_force():
+    rng = random.Random(48)
+    for _ in range(500):
+        n = rng.randint(1, 10)
+        clauses = random_cnf(rng, n, rng.randint(0, 4 * n))
+        if rng.random() < 0.05:
+            clauses.append([])
+        assert count_models(n, clauses) == sum(1 for _ in models(n, clauses))
+
+
+def test_bounded_cache_gives_the_same_counts():
+    rng = random.Random(480)
+    for _ in range(100):
+        n = rng.randint(5, 12)
+        clauses = random_cnf(rng, n, rng.randint(n, 3 * n), max_length=2)
+        counter = ModelCounter(max_cache_literals=8)
+        assert counter.count(n, clauses) == count_models(n, clauses)
+        assert counter.cache_literals <= 8
+
+
+def test_deep_branching_raises_the_recursion_limit():
+    # x1 or x2, x2 or x3, ... leaves a shorter path after every branch, the models are counted
+    # like Fibonacci numbers
+    n = 300
+    clauses = [[var, var + 1] for var in range(1, n)]
+    expected, following = 1, 2
+    for _ in range(n):
+        expected, following = following, expected + following
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(200)
+    try:
+        assert count_models(n, clauses) == expected
+    finally:
+        sys.setrecursionlimit(limit)
+
+
+def test_model_count_column(tmp_path, run_harness):
+    rng = random.Random(481)
+    instances = [(n, random_cnf(rng, n, rng.randint(1, 3 * n))) for n in [rng.randint(1, 9) for _ in range(30)]]
+    path = tmp_path / "count.cnf"
+    with open(path, "w") as cnf:
+        for inst_id, (n, clauses) in enumerate(instances):
+            cnf.write(f"c {inst_id} 3 ?\np cnf {n} {len(clauses)}\n")
+            cnf.writelines(",".join(map(str, clause)) + ",0\n" for clause in clauses)
+
+    header, *rows = run_harness(SatSolver, ProjectSelection.sat, str(path), ["model_count"])["model_count"]
+    assert header.index("model_count") == header.index("solution") + 1
+    for (n, clauses), row in zip(instances, rows):
+        result = dict(zip(header, row))
+        count = sum(1 for _ in models(n, clauses))
+        assert int(result["model_count"]) == count
+        assert (result["satisfiable"] == "S") == (count > 0)
+        if count:
+            assert satisfies(clauses, ast.literal_eval(result["solution"]))
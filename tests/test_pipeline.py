@@ -0,0 +1,53 @@
+import asyncio
+import csv
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.helpers.pipeline_helper import QUEUE_SLOTS_PER_WORKER, SolvePipeline, _init_pipeline_worker
+
+from tests.problem_inputs import PROBLEMS, run_problem
+
+
+@pytest.mark.parametrize("problem", sorted(PROBLEMS))
+def test_pipelined_run_writes_the_sequential_results(tmp_path, run_harness, problem):
+    sequential = run_problem(run_harness, tmp_path, problem)
+    pipelined = run_problem(run_harness, tmp_path, problem, {"mode": "pipelined", "workers": 2})
+    assert pipelined == sequential
+
+
+class SlowFirstHarness:
+    """
+    Just enough of a harness for SolvePipeline: instance 0 takes long, every other one is instant.
+    """
+
+    def iter_input_file(self):
+        return iter(range(60))
+
+    def instance_key(self, instance):
+        return None
+
+    def solve_selected(self, method_name, instance):
+        if instance == 0:
+            time.sleep(0.5)
+        return instance, 0.0, []
+
+    def csv_header(self, sub_problem):
+        return ["instance_id"]
+
+    def result_rows(self, instance, result, label, timing, extra):
+        return [[result]]
+
+
+def test_slow_instance_holds_back_the_stream(tmp_path):
+    harness = SlowFirstHarness()
+    workers = 2
+    out_path = tmp_path / "slow.csv"
+    # threads share this process, so the pipeline's worker harness is the one set here
+    with ThreadPoolExecutor(workers, initializer=_init_pipeline_worker, initargs=(harness,)) as executor:
+        pipeline = SolvePipeline(harness, "slow", "solve", "Slow", executor, workers)
+        asyncio.run(pipeline.run(str(out_path)))
+    with open(out_path, newline="") as results:
+        assert list(csv.reader(results)) == [["instance_id"]] + [[str(index)] for index in range(60)]
+    assert 0 < pipeline.most_waiting <= QUEUE_SLOTS_PER_WORKER * workers
@@ -0,0 +1,36 @@
+import os
+import pstats
+
+import pytest
+
+from src.helpers.project_selection_enum import ProjectSelection
+from src.sat import SatSolver
+
+
+@pytest.mark.parametrize("profiler", ["cprofile", "sampling"])
+def test_selected_method_calls_are_dumped_and_summarised(tmp_path, run_harness, profiler):
+    path = tmp_path / "slow.cnf"
+    with open(path, "w") as cnf:
+        for inst_id in range(3):
+            # every sign pattern over three variables: unsatisfiable, brute force tries all 2^14
+            clauses = [[sign_a * 1, sign_b * 2, sign_c * 3] for sign_a in (1, -1) for sign_b in (1, -1)
+                       for sign_c in (1, -1)] + [[v] for v in range(4, 15)]
+            cnf.write(f"c {inst_id} 3 U\np cnf 14 {len(clauses)}\n")
+            cnf.writelines(",".join(map(str, clause)) + ",0\n" for clause in clauses)
+
+    options = {"profiler": profiler, "methods": ["brute_force"], "interval": 0.0005}
+    run_harness(SatSolver, ProjectSelection.sat, str(path), ["brute_force", "btracking"], {"profile": options})
+
+    results = tmp_path / "results"
+    profiles = results / "brute_force_slow_sat_solver_results_profiles"
+    assert sorted(os.listdir(profiles)) == ["0.prof", "1.prof", "2.prof"]
+    for dump in os.listdir(profiles):
+        functions = {name for filename, line, name in pstats.Stats(str(profiles / dump)).stats}
+        assert "sat_bruteforce" in functions
+    summary = (results / "brute_force_slow_sat_solver_results_profile.txt").read_text()
+    assert summary.startswith(f"3 profiled calls, {profiler} profiler")
+    # the Gray-code walk spends the time, it tops the self time ranking
+    assert "gray_code" in summary
+    # btracking was not selected
+    assert not (results / "btracking_slow_sat_solver_results_profiles").exists()
+    assert not (results / "btracking_slow_sat_solver_results_profile.txt").exists()
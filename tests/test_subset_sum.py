@@ -0,0 +1,45 @@
+import itertools
+import random
+
+from src.bin_packing import BinPacking
+from src.helpers.project_selection_enum import ProjectSelection
+
+from src.helpers.subset_sum_helper import exact_fill_combinations
+
+
+def brute_force(bin_capacity, items):
+    # every distinct multiset of positive items adding up to the capacity
+    positive = [item for item in items if item > 0]
+    found = set()
+    for size in range(1, len(positive) + 1):
+        for combination in itertools.combinations(positive, size):
+            if sum(combination) == bin_capacity:
+                found.add(tuple(sorted(combination, reverse=True)))
+    return found
+
+
+def test_exact_fills_match_brute_force():
+    rng = random.Random(33)
+    for _ in range(400):
+        bin_capacity = rng.randint(1, 25)
+        # negative and oversized items are in no fill
+        items = [rng.randint(-3, bin_capacity + 5) for _ in range(rng.randint(0, 12))]
+        combinations = exact_fill_combinations(bin_capacity, items)
+        # largest items first and no multiset twice
+        assert all(combination == sorted(combination, reverse=True) for combination in combinations)
+        assert len(set(map(tuple, combinations))) == len(combinations)
+        assert set(map(tuple, combinations)) == brute_force(bin_capacity, items)
+
+
+def test_repeated_items_are_used_at_most_as_often_as_given():
+    assert exact_fill_combinations(10, [5, 5, 5, 10]) == [[10], [5, 5]]
+    assert exact_fill_combinations(10, [5, 3, 2]) == [[5, 3, 2]]
+
+
+def test_oversized_item_does_not_abort_the_brute_force_run(tmp_path, run_harness):
+    path = tmp_path / "bins.txt"
+    path.write_text("10 12 3 7\n10 2 5 4 7 1 3 8 6\n")
+    header, *rows = run_harness(BinPacking, ProjectSelection.bin_packing, str(path), ["brute_force"])["brute_force"]
+    fills = [(row[0], row[2]) for row in rows]
+    assert [fill for inst_id, fill in fills if inst_id == "0"] == ["[7, 3]"]
+    assert {fill for inst_id, fill in fills if inst_id == "1"} >= {"[8, 2]", "[7, 3]"}
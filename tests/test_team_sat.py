@@ -0,0 +1,31 @@
+import csv
+import random
+
+import matplotlib
+import pytest
+
+from src.team_sat import plot_brute_vs_backtrack
+
+
+def write_results(path, rng, method):
+    with open(path, "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(["instance_id", "n_vars", "n_clauses", "method", "satisfiable", "time_seconds", "solution"])
+        for inst_id in range(60):
+            n_vars = rng.randint(3, 8)
+            w.writerow([inst_id, n_vars, 3 * n_vars, method, rng.choice("SU"), rng.random() * 2 ** n_vars * 1e-6, "{}"])
+
+
+@pytest.mark.parametrize("aggregate", [False, True])
+def test_headless_plot_is_written_without_touching_the_backend(tmp_path, aggregate):
+    rng = random.Random(40)
+    brute_csv, back_csv = tmp_path / "brute.csv", tmp_path / "back.csv"
+    write_results(brute_csv, rng, "BruteForce")
+    write_results(back_csv, rng, "BackTracking")
+    backend = matplotlib.get_backend()
+    plot_path = tmp_path / "plots" / "plot.png"
+    plot_path.parent.mkdir()
+
+    plot_brute_vs_backtrack(str(brute_csv), str(back_csv), str(plot_path), aggregate=aggregate, show=False)
+    assert plot_path.read_bytes().startswith(b"\x89PNG")
+    assert matplotlib.get_backend() == backend
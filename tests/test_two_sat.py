@@ -0,0 +1,17 @@
+import random
+
+from src.helpers.two_sat_helper import is_two_cnf, solve_two_sat
+from tests.sat_reference import check_answer, random_cnf
+
+
+def test_two_sat_matches_brute_force():
+    rng = random.Random(41)
+    for _ in range(600):
+        n = rng.randint(1, 10)
+        clauses = random_cnf(rng, n, rng.randint(0, 3 * n), max_length=2)
+        assert is_two_cnf(clauses)
+        check_answer(n, clauses, solve_two_sat(n, clauses))
+
+
+def test_longer_clauses_are_not_two_cnf():
+    assert not is_two_cnf([[1, 2], [1, -2, 3]])